@@ -0,0 +1,196 @@
+"""Admission control in-process untuk endpoint yang membuat sesi.
+
+Tiga pemeriksaan O(1) di bawah satu lock, dari yang paling murah:
+
+1. batas request yang sedang berjalan (in-flight),
+2. token bucket per kunci klien, disimpan di peta LRU berukuran tetap,
+3. token bucket global.
+
+AdmissionMiddleware menjalankannya sebagai middleware ASGI murni, sebelum
+routing dan parsing body, sehingga request yang ditolak hanya seharga satu
+lookup dict dan respons 429 kecil dengan perkiraan kapan boleh mencoba lagi.
+Klien yang tergeser dari LRU mulai lagi dengan bucket penuh; bucket global
+tetap membatasi klien yang berganti-ganti kunci.
+"""
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from metrics import REGISTRY
+
+REJECTED = REGISTRY.counter(
+    "crossword_admission_rejected_total",
+    "Request yang ditolak admission control, per alasan.",
+    ("reason",),
+)
+# Tidak ada bucket yang bisa dihitung untuk batas in-flight; klien diminta menunggu sebentar
+IN_FLIGHT_RETRY_SECONDS = 1.0
+_REJECTED_BODY = b'{"detail":"Terlalu banyak permintaan, coba lagi nanti"}'
+
+
+def client_key(scope) -> str:
+    """Kunci klien dari alamat koneksi (sudah diganti X-Forwarded-For oleh uvicorn --proxy-headers)."""
+    client = scope.get("client")
+    return client[0] if client else "anonim"
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"Request ditolak ({reason}); coba lagi dalam {retry_after:.2f} detik")
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Nilai header Retry-After: detik bulat, minimal 1."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucket:
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Ambil satu token; kembalikan 0 jika berhasil, atau detik sampai token berikutnya."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    admitted: int
+    rejected: Dict[str, int]
+    in_flight: int
+    clients: int
+
+
+class AdmissionController:
+    """Batas laju per klien dan global plus batas konkurensi.
+
+    ``rate`` dalam request per detik; 0 berarti bucket tersebut tidak dipakai.
+    ``max_in_flight`` 0 berarti tanpa batas konkurensi.
+    """
+
+    def __init__(
+        self,
+        client_rate: float = 2.0,
+        client_burst: float = 20.0,
+        global_rate: float = 500.0,
+        global_burst: float = 1000.0,
+        max_in_flight: int = 64,
+        max_clients: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._client_rate = client_rate
+        self._client_burst = max(1.0, client_burst)
+        self._max_in_flight = max_in_flight
+        self._max_clients = max_clients
+        self._clock = clock
+        self._global = TokenBucket(global_rate, max(1.0, global_burst), clock()) if global_rate > 0 else None
+        self._clients: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = Lock()
+        self._in_flight = 0
+        self._admitted = 0
+        self._rejected = {"in_flight": 0, "client": 0, "global": 0}
+
+    def acquire(self, client_key: str) -> None:
+        """Izinkan satu request atau lempar AdmissionRejected; pasangkan dengan release()."""
+        with self._lock:
+            if self._max_in_flight and self._in_flight >= self._max_in_flight:
+                self._reject("in_flight", IN_FLIGHT_RETRY_SECONDS)
+            now = self._clock()
+            bucket = self._client_bucket(client_key, now)
+            if bucket is not None:
+                wait = bucket.take(now)
+                if wait:
+                    self._reject("client", wait)
+            if self._global is not None:
+                wait = self._global.take(now)
+                if wait:
+                    # Token klien dikembalikan: bukan klien ini yang melampaui batas
+                    if bucket is not None:
+                        bucket.tokens += 1
+                    self._reject("global", wait)
+            self._in_flight += 1
+            self._admitted += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def stats(self) -> AdmissionStats:
+        with self._lock:
+            return AdmissionStats(
+                admitted=self._admitted,
+                rejected=dict(self._rejected),
+                in_flight=self._in_flight,
+                clients=len(self._clients),
+            )
+
+    def _client_bucket(self, client_key: str, now: float) -> Optional[TokenBucket]:
+        if self._client_rate <= 0:
+            return None
+        bucket = self._clients.get(client_key)
+        if bucket is None:
+            bucket = self._clients[client_key] = TokenBucket(self._client_rate, self._client_burst, now)
+            if len(self._clients) > self._max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client_key)
+        return bucket
+
+    def _reject(self, reason: str, retry_after: float) -> None:
+        self._rejected[reason] += 1
+        REJECTED.labels(reason).inc()
+        raise AdmissionRejected(reason, retry_after)
+
+
+class AdmissionMiddleware:
+    """Middleware ASGI: admission control untuk pasangan (method, path) tertentu.
+
+    ``controller`` dipanggil per request agar controller bisa diganti saat
+    runtime (mis. di tes). Slot in-flight dilepas setelah respons selesai.
+    """
+
+    def __init__(self, app, controller: Callable[[], AdmissionController], routes: Iterable[Tuple[str, str]]):
+        self.app = app
+        self._controller = controller
+        self._routes = frozenset(routes)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in self._routes:
+            await self.app(scope, receive, send)
+            return
+        controller = self._controller()
+        try:
+            controller.acquire(client_key(scope))
+        except AdmissionRejected as exc:
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(_REJECTED_BODY)).encode()),
+                    (b"retry-after", exc.retry_after_header.encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": _REJECTED_BODY})
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release()
@@ -1,36 +1,167 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from threading import Lock
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field, ValidationError
 
-from puzzle_service import CrosswordService, GameSession
+try:
+    import brotli
+except ImportError:  # opsional: tanpa paket brotli hanya gzip yang ditawarkan
+    brotli = None
+
+from admission import AdmissionController, AdmissionMiddleware, client_key
+from board import StaleBoardVersion
+from metrics import REGISTRY, MetricsMiddleware
+from puzzle_service import CrosswordService, GameSession, Puzzle
+from rooms import RoomHub, error_message
+from session_store import InMemorySessionStore, SessionGone, SessionStore, SQLiteSessionStore
+
+if TYPE_CHECKING:
+    from puzzle_catalog import PuzzleCatalog
 
 BASE_DIR = Path(__file__).parent
 PUZZLE_FILE = BASE_DIR / "crossword_words_15x15.json"
 
-service = CrosswordService(PUZZLE_FILE)
+# Isi SESSION_DB agar beberapa worker uvicorn berbagi sesi lewat SQLite
+SESSION_DB = os.getenv("SESSION_DB")
+
+
+def _build_session_store() -> SessionStore:
+    if SESSION_DB:
+        return SQLiteSessionStore(Path(SESSION_DB), puzzle_resolver=lambda pid: service.find_puzzle(pid))
+    return InMemorySessionStore()
+
+
+# File katalog biner (lihat puzzle_catalog.py) untuk melayani banyak puzzle
+PUZZLE_CATALOG = os.getenv("PUZZLE_CATALOG")
+
+
+def _open_catalog() -> Optional[PuzzleCatalog]:
+    if not PUZZLE_CATALOG:
+        return None
+    from puzzle_catalog import PuzzleCatalog
+
+    return PuzzleCatalog(Path(PUZZLE_CATALOG))
+
+
+# Puzzle statis baru dibaca di lifespan; import app tetap murah untuk tooling dan tes
+service = CrosswordService(
+    PUZZLE_FILE,
+    store=_build_session_store(),
+    catalog=_open_catalog(),
+    # /start berulang dari klien dan nama yang sama dalam jendela ini memakai sesi yang sudah ada
+    start_reuse_seconds=float(os.getenv("START_REUSE_SECONDS", "10")),
+)
+
+# Batas /start per worker: laju per klien (IP) dan global dalam request/detik, plus request berjalan
+admission = AdmissionController(
+    client_rate=float(os.getenv("START_CLIENT_RATE", "2")),
+    client_burst=float(os.getenv("START_CLIENT_BURST", "20")),
+    global_rate=float(os.getenv("START_GLOBAL_RATE", "500")),
+    global_burst=float(os.getenv("START_GLOBAL_BURST", "1000")),
+    max_in_flight=int(os.getenv("START_MAX_IN_FLIGHT", "64")),
+)
+
+# Room co-op per sesi; berlaku per worker, jadi pemain satu room harus di worker yang sama
+rooms = RoomHub(service, tick=int(os.getenv("ROOM_TICK_MS", "50")) / 1000)
+
+# Jumlah puzzle siap pakai per worker; 0 = semua pemain memakai puzzle statis
+PUZZLE_POOL_SIZE = int(os.getenv("PUZZLE_POOL_SIZE", "0"))
+
+# Jeda antar sapuan sesi kedaluwarsa di session store; 0 = tidak disapu berkala
+SESSION_SWEEP_SECONDS = float(os.getenv("SESSION_SWEEP_SECONDS", "300"))
+
+logger = logging.getLogger(__name__)
+
+
+async def _sweep_sessions_periodically(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await service.asweep_sessions()
+        except Exception:
+            # Database sibuk atau terkunci: coba lagi di sapuan berikutnya
+            logger.exception("Gagal menyapu sesi kedaluwarsa")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Dimuat sebelum request pertama agar latensinya tidak ditanggung pemain pertama
+    service.load()
+    pool = None
+    if PUZZLE_POOL_SIZE > 0:
+        # multiprocessing hanya diimpor jika pool dipakai
+        from puzzle_pool import PuzzlePool
+
+        puzzle = service.puzzle
+        pool = PuzzlePool(
+            fallback=puzzle,
+            vocabulary=[(w.answer, w.clue) for w in puzzle.words],
+            high_watermark=PUZZLE_POOL_SIZE,
+            low_watermark=PUZZLE_POOL_SIZE // 4,
+            width=puzzle.width,
+            height=puzzle.height,
+        )
+        pool.start()
+        service.set_pool(pool)
+    sweeper = None
+    if SESSION_SWEEP_SECONDS > 0:
+        sweeper = asyncio.create_task(_sweep_sessions_periodically(SESSION_SWEEP_SECONDS))
+    try:
+        yield
+    finally:
+        if sweeper is not None:
+            sweeper.cancel()
+            await asyncio.gather(sweeper, return_exceptions=True)
+        if pool is not None:
+            service.set_pool(None)
+            pool.close()
+
 
 app = FastAPI(
     title="Crossword API",
     version="1.0.0",
     description="API sederhana untuk memainkan teka-teki silang teknologi.",
+    lifespan=lifespan,
 )
 
+# Ditambahkan pertama = lapisan terdalam: 429 tetap mendapat header CORS dan tercatat di metrik
+app.add_middleware(AdmissionMiddleware, controller=lambda: admission, routes=[("POST", "/start")])
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+
+REGISTRY.gauge("crossword_sessions", "Jumlah sesi di session store.", lambda: service.session_stats().size)
+REGISTRY.gauge("crossword_admission_in_flight", "Request /start yang sedang berjalan.", lambda: admission.stats().in_flight)
+REGISTRY.gauge("crossword_room_members", "Koneksi WebSocket aktif di room co-op.", lambda: rooms.stats().members)
+REGISTRY.gauge(
+    "crossword_pool_depth",
+    "Puzzle siap pakai di pool worker ini.",
+    lambda: service.pool.stats().depth if service.pool is not None else 0,
+)
 
 
 class WordModel(BaseModel):
-    answer: str
+    answer: Optional[str] = Field(default=None, description="Kosong jika jawaban disembunyikan")
+    length: int
     row: int
     col: int
     direction: str = Field(pattern=r"^(across|down)$", description="Arah penempatan kata")
@@ -44,52 +175,350 @@ class PuzzleModel(BaseModel):
     words: List[WordModel]
 
 
+class CompactPuzzleModel(BaseModel):
+    """Skema kolom: grid satu string (row-major) dan array paralel per kata."""
+
+    width: int
+    height: int
+    grid: str
+    rows: List[int]
+    cols: List[int]
+    directions: str = Field(description="Satu huruf per kata: A (across) atau D (down)")
+    lengths: List[int]
+    clues: List[str]
+    answers: Optional[List[str]] = Field(default=None, description="Kosong jika jawaban disembunyikan")
+
+
+PuzzleFormat = Literal["full", "compact"]
+
+
 class SessionResponse(BaseModel):
     session_id: str
     player_name: str
     started_at: datetime
-    puzzle: PuzzleModel
+    puzzle_id: str
+    puzzle: Optional[PuzzleModel | CompactPuzzleModel] = Field(
+        default=None, description="Tidak disertakan jika embed_puzzle=false; ambil lewat /puzzles/{puzzle_id}"
+    )
+
+
+class SessionMeta(BaseModel):
+    session_id: str
+    player_name: str
+    started_at: datetime
+    puzzle_id: str
 
 
 class StartRequest(BaseModel):
     player_name: str = Field(..., min_length=1, max_length=50)
+    include_answers: bool = True
+    embed_puzzle: bool = True
+    format: PuzzleFormat = "full"
+
+
+class CellEntry(BaseModel):
+    row: int
+    col: int
+    letter: str = Field(..., min_length=1, max_length=1)
+
+
+class WordEntry(BaseModel):
+    index: int = Field(..., ge=0)
+    answer: str = Field(..., max_length=64)
+
+
+class CheckRequest(BaseModel):
+    cells: List[CellEntry] = Field(default_factory=list, max_length=4096)
+    words: List[WordEntry] = Field(default_factory=list, max_length=512)
+
+
+class CellPosition(BaseModel):
+    row: int
+    col: int
+
+
+class WordProgress(BaseModel):
+    index: int
+    correct: int
+    length: int
+    complete: bool
+
+
+class CheckResponse(BaseModel):
+    correct_cells: int
+    incorrect_cells: List[CellPosition]
+    words: List[WordProgress]
+    solved: bool
+
+
+class BoardPatchRequest(BaseModel):
+    base_version: int = Field(..., ge=0)
+    runs: List[Tuple[int, str]] = Field(
+        ..., max_length=1024, description="Pasangan (indeks sel row*width+col, huruf berurutan); '.' mengosongkan sel"
+    )
+
+
+class BoardPatchResponse(BaseModel):
+    version: int
+
+
+class BoardResponse(BaseModel):
+    version: int
+    full: bool
+    runs: List[Tuple[int, str]]
 
 
+class LeaderboardEntryModel(BaseModel):
+    rank: int
+    player_name: str
+    seconds: float
+
+
+class LeaderboardResponse(BaseModel):
+    puzzle_id: str
+    total: int
+    entries: List[LeaderboardEntryModel]
+
+
+class RankResponse(BaseModel):
+    puzzle_id: str
+    rank: int
+    total: int
+    seconds: float
+
+
+class RoomPatch(BaseModel):
+    type: Literal["patch"]
+    runs: List[Tuple[int, str]] = Field(..., max_length=1024)
+
+
+@dataclass(frozen=True)
+class PuzzlePayload:
+    """Hasil serialisasi puzzle yang siap dikirim apa adanya."""
+
+    body: bytes
+    etag: str
+    # Content-Encoding -> body terkompresi, diisi saat pertama kali diminta
+    encoded: Dict[str, bytes] = field(default_factory=dict, compare=False, repr=False)
+
+    def encode(self, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """Body dan ETag untuk Content-Encoding tertentu (None = tanpa kompresi)."""
+        if encoding is None:
+            return self.body, self.etag
+        body = self.encoded.get(encoding)
+        if body is None:
+            body = _compress(self.body, encoding)
+            self.encoded[encoding] = body
+        # Representasi terkompresi butuh ETag sendiri (RFC 9110 8.8.3)
+        return body, f'{self.etag[:-1]}-{encoding}"'
+
+
+# Puzzle bersifat immutable, jadi cukup diserialisasi sekali per objek.
+# Referensi puzzle ikut disimpan agar id() tidak dipakai ulang oleh objek lain.
+_PAYLOAD_CACHE_SIZE = 1024
+_payload_cache: "OrderedDict[Tuple[int, bool, str], Tuple[Puzzle, PuzzlePayload]]" = OrderedDict()
+_payload_lock = Lock()
+
+# Puzzle dengan id tertentu tidak pernah berubah isinya
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Payload yang lebih kecil dari ini tidak sepadan untuk dikompresi
+_MIN_COMPRESS_SIZE = 512
+
+JSON_MEDIA_TYPE = "application/json"
+# Pengganti huruf di grid saat jawaban disembunyikan
+HIDDEN_CELL = "?"
+
+
+# Handler async: CrosswordService menjalankan operasi store in-memory langsung di
+# event loop dan memindahkan store yang memblokir (SQLite) ke thread.
 @app.get("/health")
-def health_check() -> dict:
+async def health_check() -> dict:
     return {"status": "ok"}
 
 
-@app.get("/puzzle", response_model=PuzzleModel)
-def get_puzzle() -> PuzzleModel:
-    return _to_puzzle_model(service.puzzle)
+# Tetap sinkron (threadpool): gauge sesi bisa melakukan query SQLite
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/puzzle", response_model=PuzzleModel | CompactPuzzleModel)
+async def get_puzzle(
+    include_answers: bool = True,
+    format: PuzzleFormat = "full",
+    if_none_match: Optional[str] = Header(default=None),
+    accept_encoding: Optional[str] = Header(default=None),
+) -> Response:
+    payload = _puzzle_payload(service.puzzle, include_answers, format)
+    return _payload_response(payload, if_none_match, accept_encoding)
+
+
+@app.get("/puzzles/{puzzle_id}", response_model=PuzzleModel | CompactPuzzleModel)
+async def get_puzzle_by_id(
+    puzzle_id: str,
+    include_answers: bool = True,
+    format: PuzzleFormat = "full",
+    if_none_match: Optional[str] = Header(default=None),
+    accept_encoding: Optional[str] = Header(default=None),
+) -> Response:
+    puzzle = await service.afind_puzzle(puzzle_id)
+    if puzzle is None:
+        raise HTTPException(status_code=404, detail="Puzzle tidak ditemukan")
+    payload = _puzzle_payload(puzzle, include_answers, format)
+    return _payload_response(payload, if_none_match, accept_encoding, IMMUTABLE_CACHE_CONTROL)
 
 
 @app.post("/start", response_model=SessionResponse)
-def start_game(request: StartRequest) -> SessionResponse:
+async def start_game(request: StartRequest, http_request: Request) -> Response:
     name = request.player_name.strip()
     if not name:
         raise HTTPException(status_code=400, detail="Nama pemain tidak boleh kosong")
-    session = service.start_session(name)
-    return _to_session_model(session)
+    session = await service.astart_session(name, client_key(http_request.scope), request.include_answers)
+    return _to_session_model(session, request.include_answers, request.embed_puzzle, request.format)
 
 
 @app.get("/sessions/{session_id}", response_model=SessionResponse)
-def get_session(session_id: str) -> SessionResponse:
-    session = service.get_session(session_id)
+async def get_session(
+    session_id: str,
+    include_answers: bool = True,
+    embed_puzzle: bool = True,
+    format: PuzzleFormat = "full",
+) -> Response:
+    session = await service.aget_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Sesi tidak ditemukan")
+    # Sesi yang bisa masuk leaderboard tidak pernah menerima jawaban
+    return _to_session_model(session, include_answers and session.answers_revealed, embed_puzzle, format)
+
+
+@app.post("/sessions/{session_id}/check", response_model=CheckResponse)
+async def check_answers(session_id: str, request: CheckRequest) -> CheckResponse:
+    session = await service.aget_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Sesi tidak ditemukan")
+    puzzle = session.puzzle
+    try:
+        result = puzzle.check(
+            cells=((e.row, e.col, e.letter) for e in request.cells),
+            words=((e.index, e.answer) for e in request.words),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    word_cells = puzzle.answer_index.word_cells
+    progress = [
+        WordProgress(index=wi, correct=hits, length=len(word_cells[wi]), complete=hits == len(word_cells[wi]))
+        for wi, hits in sorted(result.word_hits.items())
+    ]
+    solved = sum(1 for p in progress if p.complete) == len(word_cells)
+    if solved:
+        service.complete_session(session)
+    return CheckResponse(
+        correct_cells=result.correct,
+        incorrect_cells=[CellPosition(row=r, col=c) for r, c in result.incorrect],
+        words=progress,
+        solved=solved,
+    )
+
+
+@app.patch("/sessions/{session_id}/board", response_model=BoardPatchResponse)
+async def patch_board(session_id: str, request: BoardPatchRequest) -> BoardPatchResponse:
+    session = await service.aget_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Sesi tidak ditemukan")
-    return _to_session_model(session)
+    try:
+        version = await service.apatch_board(session, request.base_version, request.runs)
+    except StaleBoardVersion as exc:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Versi papan sudah usang", "version": exc.current_version},
+        ) from exc
+    except SessionGone as exc:
+        raise HTTPException(status_code=404, detail="Sesi tidak ditemukan") from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return BoardPatchResponse(version=version)
 
 
-def _to_puzzle_model(puzzle) -> PuzzleModel:
+@app.get("/sessions/{session_id}/board", response_model=BoardResponse)
+async def get_board(session_id: str, since: Optional[int] = None) -> BoardResponse:
+    session = await service.aget_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Sesi tidak ditemukan")
+    delta = await service.aboard_changes(session, since)
+    return BoardResponse(version=delta.version, full=delta.full, runs=delta.runs)
+
+
+@app.get("/leaderboard", response_model=LeaderboardResponse)
+async def get_leaderboard(puzzle_id: Optional[str] = None, limit: int = Query(default=10, ge=1, le=100)) -> LeaderboardResponse:
+    puzzle_id = puzzle_id or service.puzzle.puzzle_id
+    entries = service.leaderboard.top(puzzle_id, limit)
+    return LeaderboardResponse(
+        puzzle_id=puzzle_id,
+        total=service.leaderboard.total(puzzle_id),
+        entries=[LeaderboardEntryModel(rank=e.rank, player_name=e.player_name, seconds=e.seconds) for e in entries],
+    )
+
+
+@app.get("/leaderboard/rank/{session_id}", response_model=RankResponse)
+async def get_rank(session_id: str) -> RankResponse:
+    session = await service.aget_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Sesi tidak ditemukan")
+    puzzle_id = session.puzzle.puzzle_id
+    entry = service.leaderboard.rank(puzzle_id, session_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Sesi belum menyelesaikan puzzle")
+    return RankResponse(
+        puzzle_id=puzzle_id,
+        rank=entry.rank,
+        total=service.leaderboard.total(puzzle_id),
+        seconds=entry.seconds,
+    )
+
+
+@app.websocket("/ws/sessions/{session_id}")
+async def session_room(websocket: WebSocket, session_id: str) -> None:
+    session = await service.aget_session(session_id)
+    if not session:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Sesi tidak ditemukan")
+        return
+    await websocket.accept()
+    room, member = await rooms.join(session)
+    sender = asyncio.create_task(room.pump(
+        member,
+        websocket.send_text,
+        lambda: websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Sesi sudah berakhir"),
+    ))
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                room.submit(RoomPatch.model_validate_json(text).runs)
+            except ValidationError:
+                member.offer(error_message("Pesan tidak valid"))
+            except ValueError as exc:
+                member.offer(error_message(str(exc)))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+        await rooms.leave(room, member)
+
+
+def _to_puzzle_model(puzzle, include_answers: bool = True) -> PuzzleModel:
+    grid = puzzle.grid
+    if not include_answers:
+        grid = ["".join(ch if ch == "." else HIDDEN_CELL for ch in row) for row in grid]
     return PuzzleModel(
         width=puzzle.width,
         height=puzzle.height,
-        grid=puzzle.grid,
+        grid=grid,
         words=[
             WordModel(
-                answer=w.answer,
+                answer=w.answer if include_answers else None,
+                length=len(w.answer),
                 row=w.row,
                 col=w.col,
                 direction=w.direction,
@@ -100,10 +529,123 @@ def _to_puzzle_model(puzzle) -> PuzzleModel:
     )
 
 
-def _to_session_model(session: GameSession) -> SessionResponse:
-    return SessionResponse(
+def _to_compact_model(puzzle: Puzzle, include_answers: bool = True) -> CompactPuzzleModel:
+    grid = puzzle.answer_index.answers
+    if not include_answers:
+        grid = "".join(ch if ch == "." else HIDDEN_CELL for ch in grid)
+    words = puzzle.words
+    return CompactPuzzleModel(
+        width=puzzle.width,
+        height=puzzle.height,
+        grid=grid,
+        rows=[w.row for w in words],
+        cols=[w.col for w in words],
+        directions="".join("D" if w.direction == "down" else "A" for w in words),
+        lengths=[len(w.answer) for w in words],
+        clues=[w.clue for w in words],
+        answers=[w.answer for w in words] if include_answers else None,
+    )
+
+
+def _puzzle_payload(puzzle: Puzzle, include_answers: bool = True, format: PuzzleFormat = "full") -> PuzzlePayload:
+    key = (id(puzzle), include_answers, format)
+    cached = _payload_cache.get(key)
+    if cached is not None and cached[0] is puzzle:
+        return cached[1]
+    with _payload_lock:
+        cached = _payload_cache.get(key)
+        if cached is not None and cached[0] is puzzle:
+            return cached[1]
+        if format == "compact":
+            model = _to_compact_model(puzzle, include_answers)
+        else:
+            model = _to_puzzle_model(puzzle, include_answers)
+        body = model.model_dump_json(exclude_none=True).encode("utf8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        payload = PuzzlePayload(body=body, etag=etag)
+        _payload_cache[key] = (puzzle, payload)
+        if len(_payload_cache) > _PAYLOAD_CACHE_SIZE:
+            _payload_cache.popitem(last=False)
+        return payload
+
+
+def _payload_response(
+    payload: PuzzlePayload,
+    if_none_match: Optional[str],
+    accept_encoding: Optional[str],
+    cache_control: Optional[str] = None,
+) -> Response:
+    encoding = _negotiate_encoding(accept_encoding) if len(payload.body) >= _MIN_COMPRESS_SIZE else None
+    body, etag = payload.encode(encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def _negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pilih br lalu gzip dari header Accept-Encoding; None jika tidak ada yang diterima."""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=11)
+    # mtime=0 agar hasil gzip (dan ETag-nya) sama di setiap worker
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # If-None-Match memakai perbandingan lemah (RFC 9110 13.1.2)
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _to_session_model(
+    session: GameSession,
+    include_answers: bool = True,
+    embed_puzzle: bool = True,
+    format: PuzzleFormat = "full",
+) -> Response:
+    meta = SessionMeta(
         session_id=session.session_id,
         player_name=session.player_name,
         started_at=session.started_at,
-        puzzle=_to_puzzle_model(session.puzzle),
-    )
+        puzzle_id=session.puzzle.puzzle_id,
+    ).model_dump_json().encode("utf8")
+    if not embed_puzzle:
+        return Response(content=meta, media_type=JSON_MEDIA_TYPE)
+    # Sisipkan byte puzzle yang sudah di-cache ke akhir objek JSON sesi
+    body = meta[:-1] + b',"puzzle":' + _puzzle_payload(session.puzzle, include_answers, format).body + b"}"
+    return Response(content=body, media_type=JSON_MEDIA_TYPE)
@@ -0,0 +1,59 @@
+"""Bandingkan ukuran upload dan memori: grid penuh per simpan vs patch run sel.
+
+Mensimulasikan pemain yang mengetik huruf demi huruf sampai papan penuh.
+Versi lama (CrosswordRepository.saveBoardEntries) mengirim seluruh grid 2D
+setiap simpan; versi baru hanya mengirim run sel yang berubah.
+
+    python benchmarks/bench_board_sync.py
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import PUZZLE_FILE  # noqa: E402
+from board import BoardState  # noqa: E402
+from puzzle_service import CrosswordService  # noqa: E402
+
+
+def deep_size(grid) -> int:
+    return sys.getsizeof(grid) + sum(sys.getsizeof(row) + sum(sys.getsizeof(ch) for ch in row) for row in grid)
+
+
+def main() -> None:
+    puzzle = CrosswordService(PUZZLE_FILE).puzzle
+    width = puzzle.width
+    moves = [
+        (r, c, ch)
+        for word in puzzle.words
+        for r, c, ch in (
+            (word.row + (i if word.direction == "down" else 0),
+             word.col + (i if word.direction == "across" else 0),
+             ch)
+            for i, ch in enumerate(word.answer)
+        )
+    ]
+
+    grid = [["" for _ in range(width)] for _ in range(puzzle.height)]
+    board = BoardState(width * puzzle.height)
+    full_bytes = patch_bytes = 0
+    for version, (r, c, ch) in enumerate(moves):
+        grid[r][c] = ch
+        full_bytes += len(json.dumps({"entries": grid}, separators=(",", ":")))
+        runs = [(r * width + c, ch)]
+        board.apply(runs)
+        patch_bytes += len(json.dumps({"base_version": version, "runs": runs}, separators=(",", ":")))
+
+    print(f"{len(moves)} ketikan pada papan {width}x{puzzle.height}")
+    print(f"{'':<24}{'grid penuh':>14}{'patch':>10}{'rasio':>8}")
+    print(f"{'total upload (byte)':<24}{full_bytes:>14}{patch_bytes:>10}{full_bytes / patch_bytes:>7.0f}x")
+    print(f"{'per simpan (byte)':<24}{full_bytes // len(moves):>14}{patch_bytes // len(moves):>10}")
+    grid_mem, board_mem = deep_size(grid), sys.getsizeof(board.cells)
+    print(f"{'memori papan (byte)':<24}{grid_mem:>14}{board_mem:>10}{grid_mem / board_mem:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark skala generasi massal: puzzle/s per jumlah worker dibanding 1 worker.
+
+    python benchmarks/bench_bulk_generate.py --count 400 --workers 1 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bulk_generate import generate, load_vocabulary  # noqa: E402
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=16)
+    args = parser.parse_args()
+
+    vocabulary = load_vocabulary([BACKEND_DIR / "clue_cache.json", BACKEND_DIR / "crossword_words_15x15.json"])
+    print(f"{args.count} puzzle 15x15, {len(vocabulary)} kata, {os.cpu_count()} CPU")
+    print(f"{'worker':>7}{'puzzle/s':>11}{'speedup':>9}{'efisiensi':>11}")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in args.workers:
+            stats = generate(Path(tmp) / f"w{workers}.jsonl", args.count, vocabulary,
+                             workers=workers, chunk_size=args.chunk_size)
+            baseline = baseline or stats.rate
+            speedup = stats.rate / baseline
+            print(f"{workers:>7}{stats.rate:>11.1f}{speedup:>8.2f}x{speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
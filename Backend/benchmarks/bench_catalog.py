@@ -0,0 +1,102 @@
+"""Benchmark startup dan memori: memuat N puzzle dari JSONL vs membuka katalog mmap.
+
+Puzzle dibangkitkan sekali dengan generate_puzzle (tanpa Gemini) lalu ditulis
+sebagai JSONL (format export_json per baris) dan sebagai katalog biner.
+
+    python benchmarks/bench_catalog.py --count 10000
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from puzzle_catalog import PuzzleCatalog, puzzles_from_file, write_catalog  # noqa: E402
+from puzzle_pool import generate_puzzle  # noqa: E402
+from puzzle_service import puzzle_from_export  # noqa: E402
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+
+def to_export(puzzle) -> dict:
+    return {
+        "gridData": puzzle.grid,
+        "words": [
+            {"word": w.answer, "row": w.row, "col": w.col, "dir": w.direction, "clue": w.clue}
+            for w in puzzle.words
+        ],
+    }
+
+
+def measure(fn):
+    """Waktu diukur tanpa tracemalloc; memori diukur pada pemanggilan kedua."""
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    base = next(puzzles_from_file(BASE_DIR / "crossword_words_15x15.json"))
+    vocabulary = [(w.answer, w.clue) for w in base.words]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl = Path(tmp) / "puzzles.jsonl"
+        catalog_path = Path(tmp) / "puzzles.xwc"
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()), jsonl.open("w", encoding="utf8") as fh:
+            for seed in range(args.count):
+                puzzle, _ = generate_puzzle(seed, vocabulary, 15, 15, 12)
+                fh.write(json.dumps(to_export(puzzle), ensure_ascii=False, separators=(",", ":")) + "\n")
+        print(f"{args.count} puzzle dibangkitkan dalam {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        write_catalog(catalog_path, puzzles_from_file(jsonl))
+        convert_s = time.perf_counter() - started
+        print(f"konversi JSONL -> katalog: {convert_s:.2f}s, "
+              f"{jsonl.stat().st_size / 1e6:.1f} MB -> {catalog_path.stat().st_size / 1e6:.1f} MB")
+
+        def eager():
+            with jsonl.open("r", encoding="utf8") as fh:
+                return [puzzle_from_export(json.loads(line)) for line in fh]
+
+        puzzles, eager_s, eager_mem, eager_peak = measure(eager)
+        catalog, open_s, open_mem, open_peak = measure(lambda: PuzzleCatalog(catalog_path))
+
+        rng = random.Random(1)
+        picks = [rng.randrange(args.count) for _ in range(args.lookups)]
+        started = time.perf_counter()
+        for index in picks:
+            catalog.get(index)
+        lookup_s = time.perf_counter() - started
+
+        print(f"\n{'mode':<22}{'startup ms':>12}{'memori MB':>12}{'peak MB':>10}")
+        print(f"{'JSONL eager':<22}{eager_s * 1000:>12.1f}{eager_mem / 1e6:>12.1f}{eager_peak / 1e6:>10.1f}")
+        print(f"{'katalog mmap':<22}{open_s * 1000:>12.3f}{open_mem / 1e6:>12.3f}{open_peak / 1e6:>10.3f}")
+        print(f"\n{args.lookups} akses acak ke katalog: {lookup_s * 1000:.1f} ms "
+              f"({lookup_s / args.lookups * 1e6:.1f} µs/puzzle, cache LRU 256)")
+        assert catalog.get(picks[0]) == puzzles[picks[0]]
+        del puzzles
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark pengecekan jawaban papan penuh: in-process dan lewat HTTP konkuren.
+
+    python benchmarks/bench_check.py --concurrency 1 8 32 --requests 2000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_session_workers import UNLIMITED_START_ENV  # noqa: E402
+
+# Server subprocess mewarisi environment ini
+os.environ.update(UNLIMITED_START_ENV)
+
+from app import PUZZLE_FILE  # noqa: E402
+from puzzle_service import CrosswordService  # noqa: E402
+
+
+def naive_check(puzzle, cells) -> list:
+    """Pembanding: telusuri setiap kata terhadap isian di setiap request."""
+    submitted = {(r, c): letter.upper() for r, c, letter in cells}
+    complete = []
+    for word in puzzle.words:
+        ok = True
+        for i, ch in enumerate(word.answer):
+            r = word.row + (i if word.direction == "down" else 0)
+            c = word.col + (i if word.direction == "across" else 0)
+            ok = ok and submitted.get((r, c)) == ch
+        complete.append(ok)
+    return complete
+
+
+def in_process(puzzle, cells, n: int) -> None:
+    puzzle.check(cells)  # bangun answer_index sekali
+    for name, fn in (("naive", lambda: naive_check(puzzle, cells)), ("answer_index", lambda: puzzle.check(cells))):
+        started = time.perf_counter()
+        for _ in range(n):
+            fn()
+        elapsed = time.perf_counter() - started
+        print(f"{name:<14}{n / elapsed:>12.0f} cek/s{elapsed / n * 1e6:>10.1f} µs/cek")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def http_load(base_url: str, body: dict, concurrency: int, total: int) -> tuple:
+    latencies = []
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as http:
+        session_id = (await http.post("/start", json={"player_name": "bench"})).json()["session_id"]
+        queue = iter(range(total))
+
+        async def worker():
+            for _ in queue:
+                started = time.perf_counter()
+                response = await http.post(f"/sessions/{session_id}/check", json=body)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return total / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    puzzle = CrosswordService(PUZZLE_FILE).puzzle
+    cells = [
+        (r, c, ch)
+        for r, row in enumerate(puzzle.grid)
+        for c, ch in enumerate(row)
+        if ch != "."
+    ]
+    print(f"Papan penuh: {len(cells)} sel\n")
+    in_process(puzzle, cells, args.requests * 5)
+
+    body = {"cells": [{"row": r, "col": c, "letter": ch} for r, c, ch in cells]}
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                httpx.get(f"{base_url}/health", timeout=1.0)
+                break
+            except httpx.HTTPError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        print(f"\n{'konkurensi':>10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for concurrency in args.concurrency:
+            rps, p50, p99 = asyncio.run(http_load(base_url, body, concurrency, args.requests))
+            print(f"{concurrency:>10}{rps:>10.0f}{p50 * 1000:>10.2f}{p99 * 1000:>10.2f}")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark clue: satu panggilan blocking (generate_clues lama) vs CluePipeline.
+
+Provider palsu lokal meniru Gemini: latensi dasar + latensi per kata, dan
+sebagian panggilan gagal dengan 429. Tidak ada akses jaringan.
+
+    python benchmarks/bench_clue_pipeline.py --words 120 --failure-rate 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from clue_pipeline import CluePipeline  # noqa: E402
+
+
+class FakeGemini:
+    def __init__(self, base_latency: float, per_word: float, failure_rate: float, seed: int):
+        self.base_latency = base_latency
+        self.per_word = per_word
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+
+    def _answer(self, words):
+        if self.rng.random() < self.failure_rate:
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+        return {w.upper(): f"Definisi singkat untuk {w}" for w in words}
+
+    def fetch(self, words):
+        time.sleep(self.base_latency + self.per_word * len(words))
+        return self._answer(words)
+
+    async def fetch_async(self, words):
+        await asyncio.sleep(self.base_latency + self.per_word * len(words))
+        return self._answer(words)
+
+
+class AsyncAdapter:
+    def __init__(self, fake: FakeGemini):
+        self.fake = fake
+
+    async def fetch(self, words):
+        return await self.fake.fetch_async(words)
+
+
+def blocking(fake: FakeGemini, words) -> tuple:
+    """Perilaku generate_clues lama: satu panggilan, gagal = semua pending."""
+    started = time.perf_counter()
+    try:
+        clues = fake.fetch(words)
+    except Exception:
+        clues = {}
+    return time.perf_counter() - started, len(clues)
+
+
+def pipelined(fake: FakeGemini, words, args) -> tuple:
+    pipeline = CluePipeline(
+        AsyncAdapter(fake),
+        chunk_size=args.chunk_size,
+        concurrency=args.concurrency,
+        rate_per_second=args.rate,
+        base_delay=args.base_delay,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        clues = asyncio.run(pipeline.run(words))
+    real = sum(1 for v in clues.values() if not v.startswith("Clue pending"))
+    return time.perf_counter() - started, real
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=120)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--base-latency", type=float, default=0.3)
+    parser.add_argument("--per-word", type=float, default=0.02)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--chunk-size", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=12)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--base-delay", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    words = [f"istilah{i}" for i in range(args.words)]
+    print(f"{'mode':<12}{'latensi s':>12}{'clue nyata':>14}")
+    for name, fn in (
+        ("blocking", lambda fake: blocking(fake, words)),
+        ("pipeline", lambda fake: pipelined(fake, words, args)),
+    ):
+        elapsed = resolved = 0.0
+        for run in range(args.runs):
+            fake = FakeGemini(args.base_latency, args.per_word, args.failure_rate, args.seed + run)
+            seconds, real = fn(fake)
+            elapsed += seconds
+            resolved += real
+        print(f"{name:<12}{elapsed / args.runs:>12.2f}{resolved / (args.runs * args.words):>14.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark SmartCrossword.build: pencarian penuh lama vs indeks huruf.
+
+Kedua versi dibangun dengan seed yang sama dan hasil layout-nya dibandingkan.
+
+    python benchmarks/bench_find_positions.py --sizes 15 25 40 --words 60
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from crossword_geminiai import SmartCrossword  # noqa: E402
+
+
+class ScanCrossword(SmartCrossword):
+    """find_best_positions versi lama: cek semua sel dan kedua arah."""
+
+    def find_best_positions(self, word):
+        best_positions = []
+        max_overlap = 0
+        word = word.upper()
+        for r in range(self.h):
+            for c in range(self.w):
+                for d in ["across", "down"]:
+                    if not self.can_place(word, r, c, d):
+                        continue
+                    overlap = sum(
+                        1 for i, ch in enumerate(word)
+                        if (self.grid[r+i][c] if d == "down" else self.grid[r][c+i]) == ch
+                    )
+                    if overlap >= max_overlap:
+                        if overlap > max_overlap:
+                            best_positions.clear()
+                            max_overlap = overlap
+                        best_positions.append((r, c, d, overlap))
+        return best_positions
+
+
+def make_words(count: int, max_len: int, seed: int) -> list:
+    rng = random.Random(seed)
+    # Huruf berbobot agar persilangan cukup sering terjadi
+    alphabet = "EEEEAAAIIONNRRTTSSLCUDPMHGBFYWKVXZJQ"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(3, max_len)))
+        for _ in range(count)
+    ]
+
+
+def timed_build(cls, size: int, words: list, seed: int, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        random.seed(seed)
+        cw = cls(size, size)
+        started = time.perf_counter()
+        cw.build(words)
+        best = min(best, time.perf_counter() - started)
+    return best, cw.words
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 25, 40])
+    parser.add_argument("--words", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'grid':>8}{'scan ms':>12}{'indeks ms':>12}{'speedup':>10}{'sama':>7}")
+    for size in args.sizes:
+        words = make_words(args.words, min(size, 12), args.seed)
+        old, old_words = timed_build(ScanCrossword, size, words, args.seed, args.repeat)
+        new, new_words = timed_build(SmartCrossword, size, words, args.seed, args.repeat)
+        same = "ya" if old_words == new_words else "TIDAK"
+        print(f"{size:>5}x{size:<2}{old * 1000:>12.1f}{new * 1000:>12.1f}{old / new:>9.1f}x{same:>7}")
+
+
+if __name__ == "__main__":
+    main()
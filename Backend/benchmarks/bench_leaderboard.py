@@ -0,0 +1,79 @@
+"""Benchmark leaderboard: sisip, rank, dan top-K dengan satu juta entri.
+
+Dibandingkan dengan pendekatan naif (list biasa + insort, rank dengan
+bisect pada list yang sama) untuk memperlihatkan biaya geser O(n) per sisip.
+
+    python benchmarks/bench_leaderboard.py --entries 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from bisect import bisect_left, insort
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from leaderboard import Leaderboard  # noqa: E402
+
+
+def _per_op_us(started: float, ops: int) -> float:
+    return (time.perf_counter() - started) / ops * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--naive-inserts", type=int, default=20_000,
+                        help="sisip tambahan ke list naif yang sudah berisi --entries kunci")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    times = [rng.uniform(60, 3600) for _ in range(args.entries)]
+    board = Leaderboard()
+
+    started = time.perf_counter()
+    for i, seconds in enumerate(times):
+        board.record("p", f"s{i}", "pemain", seconds)
+    insert_us = _per_op_us(started, args.entries)
+
+    probes = [f"s{rng.randrange(args.entries)}" for _ in range(args.queries)]
+    started = time.perf_counter()
+    for session_id in probes:
+        board.rank("p", session_id)
+    rank_us = _per_op_us(started, args.queries)
+
+    started = time.perf_counter()
+    board.top("p", 10)
+    top_cold_us = _per_op_us(started, 1)
+    started = time.perf_counter()
+    for _ in range(args.queries):
+        board.top("p", 10)
+    top_hot_us = _per_op_us(started, args.queries)
+
+    # Naif: satu list terurut; setiap sisip menggeser rata-rata separuh array
+    naive = sorted((round(s * 1000), i) for i, s in enumerate(times))
+    extra = [(round(rng.uniform(60, 3600) * 1000), args.entries + i) for i in range(args.naive_inserts)]
+    started = time.perf_counter()
+    for key in extra:
+        insort(naive, key)
+    naive_insert_us = _per_op_us(started, len(extra))
+    started = time.perf_counter()
+    for key in extra:
+        bisect_left(naive, (key[0],))
+    naive_rank_us = _per_op_us(started, len(extra))
+
+    print(f"{args.entries} entri")
+    print(f"{'operasi':<24}{'leaderboard (us)':>18}{'list naif (us)':>16}")
+    print(f"{'sisip':<24}{insert_us:>18.2f}{naive_insert_us:>16.2f}")
+    print(f"{'rank sesi':<24}{rank_us:>18.2f}{naive_rank_us:>16.2f}")
+    print(f"{'top-10 (cache dingin)':<24}{top_cold_us:>18.2f}")
+    print(f"{'top-10 (cache panas)':<24}{top_hot_us:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Micro-benchmark: biaya observe() histogram per-thread vs histogram dengan satu lock.
+
+    python benchmarks/bench_metrics.py --threads 1 4 8 --observations 200000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from metrics import DEFAULT_BUCKETS, Registry  # noqa: E402
+
+
+class LockedHistogram:
+    """Pembanding: satu deret bucket bersama yang dijaga satu lock."""
+
+    def __init__(self) -> None:
+        self._bounds = DEFAULT_BUCKETS
+        self._cells = [0.0] * (len(DEFAULT_BUCKETS) + 2)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._cells[bisect_left(self._bounds, value)] += 1
+            self._cells[-1] += value
+
+
+def run(observe, threads: int, observations: int) -> float:
+    per_thread = observations // threads
+    values = [(i % 100) / 1000 for i in range(per_thread)]
+
+    def work() -> None:
+        for value in values:
+            observe(value)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - started) / (per_thread * threads) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--observations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'thread':>7}{'per-thread (ns)':>18}{'lock (ns)':>12}")
+    for threads in args.threads:
+        child = Registry().histogram("bench_seconds", "Benchmark.", ("route",)).labels("/bench")
+        per_thread_ns = run(child.observe, threads, args.observations)
+        locked_ns = run(LockedHistogram().observe, threads, args.observations)
+        print(f"{threads:>7}{per_thread_ns:>18.0f}{locked_ns:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Micro-benchmark: serialisasi puzzle per request vs byte yang sudah di-cache.
+
+Jalankan dari folder Backend:
+
+    python benchmarks/bench_puzzle_payload.py --requests 2000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_session_workers import UNLIMITED_START_ENV  # noqa: E402
+
+os.environ.update(UNLIMITED_START_ENV)
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app as api  # noqa: E402
+
+
+def _legacy_app() -> FastAPI:
+    """Endpoint versi lama: bangun ulang PuzzleModel di setiap request."""
+    legacy = FastAPI()
+
+    @legacy.get("/puzzle", response_model=api.PuzzleModel)
+    def get_puzzle() -> api.PuzzleModel:
+        return api._to_puzzle_model(api.service.puzzle)
+
+    @legacy.post("/start", response_model=api.SessionResponse)
+    def start_game(request: api.StartRequest) -> api.SessionResponse:
+        session = api.service.start_session(request.player_name.strip())
+        return api.SessionResponse(
+            session_id=session.session_id,
+            player_name=session.player_name,
+            started_at=session.started_at,
+            puzzle_id=session.puzzle.puzzle_id,
+            puzzle=api._to_puzzle_model(session.puzzle),
+        )
+
+    return legacy
+
+
+def _rps(client: TestClient, method: str, path: str, n: int, **kwargs) -> float:
+    for _ in range(min(n, 50)):
+        client.request(method, path, **kwargs)
+    started = time.perf_counter()
+    for _ in range(n):
+        client.request(method, path, **kwargs)
+    return n / (time.perf_counter() - started)
+
+
+def _ops(fn, n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    before = TestClient(_legacy_app())
+    after = TestClient(api.app)
+    etag = after.get("/puzzle").headers["etag"]
+    start_body = {"json": {"player_name": "bench"}}
+
+    rows = [
+        ("GET /puzzle", _rps(before, "GET", "/puzzle", args.requests),
+         _rps(after, "GET", "/puzzle", args.requests)),
+        ("GET /puzzle (If-None-Match)", _rps(before, "GET", "/puzzle", args.requests),
+         _rps(after, "GET", "/puzzle", args.requests, headers={"If-None-Match": etag})),
+        ("POST /start", _rps(before, "POST", "/start", args.requests, **start_body),
+         _rps(after, "POST", "/start", args.requests, **start_body)),
+    ]
+
+    session = api.service.start_session("bench")
+    serialize_only = (
+        "serialisasi sesi (tanpa HTTP)",
+        _ops(lambda: JSONResponse(jsonable_encoder(api.SessionResponse(
+            session_id=session.session_id,
+            player_name=session.player_name,
+            started_at=session.started_at,
+            puzzle_id=session.puzzle.puzzle_id,
+            puzzle=api._to_puzzle_model(session.puzzle),
+        ))), args.requests),
+        _ops(lambda: api._to_session_model(session), args.requests),
+    )
+    rows.append(serialize_only)
+
+    print(f"{'endpoint':<30}{'before req/s':>14}{'after req/s':>14}{'speedup':>10}")
+    for name, old, new in rows:
+        print(f"{name:<30}{old:>14.0f}{new:>14.0f}{new / old:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
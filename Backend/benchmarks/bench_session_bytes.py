@@ -0,0 +1,58 @@
+"""Ukur byte di kabel per request sesi: puzzle tertanam vs referensi puzzle_id.
+
+Mode referensi mengambil /puzzles/{id} sekali (lalu di-cache klien/CDN
+karena immutable), sehingga biaya per sesi hanya metadata.
+
+    python benchmarks/bench_session_bytes.py --sessions 1000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import app  # noqa: E402
+
+
+def wire_bytes(response) -> int:
+    return int(response.headers["content-length"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    identity = {"Accept-Encoding": "identity"}
+    session_id = client.post("/start", json={"player_name": "bench"}).json()["session_id"]
+    puzzle_id = client.get(f"/sessions/{session_id}").json()["puzzle_id"]
+
+    def session_bytes(**params) -> int:
+        return wire_bytes(client.get(f"/sessions/{session_id}", params=params, headers=identity))
+
+    def puzzle_bytes(encoding: str, fmt: str) -> int:
+        return wire_bytes(client.get(f"/puzzles/{puzzle_id}", params={"format": fmt},
+                                     headers={"Accept-Encoding": encoding}))
+
+    rows = [
+        ("tertanam, full", session_bytes(), 0),
+        ("tertanam, compact", session_bytes(format="compact"), 0),
+        ("referensi + full", session_bytes(embed_puzzle="false"), puzzle_bytes("identity", "full")),
+        ("referensi + full gzip", session_bytes(embed_puzzle="false"), puzzle_bytes("gzip", "full")),
+        ("referensi + compact gzip", session_bytes(embed_puzzle="false"), puzzle_bytes("gzip", "compact")),
+    ]
+    baseline = rows[0][1] * args.sessions
+    print(f"{args.sessions} request sesi untuk puzzle yang sama")
+    print(f"{'mode':<26}{'per sesi':>10}{'puzzle 1x':>11}{'total':>12}{'vs lama':>9}")
+    for name, per_session, once in rows:
+        total = per_session * args.sessions + once
+        print(f"{name:<26}{per_session:>10}{once:>11}{total:>12}{baseline / total:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
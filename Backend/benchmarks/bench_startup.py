@@ -0,0 +1,168 @@
+"""Ukur cold start aplikasi dan overhead per request di jalur serving.
+
+Cold start: waktu ``import app`` dan ``import crossword_geminiai`` di proses
+baru, lalu waktu dari menjalankan uvicorn sampai /health pertama menjawab.
+Overhead per request: aplikasi ASGI dipanggil langsung tanpa jaringan,
+berurutan dan dengan banyak request bersamaan, sehingga biaya framework
+(termasuk lompatan ke threadpool) terlihat tanpa noise socket.
+
+    python benchmarks/bench_startup.py --repeats 5 --requests 2000 --concurrency 64
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_session_workers import BACKEND_DIR, UNLIMITED_START_ENV, _free_port  # noqa: E402
+
+_IMPORT_SNIPPET = "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+
+
+def import_seconds(module: str, repeats: int, env: dict) -> float:
+    """Median waktu import modul di interpreter baru; NaN jika import gagal."""
+    times = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SNIPPET.format(module=module)],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            return float("nan")
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def first_response_seconds(repeats: int, env: dict) -> float:
+    """Median waktu dari spawn uvicorn sampai /health pertama mengembalikan 200."""
+    times = []
+    for _ in range(repeats):
+        port = _free_port()
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+            cwd=BACKEND_DIR, env=env,
+        )
+        try:
+            while True:
+                try:
+                    if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                        break
+                except httpx.HTTPError:
+                    if time.perf_counter() - started > 30:
+                        raise RuntimeError("Server tidak siap tepat waktu")
+                    time.sleep(0.005)
+            times.append(time.perf_counter() - started)
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+    return statistics.median(times)
+
+
+async def _call(app, method: str, path: str, body: bytes = b"") -> tuple:
+    query = b""
+    if "?" in path:
+        path, raw_query = path.split("?", 1)
+        query = raw_query.encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query, "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+    }
+    received = False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+
+    status = 0
+    chunks = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+async def _per_request(requests: int, concurrency: int) -> list:
+    from app import app
+
+    rows = []
+    async with app.router.lifespan_context(app):
+        status, body = await _call(app, "POST", "/start", json.dumps({"player_name": "bench"}).encode())
+        assert status == 200, status
+        session_id = json.loads(body)["session_id"]
+        start_bodies = [json.dumps({"player_name": f"bench-{i}"}).encode() for i in range(requests)]
+        cases = [
+            ("GET /health", "GET", lambda i: ("/health", b"")),
+            ("POST /start", "POST", lambda i: ("/start", start_bodies[i])),
+            ("GET /sessions/{id}", "GET", lambda i: (f"/sessions/{session_id}?embed_puzzle=false", b"")),
+            ("GET /sessions/{id}/board", "GET", lambda i: (f"/sessions/{session_id}/board?since=0", b"")),
+        ]
+        for name, method, make in cases:
+            for i in range(min(200, requests)):  # pemanasan
+                await _call(app, method, *make(i))
+            started = time.perf_counter()
+            for i in range(requests):
+                await _call(app, method, *make(i))
+            sequential = (time.perf_counter() - started) / requests
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def limited(i: int) -> None:
+                async with semaphore:
+                    await _call(app, method, *make(i))
+
+            started = time.perf_counter()
+            await asyncio.gather(*(limited(i) for i in range(requests)))
+            concurrent = (time.perf_counter() - started) / requests
+            rows.append((name, sequential, concurrent))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    # Tanpa GEMINI_API_KEY: serving tidak pernah memanggil Gemini, jadi tidak boleh membutuhkannya
+    env = {k: v for k, v in os.environ.items() if k != "GEMINI_API_KEY"}
+    env.update(UNLIMITED_START_ENV, SESSION_DB="", PUZZLE_POOL_SIZE="0")
+    print("cold start (median)")
+    print(f"  import app                : {import_seconds('app', args.repeats, env) * 1000:8.1f} ms")
+    print(f"  import crossword_geminiai : {import_seconds('crossword_geminiai', args.repeats, env) * 1000:8.1f} ms"
+          "  (nan = gagal tanpa GEMINI_API_KEY)")
+    print(f"  spawn uvicorn -> /health  : {first_response_seconds(args.repeats, env) * 1000:8.1f} ms")
+
+    os.environ.update(UNLIMITED_START_ENV)
+    rows = asyncio.run(_per_request(args.requests, args.concurrency))
+    print(f"\noverhead per request, ASGI langsung ({args.concurrency} bersamaan untuk kolom kanan)")
+    print(f"{'endpoint':<26}{'berurutan us':>14}{'bersamaan us':>14}")
+    for name, sequential, concurrent in rows:
+        print(f"{name:<26}{sequential * 1e6:>14.1f}{concurrent * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Suite benchmark end-to-end: generator, pemuatan puzzle, dan endpoint API.
+
+Berjalan offline tanpa kunci Gemini. Hasil ditulis sebagai JSON berisi metrik
+datar (``nama -> {value, unit, better}``) sehingga bisa dibandingkan dengan
+baseline yang disimpan; exit code 1 jika ada metrik yang memburuk melebihi
+ambang.
+
+    python benchmarks/bench_suite.py --output hasil.json
+    python benchmarks/bench_suite.py --quick --baseline baseline.json --threshold 0.25
+    python benchmarks/bench_suite.py --only generator loader
+
+Angka hanya sebanding pada mesin yang sama; simpan baseline per mesin/runner CI.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_session_workers import BACKEND_DIR, UNLIMITED_START_ENV, _free_port, _wait_ready  # noqa: E402
+
+AREAS = ("generator", "loader", "endpoints")
+Metrics = Dict[str, dict]
+
+
+def _metric(metrics: Metrics, name: str, value: float, unit: str, better: str) -> None:
+    metrics[name] = {"value": round(value, 4), "unit": unit, "better": better}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _best_seconds(fn: Callable[[], None], repeats: int) -> float:
+    """Waktu tercepat dari beberapa ulangan; lebih stabil daripada rata-rata di mesin bersama."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_generator(metrics: Metrics, quick: bool) -> None:
+    from crossword_geminiai import SmartCrossword
+    from puzzle_service import CrosswordService
+
+    vocabulary = [w.answer for w in CrosswordService(BACKEND_DIR / "crossword_words_15x15.json").puzzle.words]
+    sizes: List[Tuple[int, int]] = [(11, 10), (15, 20), (21, 40)]
+    runs, repeats = (5, 3) if quick else (10, 5)
+    for size, word_count in sizes:
+        words = (vocabulary * (word_count // len(vocabulary) + 1))[:word_count]
+        placed: List[int] = []
+
+        def build_all() -> None:
+            placed.clear()
+            for seed in range(runs):
+                random.seed(seed)
+                cw = SmartCrossword(size, size)
+                # build() mencetak kata yang gagal ditempatkan; tidak relevan untuk benchmark
+                with contextlib.redirect_stdout(io.StringIO()):
+                    cw.build(list(words))
+                placed.append(len(cw.words))
+
+        elapsed = _best_seconds(build_all, repeats)
+        prefix = f"generator.{size}x{size}.{word_count}w"
+        _metric(metrics, f"{prefix}.builds_per_sec", runs / elapsed, "build/s", "higher")
+        _metric(metrics, f"{prefix}.placed_ratio", sum(placed) / (runs * word_count), "ratio", "higher")
+
+
+def bench_loader(metrics: Metrics, quick: bool) -> None:
+    from puzzle_service import CrosswordService
+
+    path = BACKEND_DIR / "crossword_words_15x15.json"
+    service = CrosswordService(path)
+    runs = 50 if quick else 500
+
+    def load_all() -> None:
+        for _ in range(runs):
+            service._load_puzzle(path)
+
+    _metric(metrics, "loader.load_puzzle_ms", _best_seconds(load_all, 5) / runs * 1000, "ms", "lower")
+
+    tracemalloc.start()
+    puzzle = service._load_puzzle(path)
+    puzzle.answer_index
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _metric(metrics, "loader.peak_memory_kib", peak / 1024, "KiB", "lower")
+
+
+async def _drive(base_url: str, paths: List[str], method: str, concurrency: int, total: int) -> Tuple[List[float], float]:
+    latencies: List[float] = []
+    body = {"player_name": "bench"}
+
+    async def worker(http: httpx.AsyncClient, count: int, offset: int) -> None:
+        for i in range(count):
+            path = paths[(offset + i) % len(paths)]
+            started = time.perf_counter()
+            if method == "POST":
+                response = await http.post(path, json=body)
+            else:
+                response = await http.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as http:
+        per_worker = max(1, total // concurrency)
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(http, per_worker, n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+
+def bench_endpoints(metrics: Metrics, quick: bool) -> None:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=dict(os.environ, SESSION_DB="", PUZZLE_POOL_SIZE="0", **UNLIMITED_START_ENV),
+    )
+    try:
+        _wait_ready(base_url)
+        with httpx.Client(base_url=base_url) as http:
+            session_paths = [
+                f"/sessions/{http.post('/start', json={'player_name': 'bench'}).json()['session_id']}"
+                for _ in range(32)
+            ]
+        total = 300 if quick else 2000
+        cases = [("puzzle", "GET", ["/puzzle"]), ("start", "POST", ["/start"]), ("session", "GET", session_paths)]
+        for concurrency in (1, 8, 32):
+            for name, method, paths in cases:
+                # Pemanasan singkat agar koneksi dan cache payload sudah siap
+                asyncio.run(_drive(base_url, paths, method, concurrency, concurrency * 2))
+                latencies, elapsed = asyncio.run(_drive(base_url, paths, method, concurrency, total))
+                prefix = f"endpoints.{name}.c{concurrency}"
+                _metric(metrics, f"{prefix}.rps", len(latencies) / elapsed, "req/s", "higher")
+                for pct in (50, 95, 99):
+                    _metric(metrics, f"{prefix}.p{pct}_ms", _percentile(latencies, pct), "ms", "lower")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def compare(current: Metrics, baseline: Metrics, threshold: float) -> List[str]:
+    """Daftar metrik yang memburuk lebih dari ``threshold`` (0.2 = 20%) dibanding baseline."""
+    regressions = []
+    for name, metric in sorted(current.items()):
+        base = baseline.get(name)
+        if base is None or not base["value"]:
+            continue
+        change = (metric["value"] - base["value"]) / base["value"]
+        worse = -change if metric["better"] == "higher" else change
+        if worse > threshold:
+            regressions.append(f"{name}: {base['value']} -> {metric['value']} {metric['unit']} ({worse:+.0%} lebih buruk)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=AREAS, default=list(AREAS))
+    parser.add_argument("--quick", action="store_true", help="jumlah iterasi kecil untuk CI")
+    parser.add_argument("--output", type=Path, help="tulis hasil JSON ke file ini")
+    parser.add_argument("--baseline", type=Path, help="bandingkan dengan hasil JSON sebelumnya")
+    parser.add_argument("--threshold", type=float, default=0.2, help="toleransi regresi relatif")
+    args = parser.parse_args()
+
+    metrics: Metrics = {}
+    runners = {"generator": bench_generator, "loader": bench_loader, "endpoints": bench_endpoints}
+    for area in args.only:
+        started = time.perf_counter()
+        runners[area](metrics, args.quick)
+        print(f"[{area}] selesai dalam {time.perf_counter() - started:.1f} s", file=sys.stderr)
+
+    result = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "quick": args.quick,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "metrics": metrics,
+    }
+    for name, metric in metrics.items():
+        print(f"{name:<42}{metric['value']:>14} {metric['unit']}")
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf8"))["metrics"]
+        regressions = compare(metrics, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegresi melebihi {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nTidak ada regresi melebihi {args.threshold:.0%} dibanding {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark bank kata: ingest, simpan/muat, dan kueri pola vs pindai regex.
+
+Kosakata sintetis ditulis ke file teks sementara lalu di-ingest secara stream.
+
+    python benchmarks/bench_word_bank.py --words 150000 --queries 2000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from crossword_geminiai import BacktrackingCrossword  # noqa: E402
+from word_bank import WordBank  # noqa: E402
+
+# Huruf dengan bobot kasar frekuensi agar pola punya jumlah hasil realistis
+LETTERS = "EEEEAAAIIIOOUNNRRTTSSLLCDGHKMPBFWYVJXQZ"
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=150_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "kata.txt"
+        with source.open("w", encoding="utf8") as out:
+            for _ in range(args.words):
+                out.write("".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 12))) + "\n")
+
+        bank = WordBank()
+        added, ingest_s = _timed(lambda: bank.ingest_file(source))
+        # Indeks tiap kelompok panjang dibangun malas pada kueri pertama
+        _, index_s = _timed(lambda: [bank.count("?" * n) for n in bank.lengths()])
+        saved = Path(tmp) / "bank.xwb"
+        _, save_s = _timed(lambda: bank.save(saved))
+        loaded, load_s = _timed(lambda: WordBank.load(saved))
+        size_mb = saved.stat().st_size / 1e6
+
+    words_by_length = {n: [w for w in (loaded.query("?" * n))] for n in loaded.lengths()}
+    patterns = []
+    for _ in range(args.queries):
+        word = rng.choice(words_by_length[rng.choice([4, 5, 6, 7, 8])])
+        known = rng.sample(range(len(word)), k=max(1, len(word) // 3))
+        patterns.append("".join(ch if i in known else "?" for i, ch in enumerate(word)))
+
+    results, bank_s = _timed(lambda: [loaded.query(p) for p in patterns])
+    _, count_s = _timed(lambda: [loaded.count(p) for p in patterns])
+    avg_hits = sum(map(len, results)) / len(results)
+    regexes = [(len(p), re.compile(p.replace("?", "."))) for p in patterns]
+    scan_sample = regexes[: max(1, len(regexes) // 20)]
+    _, scan_s = _timed(lambda: [[w for w in words_by_length[n] if rx.fullmatch(w)] for n, rx in scan_sample])
+    scan_us = scan_s / len(scan_sample) * 1e6
+
+    cw = BacktrackingCrossword(15, 15, seed=args.seed)
+    filled, fill_s = _timed(lambda: cw.fill_from_bank(loaded, max_words=30))
+
+    print(f"{added} kata unik dari {args.words} baris ({size_mb:.1f} MB di disk)")
+    print(f"ingest stream + normalisasi : {ingest_s:8.2f} s")
+    print(f"bangun indeks bitset        : {index_s:8.2f} s")
+    print(f"simpan / muat ulang         : {save_s:8.2f} s / {load_s:.2f} s")
+    print(f"kueri pola (bitset)         : {bank_s / len(patterns) * 1e6:8.1f} us  (rata-rata {avg_hits:.0f} hasil)")
+    print(f"hitung pola (bitset)        : {count_s / len(patterns) * 1e6:8.1f} us")
+    print(f"kueri pola (pindai regex)   : {scan_us:8.1f} us")
+    print(f"isi grid 15x15 dari bank    : {len(filled)} kata dalam {fill_s * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
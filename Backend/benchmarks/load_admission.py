@@ -0,0 +1,170 @@
+"""Load test: latensi /start klien yang wajar saat satu klien membanjiri server.
+
+Server uvicorn dijalankan dengan ``--proxy-headers`` agar setiap klien
+simulasi punya alamat sendiri lewat ``X-Forwarded-For``. Klien wajar mengirim
+/start dengan laju tetap; flood berjalan di proses terpisah (agar tidak
+mengganggu pengukuran) dengan laju tetap dari satu alamat.
+Skenario: tanpa flood, flood tanpa admission control, flood dengan admission
+control default.
+
+    python benchmarks/load_admission.py --clients 20 --rate 1 --flood-rate 1000 --duration 10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_session_workers import BACKEND_DIR, UNLIMITED_START_ENV, _free_port, _wait_ready  # noqa: E402
+
+FLOOD_ADDRESS = "10.99.0.1"
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _good_client(http: httpx.AsyncClient, index: int, rate: float, deadline: float,
+                       latencies: List[float], statuses: Dict[int, int]) -> None:
+    headers = {"X-Forwarded-For": f"10.0.{index // 250}.{index % 250 + 1}"}
+    next_at = time.perf_counter() + (index % 10) / (10 * rate)
+    request = 0
+    while next_at < deadline:
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        started = time.perf_counter()
+        response = await http.post("/start", json={"player_name": f"pemain-{index}-{request}"}, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        request += 1
+        next_at += 1 / rate
+
+
+async def _good_clients(base_url: str, clients: int, rate: float, duration: float) -> tuple:
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits) as http:
+        await asyncio.gather(*(
+            _good_client(http, i, rate, deadline, latencies, statuses) for i in range(clients)
+        ))
+    return latencies, statuses
+
+
+async def _flood_loop(port: int, connections: int, rate: float, duration: float) -> Dict[int, int]:
+    """Flood berlaju tetap lewat koneksi keep-alive mentah.
+
+    HTTP ditulis langsung ke socket karena jauh lebih murah di sisi klien
+    daripada httpx, sehingga satu proses cukup untuk membebani server.
+    Jika server lambat, setiap koneksi tertinggal dari jadwal dan request
+    menumpuk hingga sebanyak ``connections``.
+    """
+    statuses: Dict[int, int] = {}
+    started = time.perf_counter()
+    deadline = started + duration
+    interval = connections / rate
+
+    async def worker(index: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        request = 0
+        next_at = started + index * interval / connections
+        try:
+            while next_at < deadline:
+                await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+                next_at += interval
+                body = json.dumps({"player_name": f"banjir-{index}-{request}"}).encode()
+                writer.write(
+                    b"POST /start HTTP/1.1\r\nHost: flood\r\nContent-Type: application/json\r\n"
+                    + f"X-Forwarded-For: {FLOOD_ADDRESS}\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                head = await reader.readuntil(b"\r\n\r\n")
+                status_code = int(head[9:12])
+                length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+                await reader.readexactly(length)
+                statuses[status_code] = statuses.get(status_code, 0) + 1
+                request += 1
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(worker(i) for i in range(connections)))
+    return statuses
+
+
+def _flood(port: int, connections: int, rate: float, duration: float, results) -> None:
+    results.put(asyncio.run(_flood_loop(port, connections, rate, duration)))
+
+
+def run(env: Dict[str, str], clients: int, rate: float, flood_rate: float, connections: int,
+        duration: float) -> tuple:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning",
+         "--proxy-headers", "--forwarded-allow-ips", "*"],
+        cwd=BACKEND_DIR,
+        env=dict(os.environ, SESSION_DB="", PUZZLE_POOL_SIZE="0", **env),
+    )
+    flood_statuses: Optional[Dict[int, int]] = None
+    try:
+        _wait_ready(base_url)
+        flooder = None
+        if flood_rate:
+            results = multiprocessing.Queue()
+            flooder = multiprocessing.Process(
+                target=_flood, args=(port, connections, flood_rate, duration + 1, results)
+            )
+            flooder.start()
+            time.sleep(1)  # biarkan flood mencapai kondisi tunak dulu
+        latencies, statuses = asyncio.run(_good_clients(base_url, clients, rate, duration))
+        if flooder is not None:
+            flood_statuses = results.get()
+            flooder.join()
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    return latencies, statuses, flood_statuses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20, help="jumlah klien wajar")
+    parser.add_argument("--rate", type=float, default=1.0, help="/start per detik per klien wajar")
+    parser.add_argument("--flood-rate", type=float, default=1000, help="request/detik dari klien flood")
+    parser.add_argument("--connections", type=int, default=128, help="koneksi klien flood")
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    scenarios = [
+        ("tanpa flood", {}, 0),
+        ("flood, tanpa admission", UNLIMITED_START_ENV, args.flood_rate),
+        ("flood, admission default", {}, args.flood_rate),
+    ]
+    print(f"{args.clients} klien wajar x {args.rate:g} /start/s, flood {args.flood_rate:g} /start/s "
+          f"lewat {args.connections} koneksi, {args.duration:g} s")
+    print(f"{'skenario':<26}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'429 wajar':>11}{'flood 200':>11}{'flood 429':>11}")
+    for name, env, flood_rate in scenarios:
+        latencies, statuses, flood_statuses = run(env, args.clients, args.rate, flood_rate, args.connections,
+                                                  args.duration)
+        flood_statuses = flood_statuses or {}
+        print(
+            f"{name:<26}{_percentile(latencies, 0.5) * 1000:>9.1f}{_percentile(latencies, 0.95) * 1000:>9.1f}"
+            f"{_percentile(latencies, 0.99) * 1000:>9.1f}{statuses.get(429, 0):>11}"
+            f"{flood_statuses.get(200, 0):>11}{flood_statuses.get(429, 0):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
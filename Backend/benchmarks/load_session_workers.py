@@ -0,0 +1,101 @@
+"""Load test: throughput /start + /sessions/{id} dengan SQLite untuk 1..N worker uvicorn.
+
+Setiap iterasi klien membuat sesi lalu membacanya kembali. Dengan beberapa
+worker, GET hampir selalu mendarat di proses lain, jadi jumlah 404 harus nol.
+
+    python benchmarks/load_session_workers.py --workers 1 2 4 --clients 8 --duration 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+# Benchmark membuat sesi secepat mungkin dari satu alamat: matikan admission control /start
+# dan pemakaian ulang sesi per nama pemain agar setiap /start benar-benar membuat sesi
+UNLIMITED_START_ENV = {
+    "START_CLIENT_RATE": "0",
+    "START_GLOBAL_RATE": "0",
+    "START_MAX_IN_FLIGHT": "0",
+    "START_REUSE_SECONDS": "0",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(base_url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("Server tidak siap tepat waktu")
+
+
+def _client(base_url: str, duration: float) -> tuple:
+    requests = not_found = 0
+    deadline = time.monotonic() + duration
+    with httpx.Client(base_url=base_url, timeout=10.0) as http:
+        while time.monotonic() < deadline:
+            session_id = http.post("/start", json={"player_name": "load"}).json()["session_id"]
+            if http.get(f"/sessions/{session_id}").status_code == 404:
+                not_found += 1
+            requests += 2
+    return requests, not_found
+
+
+def run(workers: int, clients: int, duration: float) -> tuple:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, SESSION_DB=str(Path(tmp) / "sessions.db"), **UNLIMITED_START_ENV)
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port),
+             "--workers", str(workers), "--log-level", "warning"],
+            cwd=BACKEND_DIR,
+            env=env,
+        )
+        try:
+            _wait_ready(base_url)
+            started = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=clients) as pool:
+                results = list(pool.map(_client, [base_url] * clients, [duration] * clients))
+            elapsed = time.perf_counter() - started
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+    total = sum(r for r, _ in results)
+    return total / elapsed, sum(n for _, n in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'req/s':>12}{'404':>8}")
+    for workers in args.workers:
+        rps, not_found = run(workers, args.clients, args.duration)
+        print(f"{workers:>8}{rps:>12.0f}{not_found:>8}")
+
+
+if __name__ == "__main__":
+    main()
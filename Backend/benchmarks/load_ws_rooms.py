@@ -0,0 +1,126 @@
+"""Load test: latensi fan-out room co-op WebSocket dengan ratusan klien.
+
+Server uvicorn dijalankan sebagai subprocess. Per room, satu klien penulis
+mengirim patch satu sel secara berkala; semua klien (termasuk penulis)
+mencatat kapan update dengan versi itu tiba. Latensi = waktu terima - waktu
+kirim, jadi sudah termasuk jeda tick coalescing di server.
+
+    python benchmarks/load_ws_rooms.py --clients 300 --rooms 3 --patches 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+import websockets
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_session_workers import BACKEND_DIR, UNLIMITED_START_ENV, _free_port, _wait_ready  # noqa: E402
+
+
+def _letter_cells(puzzle: dict) -> List[int]:
+    cells = set()
+    for word in puzzle["words"]:
+        for i in range(word["length"]):
+            row = word["row"] + (i if word["direction"] == "down" else 0)
+            col = word["col"] + (i if word["direction"] == "across" else 0)
+            cells.add(row * puzzle["width"] + col)
+    return sorted(cells)
+
+
+async def _listen(url: str, expected: int, received: List[tuple], ready: asyncio.Event, joined: List[int]) -> None:
+    async with websockets.connect(url, max_queue=None) as ws:
+        await ws.recv()  # snapshot awal
+        joined[0] += 1
+        if joined[0] == joined[1]:
+            ready.set()
+        seen = 0
+        while seen < expected:
+            message = json.loads(await ws.recv())
+            if message["type"] == "update":
+                received.append((message["version"], time.perf_counter()))
+                seen += 1
+
+
+async def _run_room(base_url: str, clients: int, patches: int, interval: float) -> List[float]:
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        data = (await http.post("/start", json={"player_name": "room", "include_answers": False})).json()
+    url = base_url.replace("http", "ws", 1) + f"/ws/sessions/{data['session_id']}"
+    cells = _letter_cells(data["puzzle"])
+
+    received: List[tuple] = []
+    ready = asyncio.Event()
+    joined = [0, clients]
+    listeners = [asyncio.create_task(_listen(url, patches, received, ready, joined)) for _ in range(clients)]
+    await asyncio.wait_for(ready.wait(), timeout=60)
+
+    sent: Dict[int, float] = {}
+    async with websockets.connect(url) as writer:
+        await writer.recv()
+        for i in range(patches):
+            # Huruf berganti tiap putaran agar setiap patch benar-benar mengubah sel
+            letter = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[(i // len(cells)) % 26]
+            sent[i + 1] = time.perf_counter()
+            await writer.send(json.dumps({"type": "patch", "runs": [[cells[i % len(cells)], letter]]}))
+            await asyncio.sleep(interval)
+    await asyncio.wait_for(asyncio.gather(*listeners), timeout=60)
+    return [(received_at - sent[version]) * 1000 for version, received_at in received]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def _run(base_url: str, clients: int, rooms: int, patches: int, interval: float) -> List[float]:
+    per_room = max(1, clients // rooms)
+    results = await asyncio.gather(*(_run_room(base_url, per_room, patches, interval) for _ in range(rooms)))
+    return [latency for room in results for latency in room]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=300, help="total klien pendengar")
+    parser.add_argument("--rooms", type=int, default=3)
+    parser.add_argument("--patches", type=int, default=50, help="patch per room")
+    parser.add_argument("--interval", type=float, default=0.1, help="jeda antar patch (detik)")
+    parser.add_argument("--tick-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = dict(os.environ, ROOM_TICK_MS=str(args.tick_ms), **UNLIMITED_START_ENV)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    try:
+        _wait_ready(base_url)
+        started = time.perf_counter()
+        latencies = asyncio.run(_run(base_url, args.clients, args.rooms, args.patches, args.interval))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    expected = (args.clients // args.rooms) * args.rooms * args.patches
+    print(f"{args.rooms} room x {args.clients // args.rooms} klien, {args.patches} patch/room, tick {args.tick_ms} ms")
+    print(f"pesan update diterima : {len(latencies)}/{expected} dalam {elapsed:.1f} s")
+    print(f"latensi fan-out (ms)  : p50 {statistics.median(latencies):.1f}  "
+          f"p95 {_percentile(latencies, 95):.1f}  p99 {_percentile(latencies, 99):.1f}  "
+          f"maks {max(latencies):.1f}")
+
+
+if __name__ == "__main__":
+    main()
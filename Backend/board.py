@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import deque
+from threading import Lock
+from typing import Deque, Iterable, List, Optional, Tuple
+
+# Run patch: (indeks sel datar awal, huruf-huruf berurutan). "." berarti sel dikosongkan.
+Run = Tuple[int, str]
+
+EMPTY = "."
+
+
+class StaleBoardVersion(Exception):
+    """Patch dibuat dari versi papan yang sudah usang."""
+
+    def __init__(self, current_version: int):
+        super().__init__(f"Versi papan sudah {current_version}")
+        self.current_version = current_version
+
+
+class BoardState:
+    """Isian papan pemain sebagai bytearray datar (0 = kosong) dengan nomor versi.
+
+    Setiap patch menaikkan versi satu kali dan dicatat di log terbatas sehingga
+    ``changes_since`` bisa mengembalikan sel yang berubah saja. Jika versi
+    klien sudah lewat dari log, pemanggil harus mengirim snapshot penuh.
+    """
+
+    MAX_LOG = 256
+
+    def __init__(self, size: int, cells: Optional[bytes] = None, version: int = 0):
+        self.cells = bytearray(cells) if cells is not None else bytearray(size)
+        if len(self.cells) != size:
+            raise ValueError("Ukuran papan tidak sesuai dengan puzzle")
+        self.version = version
+        self.lock = Lock()
+        self._log: Deque[Tuple[int, Tuple[int, ...]]] = deque(maxlen=self.MAX_LOG)
+
+    def apply(self, runs: Iterable[Run]) -> int:
+        """Terapkan run (sudah divalidasi) dan kembalikan versi baru."""
+        changed = []
+        cells = self.cells
+        for start, letters in runs:
+            for offset, letter in enumerate(letters):
+                idx = start + offset
+                value = 0 if letter == EMPTY else ord(letter)
+                if cells[idx] != value:
+                    cells[idx] = value
+                    changed.append(idx)
+        self.version += 1
+        self._log.append((self.version, tuple(changed)))
+        return self.version
+
+    def replace(self, cells: bytes, version: int) -> None:
+        """Ganti isi papan (mis. dari penyimpanan bersama); log delta dikosongkan."""
+        self.cells[:] = cells
+        self.version = version
+        self._log.clear()
+
+    def changes_since(self, version: int) -> Optional[List[Run]]:
+        """Run untuk sel yang berubah setelah ``version``, None jika log tidak cukup."""
+        if version == self.version:
+            return []
+        if version > self.version or version < 0:
+            return None
+        if not self._log or self._log[0][0] > version + 1:
+            return None
+        changed = set()
+        for logged_version, indices in self._log:
+            if logged_version > version:
+                changed.update(indices)
+        return encode_runs(self.cells, sorted(changed))
+
+    def snapshot(self) -> List[Run]:
+        return encode_runs(self.cells, [idx for idx, value in enumerate(self.cells) if value])
+
+
+def encode_runs(cells: bytearray, indices: List[int]) -> List[Run]:
+    """Kelompokkan indeks terurut yang bersebelahan menjadi run huruf."""
+    runs: List[Run] = []
+    start = prev = None
+    letters: List[str] = []
+    for idx in indices:
+        if prev is not None and idx == prev + 1:
+            letters.append(chr(cells[idx]) if cells[idx] else EMPTY)
+        else:
+            if start is not None:
+                runs.append((start, "".join(letters)))
+            start = idx
+            letters = [chr(cells[idx]) if cells[idx] else EMPTY]
+        prev = idx
+    if start is not None:
+        runs.append((start, "".join(letters)))
+    return runs
@@ -0,0 +1,314 @@
+"""Generasi puzzle massal paralel dengan ekspor JSONL ringkas yang bisa dilanjutkan.
+
+Setiap puzzle ke-``i`` dibangun dari seed turunan ``(seed, i)`` sehingga hasilnya
+sama berapa pun jumlah worker-nya. Pekerjaan dibagi per potongan indeks ke
+ProcessPoolExecutor; hasil ditulis berurutan, satu ekspor per baris, dan
+di-flush per potongan. Jika proses terhenti, jalankan ulang perintah yang sama:
+baris terakhir yang terpotong dibuang dan generasi dilanjutkan dari indeks
+setelah record utuh terakhir.
+
+Kosakata diambil dari file clue ``{KATA: clue}`` (mis. clue_cache.json) atau
+ekspor puzzle JSON/JSONL/CSV. Clue tidak diminta ke Gemini di sini.
+
+    python bulk_generate.py puzzles.jsonl --count 50000 --vocabulary clue_cache.json --catalog rilis.xwc
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from puzzle_catalog import puzzles_from_file, write_catalog
+from puzzle_pool import generate_puzzle
+from puzzle_service import Puzzle
+
+# Kosakata worker; diisi sekali oleh initializer agar tidak di-pickle per pekerjaan
+_VOCABULARY: Sequence[Tuple[str, str]] = ()
+
+
+@dataclass
+class BulkStats:
+    written: int = 0
+    rejected: int = 0
+    duplicates: int = 0
+    resumed_from: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        done = self.written + self.rejected + self.duplicates
+        return done / self.seconds if self.seconds else 0.0
+
+
+def puzzle_seed(seed: int, index: int) -> int:
+    """Seed 32-bit per puzzle; run dengan seed dasar berbeda tidak saling tumpang tindih."""
+    digest = hashlib.blake2b(f"{seed}:{index}".encode("ascii"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
+
+
+def find_conflicts(puzzle: Puzzle) -> List[str]:
+    """Daftar masalah pada puzzle; kosong berarti grid dan kata konsisten."""
+    problems: List[str] = []
+    if len(puzzle.grid) != puzzle.height or any(len(row) != puzzle.width for row in puzzle.grid):
+        return [f"ukuran grid tidak sama dengan {puzzle.width}x{puzzle.height}"]
+    covered: Set[Tuple[int, int]] = set()
+    starts: Set[Tuple[int, int, str]] = set()
+    answers: Set[str] = set()
+    for word in puzzle.words:
+        if word.answer in answers:
+            problems.append(f"kata '{word.answer}' muncul lebih dari sekali")
+        answers.add(word.answer)
+        if (word.row, word.col, word.direction) in starts:
+            problems.append(f"dua kata mulai di ({word.row},{word.col}) {word.direction}")
+        starts.add((word.row, word.col, word.direction))
+        down = word.direction == "down"
+        for offset, ch in enumerate(word.answer):
+            r = word.row + (offset if down else 0)
+            c = word.col + (0 if down else offset)
+            if not (0 <= r < puzzle.height and 0 <= c < puzzle.width):
+                problems.append(f"kata '{word.answer}' keluar grid di ({r},{c})")
+                break
+            if puzzle.grid[r][c] != ch:
+                problems.append(
+                    f"conflict di ({r},{c}) untuk kata '{word.answer}': grid='{puzzle.grid[r][c]}' vs kata='{ch}'"
+                )
+            covered.add((r, c))
+    for r, row in enumerate(puzzle.grid):
+        for c, ch in enumerate(row):
+            if ch != "." and (r, c) not in covered:
+                problems.append(f"huruf '{ch}' di ({r},{c}) tidak milik kata mana pun")
+    return problems
+
+
+def encode_record(index: int, seed: int, puzzle: Puzzle) -> str:
+    """Satu baris JSONL: format export_json dengan clue inline plus metadata run."""
+    return json.dumps(
+        {
+            "index": index,
+            "seed": seed,
+            "id": puzzle.puzzle_id,
+            "gridData": puzzle.grid,
+            "words": [
+                {"word": w.answer, "row": w.row, "col": w.col, "dir": w.direction, "clue": w.clue}
+                for w in puzzle.words
+            ],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def load_vocabulary(paths: Iterable[Path]) -> List[Tuple[str, str]]:
+    """Pasangan (jawaban, clue) unik dari file clue JSON atau ekspor puzzle."""
+    vocabulary: Dict[str, str] = {}
+    for path in map(Path, paths):
+        if path.suffix.lower() == ".json":
+            with path.open("r", encoding="utf8") as fh:
+                data = json.load(fh)
+            if "words" not in data:
+                for answer, clue in data.items():
+                    vocabulary.setdefault(str(answer).upper(), str(clue))
+                continue
+        for puzzle in puzzles_from_file(path):
+            for word in puzzle.words:
+                vocabulary.setdefault(word.answer, word.clue)
+    return [(answer, clue) for answer, clue in vocabulary.items() if clue]
+
+
+def _init_worker(vocabulary: Sequence[Tuple[str, str]]) -> None:
+    global _VOCABULARY
+    _VOCABULARY = vocabulary
+    # Pesan "gagal ditempatkan" dari SmartCrossword tidak berguna untuk ribuan puzzle
+    sys.stdout = open(os.devnull, "w")
+    # Ctrl+C ditangani proses utama, yang membatalkan sisa pekerjaan
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _generate_chunk(
+    seed: int, indices: range, width: int, height: int, max_words: int
+) -> List[Tuple[int, int, Optional[str], str, List[str]]]:
+    """Bangun satu potongan indeks; serialisasi dan cek conflict ikut diparalelkan."""
+    results = []
+    for index in indices:
+        item_seed = puzzle_seed(seed, index)
+        puzzle, _ = generate_puzzle(item_seed, _VOCABULARY, width, height, max_words)
+        conflicts = find_conflicts(puzzle)
+        line = None if conflicts else encode_record(index, item_seed, puzzle)
+        results.append((index, item_seed, line, puzzle.puzzle_id, conflicts))
+    return results
+
+
+def _resume_point(path: Path, seed: int) -> Tuple[int, Set[str]]:
+    """Potong baris terakhir yang tidak utuh; kembalikan indeks berikutnya dan id yang sudah ada."""
+    if not path.exists():
+        return 0, set()
+    ids: Set[str] = set()
+    last: Optional[Dict] = None
+    with path.open("r+b") as fh:
+        good = 0
+        for raw in fh:
+            if not raw.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                break
+            ids.add(record["id"])
+            last = record
+            good += len(raw)
+        fh.truncate(good)
+    if last is None:
+        return 0, ids
+    if last["seed"] != puzzle_seed(seed, last["index"]):
+        raise ValueError(f"{path} dibuat dengan seed lain; pakai --seed yang sama atau file baru")
+    return last["index"] + 1, ids
+
+
+def generate(
+    output: Path,
+    count: int,
+    vocabulary: Sequence[Tuple[str, str]],
+    seed: int = 0,
+    width: int = 15,
+    height: int = 15,
+    max_words: int = 20,
+    workers: Optional[int] = None,
+    chunk_size: int = 16,
+    on_progress: Optional[Callable[[int, BulkStats], None]] = None,
+    on_reject: Optional[Callable[[int, List[str]], None]] = None,
+) -> BulkStats:
+    """Tulis puzzle berindeks 0..count-1 ke ``output``, melanjutkan run sebelumnya jika ada.
+
+    Puzzle yang gagal cek conflict atau id-nya sudah ada di file tidak ditulis.
+    """
+    if not vocabulary:
+        raise ValueError("Kosakata kosong")
+    output = Path(output)
+    start, seen = _resume_point(output, seed)
+    stats = BulkStats(resumed_from=start)
+    workers = workers or os.cpu_count() or 1
+    chunks = (range(i, min(i + chunk_size, count)) for i in range(start, count, chunk_size))
+    started = time.perf_counter()
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(list(vocabulary),))
+    # Jendela terbatas: worker selalu sibuk, tetapi hasil yang menunggu giliran tulis tidak menumpuk
+    pending: Deque[Future] = deque()
+    try:
+        with output.open("a", encoding="utf8") as out:
+            for indices in chunks:
+                pending.append(executor.submit(_generate_chunk, seed, indices, width, height, max_words))
+                if len(pending) < workers * 2:
+                    continue
+                _write_chunk(pending.popleft().result(), out, seen, stats, on_reject)
+                stats.seconds = time.perf_counter() - started
+                if on_progress:
+                    on_progress(count - start, stats)
+            while pending:
+                _write_chunk(pending.popleft().result(), out, seen, stats, on_reject)
+                stats.seconds = time.perf_counter() - started
+                if on_progress:
+                    on_progress(count - start, stats)
+    finally:
+        # Saat diinterupsi, potongan yang belum mulai dibatalkan; yang sudah ditulis aman untuk dilanjutkan
+        executor.shutdown(wait=True, cancel_futures=True)
+    return stats
+
+
+def _write_chunk(results, out, seen: Set[str], stats: BulkStats, on_reject) -> None:
+    lines = []
+    for index, _, line, puzzle_id, conflicts in results:
+        if line is None:
+            stats.rejected += 1
+            if on_reject:
+                on_reject(index, conflicts)
+        elif puzzle_id in seen:
+            stats.duplicates += 1
+        else:
+            seen.add(puzzle_id)
+            lines.append(line)
+    if lines:
+        out.write("\n".join(lines) + "\n")
+        out.flush()
+        stats.written += len(lines)
+
+
+def _progress_printer(interval: float) -> Callable[[int, BulkStats], None]:
+    last = [0.0]
+
+    def report(total: int, stats: BulkStats) -> None:
+        done = stats.written + stats.rejected + stats.duplicates
+        if stats.seconds - last[0] < interval and done < total:
+            return
+        last[0] = stats.seconds
+        eta = (total - done) / stats.rate if stats.rate else 0.0
+        print(
+            f"\r{done}/{total} puzzle ({done / total:.1%}), {stats.rate:.1f} puzzle/s, "
+            f"ETA {eta:.0f} s, ditolak {stats.rejected}, duplikat {stats.duplicates}",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generasi puzzle massal paralel ke JSONL")
+    parser.add_argument("output", type=Path, help="file JSONL keluaran (dilanjutkan jika sudah ada)")
+    parser.add_argument("--count", type=int, required=True, help="jumlah indeks puzzle")
+    parser.add_argument("--vocabulary", type=Path, nargs="+", default=[Path("clue_cache.json")],
+                        help="file clue {KATA: clue} atau ekspor puzzle JSON/JSONL/CSV")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--width", type=int, default=15)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--max-words", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None, help="default: jumlah CPU")
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--progress", type=float, default=2.0, help="interval laporan (detik)")
+    parser.add_argument("--catalog", type=Path, default=None, help="bangun katalog biner dari JSONL setelah selesai")
+    args = parser.parse_args()
+
+    vocabulary = load_vocabulary(args.vocabulary)
+
+    def report_reject(index: int, conflicts: List[str]) -> None:
+        print(f"\npuzzle {index} ditolak: {'; '.join(conflicts)}", file=sys.stderr)
+
+    try:
+        stats = generate(
+            args.output,
+            args.count,
+            vocabulary,
+            seed=args.seed,
+            width=args.width,
+            height=args.height,
+            max_words=args.max_words,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            on_progress=_progress_printer(args.progress),
+            on_reject=report_reject,
+        )
+    except KeyboardInterrupt:
+        print(f"\nDihentikan; jalankan ulang perintah yang sama untuk melanjutkan {args.output}", file=sys.stderr)
+        sys.exit(130)
+    print(file=sys.stderr)
+    if stats.resumed_from:
+        print(f"Dilanjutkan dari indeks {stats.resumed_from}")
+    print(
+        f"{stats.written} puzzle ditulis ke {args.output} dalam {stats.seconds:.1f} s "
+        f"({stats.rate:.1f} puzzle/s); ditolak {stats.rejected}, duplikat {stats.duplicates}"
+    )
+    if args.catalog:
+        total = write_catalog(args.catalog, puzzles_from_file(args.output))
+        print(f"{total} puzzle ditulis ke katalog {args.catalog}")
+
+
+if __name__ == "__main__":
+    main()
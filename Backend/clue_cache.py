@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Protocol
+
+from crossword_geminiai import CLUE_PENDING, grid_word_from_display, pending_clue, sanitize_clue
+
+
+class ClueProvider(Protocol):
+    """Sumber clue (mis. Gemini). Kunci hasil boleh berupa kata tampilan apa pun."""
+
+    def fetch(self, words: List[str]) -> Dict[str, str]:
+        ...
+
+
+@dataclass(frozen=True)
+class ClueCacheStats:
+    hits: int
+    disk_hits: int
+    misses: int
+    provider_calls: int
+    provider_words: int
+    provider_errors: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total else 0.0
+
+
+def is_real_clue(clue: Optional[str]) -> bool:
+    return bool(clue) and not clue.startswith(CLUE_PENDING)
+
+
+class JsonClueStore:
+    """Penyimpanan clue di file JSON ``{KATA: clue}``, ditulis secara atomik."""
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._data: Optional[Dict[str, str]] = None
+
+    def _load(self) -> Dict[str, str]:
+        if self._data is None:
+            if self._path.exists():
+                with self._path.open("r", encoding="utf8") as fh:
+                    raw = json.load(fh)
+                self._data = {grid_word_from_display(k): v for k, v in raw.items() if is_real_clue(v)}
+            else:
+                self._data = {}
+        return self._data
+
+    def get(self, key: str) -> Optional[str]:
+        return self._load().get(key)
+
+    def put_many(self, clues: Dict[str, str]) -> None:
+        data = self._load()
+        data.update(clues)
+        # Tulis ke file sementara di folder yang sama lalu ganti sekaligus
+        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix=self._path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf8") as fh:
+                json.dump(data, fh, ensure_ascii=False, indent=2)
+            os.replace(tmp_name, self._path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+class ClueCache:
+    """Cache clue dua lapis: LRU di memori di depan JsonClueStore.
+
+    Kunci selalu hasil ``grid_word_from_display``. Kata yang belum punya clue
+    dikumpulkan menjadi satu panggilan provider; placeholder "Clue pending"
+    dikembalikan ke pemanggil tetapi tidak pernah disimpan.
+    """
+
+    def __init__(self, store: JsonClueStore, provider: ClueProvider, max_entries: int = 4096):
+        self._store = store
+        self._provider = provider
+        self._max_entries = max_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._provider_calls = 0
+        self._provider_words = 0
+        self._provider_errors = 0
+
+    def get_many(self, words: List[str]) -> Dict[str, str]:
+        """Clue untuk setiap kata, dengan kunci kata grid (``grid_word_from_display``).
+
+        Urutan kunci mengikuti urutan kemunculan pertama di ``words``.
+        """
+        # None = belum ada clue; diisi hasil provider tanpa mengubah urutan
+        result: Dict[str, Optional[str]] = {}
+        missing: Dict[str, str] = {}
+        with self._lock:
+            for word in words:
+                key = grid_word_from_display(word)
+                if key in result:
+                    continue
+                clue = self._memory.get(key)
+                if clue is not None:
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    result[key] = clue
+                    continue
+                clue = self._store.get(key)
+                if clue is not None:
+                    self._disk_hits += 1
+                    self._remember(key, clue)
+                    result[key] = clue
+                    continue
+                self._misses += 1
+                result[key] = None
+                missing[key] = word
+
+        if missing:
+            result.update(self._fetch(missing))
+        return result
+
+    def _fetch(self, missing: Dict[str, str]) -> Dict[str, str]:
+        with self._lock:
+            self._provider_calls += 1
+            self._provider_words += len(missing)
+        try:
+            raw = self._provider.fetch(list(missing.values()))
+        except Exception as e:
+            print(f"Gagal mengambil clue dari provider: {e}")
+            raw = {}
+            with self._lock:
+                self._provider_errors += 1
+
+        fetched = {}
+        for word, clue in raw.items():
+            key = grid_word_from_display(word)
+            clue = sanitize_clue(clue)
+            if key in missing and is_real_clue(clue):
+                fetched[key] = clue
+
+        with self._lock:
+            for key, clue in fetched.items():
+                self._remember(key, clue)
+            if fetched:
+                self._store.put_many(fetched)
+        return {key: fetched.get(key) or pending_clue(word) for key, word in missing.items()}
+
+    def _remember(self, key: str, clue: str) -> None:
+        self._memory[key] = clue
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> ClueCacheStats:
+        with self._lock:
+            return ClueCacheStats(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                provider_calls=self._provider_calls,
+                provider_words=self._provider_words,
+                provider_errors=self._provider_errors,
+            )
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Protocol
+
+from crossword_geminiai import AsyncGeminiClueProvider, grid_word_from_display, pending_clue, sanitize_clue
+
+
+class AsyncClueProvider(Protocol):
+    """Provider clue asinkron; kunci hasil boleh berupa kata tampilan apa pun."""
+
+    async def fetch(self, words: List[str]) -> Dict[str, str]:
+        ...
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    chunks: int
+    attempts: int
+    retries: int
+    failed_chunks: int
+    pending_words: int
+    elapsed_ms: float
+
+
+class TokenBucket:
+    """Rate limiter token bucket untuk coroutine: ``rate`` token per detik."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate harus lebih besar dari 0")
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class CluePipeline:
+    """Ambil clue per potongan kata secara konkuren dengan rate limit dan retry.
+
+    Setiap potongan dikirim terpisah sehingga satu error (mis. 429) hanya
+    mengulang potongan itu dengan backoff eksponensial. Jawaban parsial tetap
+    diterima; hanya kata yang belum terjawab yang dicoba lagi. Kata yang tetap
+    gagal setelah ``max_retries`` mendapat placeholder "Clue pending".
+    """
+
+    def __init__(
+        self,
+        provider: AsyncClueProvider,
+        chunk_size: int = 10,
+        concurrency: int = 4,
+        rate_per_second: float = 5.0,
+        burst: Optional[float] = None,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        seed: Optional[int] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError("chunk_size dan concurrency minimal 1")
+        self._provider = provider
+        self._chunk_size = chunk_size
+        self._concurrency = concurrency
+        self._rate = rate_per_second
+        self._burst = burst
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._rng = random.Random(seed)
+        self._sleep = sleep
+        self.last_stats: Optional[PipelineStats] = None
+
+    async def run(
+        self,
+        words: List[str],
+        on_partial: Optional[Callable[[Dict[str, str]], None]] = None,
+    ) -> Dict[str, str]:
+        """Clue untuk setiap kata, dengan kunci kata grid (``grid_word_from_display``)."""
+        started = time.perf_counter()
+        unique: Dict[str, str] = {}
+        for word in words:
+            unique.setdefault(grid_word_from_display(word), word)
+        items = list(unique.items())
+        chunks = [dict(items[i:i + self._chunk_size]) for i in range(0, len(items), self._chunk_size)]
+
+        bucket = TokenBucket(self._rate, self._burst)
+        semaphore = asyncio.Semaphore(self._concurrency)
+        counters = {"attempts": 0, "retries": 0, "failed": 0}
+        results: Dict[str, str] = {}
+
+        tasks = [
+            asyncio.ensure_future(self._run_chunk(chunk, bucket, semaphore, counters))
+            for chunk in chunks
+        ]
+        # Gabungkan hasil setiap potongan begitu selesai
+        for next_done in asyncio.as_completed(tasks):
+            partial = await next_done
+            results.update(partial)
+            if on_partial is not None and partial:
+                on_partial(partial)
+
+        pending = 0
+        for key, word in unique.items():
+            if key not in results:
+                results[key] = pending_clue(word)
+                pending += 1
+        self.last_stats = PipelineStats(
+            chunks=len(chunks),
+            attempts=counters["attempts"],
+            retries=counters["retries"],
+            failed_chunks=counters["failed"],
+            pending_words=pending,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
+        return results
+
+    async def _run_chunk(
+        self,
+        chunk: Dict[str, str],
+        bucket: TokenBucket,
+        semaphore: asyncio.Semaphore,
+        counters: Dict[str, int],
+    ) -> Dict[str, str]:
+        remaining = dict(chunk)
+        found: Dict[str, str] = {}
+        for attempt in range(self._max_retries + 1):
+            if attempt:
+                counters["retries"] += 1
+                delay = min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+                await self._sleep(delay * (0.5 + self._rng.random() / 2))
+            async with semaphore:
+                await bucket.acquire()
+                counters["attempts"] += 1
+                try:
+                    raw = await self._provider.fetch(list(remaining.values()))
+                except Exception as e:
+                    print(f"Gagal mengambil clue untuk {len(remaining)} kata: {e}")
+                    continue
+            for word, clue in raw.items():
+                key = grid_word_from_display(word)
+                clue = sanitize_clue(clue)
+                if key in remaining and clue:
+                    found[key] = clue
+                    del remaining[key]
+            if not remaining:
+                return found
+        counters["failed"] += 1
+        return found
+
+
+class PipelineClueProvider:
+    """Adaptor sinkron agar CluePipeline bisa dipakai sebagai provider ClueCache."""
+
+    def __init__(self, pipeline: CluePipeline):
+        self._pipeline = pipeline
+
+    def fetch(self, words: List[str]) -> Dict[str, str]:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._pipeline.run(words))
+        # asyncio.run tidak bisa dipanggil dari dalam event loop: jalankan loop baru di thread lain
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._pipeline.run(words)).result()
+
+    async def afetch(self, words: List[str]) -> Dict[str, str]:
+        """Versi async untuk pemanggil yang sudah berada di event loop."""
+        return await self._pipeline.run(words)
+
+
+def gemini_clue_provider(**pipeline_options) -> PipelineClueProvider:
+    """Provider Gemini untuk ClueCache/generate_clues: potongan konkuren, rate limit, retry per potongan."""
+    return PipelineClueProvider(CluePipeline(AsyncGeminiClueProvider(), **pipeline_options))
@@ -4,21 +4,41 @@ import random
 import re
 import csv
 import json
+import time
 import unicodedata
-from typing import List, Dict, Optional, Tuple
-from dotenv import load_dotenv
-from google import genai
+from dataclasses import dataclass
+from threading import Lock
+from typing import List, Dict, Optional, Set, Tuple
+
+from metrics import timed
 
 # ===========================
-# LOAD ENVIRONMENT
+# GEMINI CLIENT (LAZY)
 # ===========================
-load_dotenv()
-API_KEY = os.getenv("GEMINI_API_KEY")
-if not API_KEY:
-    raise ValueError("Environment variable GEMINI_API_KEY belum diatur.")
-
 MODEL = "gemini-2.5-flash"
-client = genai.Client(api_key=API_KEY)
+_client = None
+_client_lock = Lock()
+
+def get_client():
+    """Client Gemini, dibuat saat pertama kali clue diminta.
+
+    Import google.genai (~0,7 detik) dan pemeriksaan GEMINI_API_KEY ditunda ke
+    sini agar engine crossword, worker generator, dan server bisa dimuat tanpa
+    keduanya.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from dotenv import load_dotenv
+                from google import genai
+
+                load_dotenv()
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise ValueError("Environment variable GEMINI_API_KEY belum diatur.")
+                _client = genai.Client(api_key=api_key)
+    return _client
 
 # ===========================
 # UTILITIES
@@ -44,12 +64,29 @@ def sanitize_clue(txt: Optional[str]) -> str:
 # ===========================
 # CROSSWORD ENGINE
 # ===========================
+# Byte != 0 -> 0xFF, dipakai sebagai mask sel terisi saat scoring kandidat
+_FILLED_MASK = bytes([0] + [0xFF] * 255)
+
 class Crossword:
     def __init__(self, w=10, h=10):
         self.w = w
         self.h = h
         self.grid = [[None for _ in range(w)] for _ in range(h)]
         self.words = []
+        # Salinan grid datar: 0 = kosong, selain itu kode huruf dari _codes
+        self.cells = bytearray(w * h)
+        self._codes: Dict[str, int] = {}
+        # Indeks huruf -> posisi sel datar (r * w + c) yang berisi huruf itu
+        self.letter_cells: Dict[str, Set[int]] = {}
+
+    def _code(self, ch: str) -> int:
+        code = self._codes.get(ch)
+        if code is None:
+            code = len(self._codes) + 1
+            if code > 255:
+                raise ValueError("Terlalu banyak simbol berbeda untuk grid")
+            self._codes[ch] = code
+        return code
 
     def can_place(self, word: str, r: int, c: int, d: str) -> bool:
         if d == "across":
@@ -63,6 +100,13 @@ class Crossword:
     def place(self, word: str, r: int, c: int, d: str):
         for i, ch in enumerate(word):
             rr, cc = (r+i, c) if d=="down" else (r, c+i)
+            existing = self.grid[rr][cc]
+            if existing != ch:
+                idx = rr * self.w + cc
+                if existing is not None:
+                    self.letter_cells[existing].discard(idx)
+                self.cells[idx] = self._code(ch)
+                self.letter_cells.setdefault(ch, set()).add(idx)
             self.grid[rr][cc] = ch
         self.words.append({"word": word, "row": r, "col": c, "dir": d})
 
@@ -92,50 +136,74 @@ class Crossword:
 # ===========================
 # GENERATE CLUES VIA GEMINI
 # ===========================
-def generate_clues(words: List[str]) -> Dict[str, str]:
-    prompt = (
+CLUE_PENDING = "Clue pending"
+
+def pending_clue(word: str) -> str:
+    return f"{CLUE_PENDING}: {word}"
+
+def parse_clue_lines(raw_text: str) -> Dict[str, str]:
+    clues = {}
+    for line in (raw_text or "").splitlines():
+        if ":" in line:
+            key, val = line.split(":", 1)
+            clues[key.strip().upper()] = sanitize_clue(val.strip())
+    return clues
+
+def clue_prompt(words: List[str]) -> str:
+    return (
         "Buat definisi singkat (5–12 kata) untuk setiap istilah teknologi berikut. "
         "Format setiap baris: 'KATA: definisi'. "
         f"Daftar kata: {', '.join(words)}"
     )
 
-    clues = {}
-    try:
-        response = client.models.generate_content(model=MODEL, contents=prompt)
-        raw_text = response.text
+class GeminiClueProvider:
+    """Provider clue yang memanggil Gemini; melempar exception jika gagal."""
+
+    def fetch(self, words: List[str]) -> Dict[str, str]:
+        response = get_client().models.generate_content(model=MODEL, contents=clue_prompt(words))
+        return parse_clue_lines(response.text)
+
+class AsyncGeminiClueProvider:
+    """Versi asinkron GeminiClueProvider untuk CluePipeline."""
 
-        for line in raw_text.splitlines():
-            if ":" in line:
-                key, val = line.split(":", 1)
-                clues[key.strip().upper()] = sanitize_clue(val.strip())
+    async def fetch(self, words: List[str]) -> Dict[str, str]:
+        response = await get_client().aio.models.generate_content(model=MODEL, contents=clue_prompt(words))
+        return parse_clue_lines(response.text)
 
-        for w in words:
-            if w.upper() not in clues:
-                clues[w.upper()] = f"Clue pending: {w}"
+@timed("generate_clues")
+def generate_clues(words: List[str]) -> Dict[str, str]:
+    """Clue per kata grid lewat CluePipeline: 429 hanya mengulang potongan yang gagal."""
+    from clue_pipeline import gemini_clue_provider
 
-        return clues
+    try:
+        get_client()
     except Exception as e:
+        # Tanpa client tidak ada gunanya mencoba ulang setiap potongan
         print(f"Gagal generate clue dari Gemini: {e}")
-        return {w.upper(): f"Clue pending: {w}" for w in words}
+        return {grid_word_from_display(w): pending_clue(w) for w in words}
+    return gemini_clue_provider().fetch(words)
 
 # ===========================
 # EXPORT
 # ===========================
+def clues_in_word_order(cw: Crossword, clues: Dict[str,str]) -> List[str]:
+    """Clue untuk setiap entri cw.words, sejajar indeksnya (dipakai puzzle_from_export)."""
+    # Kunci clue bisa kata tampilan ("CI/CD") atau kata grid ("CI_CD")
+    by_grid_word = {grid_word_from_display(k): v for k, v in clues.items()}
+    return [by_grid_word.get(itm["word"]) or pending_clue(itm["word"]) for itm in cw.words]
+
 def export_csv(name: str, cw: Crossword, clues: Dict[str,str]):
     with open(name, "w", newline="", encoding="utf8") as f:
         writer = csv.writer(f)
         writer.writerow(["WORD","ROW","COL","DIR","CLUE"])
-        for itm in cw.words:
-            writer.writerow([
-                itm["word"], itm["row"], itm["col"], itm["dir"],
-                clues.get(itm["word"].upper(), f"Clue pending: {itm['word']}")
-            ])
+        for itm, clue in zip(cw.words, clues_in_word_order(cw, clues)):
+            writer.writerow([itm["word"], itm["row"], itm["col"], itm["dir"], clue])
 
 def export_json(name: str, cw: Crossword, clues: Dict[str,str]):
     data = {
         "gridData": ["".join(ch if ch else "." for ch in row) for row in cw.grid],
         "words": cw.words,
-        "clues": list(clues.values())
+        "clues": clues_in_word_order(cw, clues)
     }
     with open(name, "w", encoding="utf8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
@@ -145,26 +213,72 @@ def export_json(name: str, cw: Crossword, clues: Dict[str,str]):
 # ===========================
 class SmartCrossword(Crossword):
     def find_best_positions(self, word: str) -> List[Tuple[int,int,str,int]]:
-        """Cari posisi yang memungkinkan dengan overlap maksimal."""
-        best_positions = []
-        max_overlap = 0
+        """Cari posisi yang memungkinkan dengan overlap maksimal.
+
+        Kandidat diambil dari persilangan dengan huruf yang sudah ada lewat
+        indeks letter_cells. Jika tidak ada persilangan yang valid, semua
+        posisi kosong dikembalikan (overlap 0) dalam urutan scan baris-kolom,
+        sama seperti pencarian penuh sebelumnya.
+        """
         word = word.upper()
-        for r in range(self.h):
-            for c in range(self.w):
-                for d in ["across","down"]:
-                    if not self.can_place(word, r, c, d):
-                        continue
-                    overlap = sum(
-                        1 for i, ch in enumerate(word)
-                        if (self.grid[r+i][c] if d=="down" else self.grid[r][c+i]) == ch
-                    )
-                    if overlap >= max_overlap:
-                        if overlap > max_overlap:
-                            best_positions.clear()
-                            max_overlap = overlap
-                        best_positions.append((r, c, d, overlap))
-        return best_positions
+        n = len(word)
+        w, h = self.w, self.h
+        starts: Set[Tuple[int,int,int]] = set()
+        for i, ch in enumerate(word):
+            for idx in self.letter_cells.get(ch, ()):
+                r, c = divmod(idx, w)
+                if 0 <= c - i and c - i + n <= w:
+                    starts.add((r, c - i, 0))
+                if 0 <= r - i and r - i + n <= h:
+                    starts.add((r - i, c, 1))
+
+        best: List[Tuple[int,int,int]] = []
+        max_overlap = 0
+        if starts:
+            codes = self._codes
+            word_bytes = bytes(codes.get(ch, 0) for ch in word)
+            word_int = int.from_bytes(word_bytes, "big")
+            cells = self.cells
+            for r, c, d in starts:
+                start = r * w + c
+                segment = cells[start:start + n] if d == 0 else cells[start:start + n * w:w]
+                # Valid jika setiap sel terisi sama dengan huruf kata
+                mask = int.from_bytes(segment.translate(_FILLED_MASK), "big")
+                if (int.from_bytes(segment, "big") ^ word_int) & mask:
+                    continue
+                overlap = n - segment.count(0)
+                if overlap > max_overlap:
+                    best = [(r, c, d)]
+                    max_overlap = overlap
+                elif overlap == max_overlap:
+                    best.append((r, c, d))
 
+        if not best:
+            best = self._empty_positions(n)
+        best.sort()
+        dirs = ("across", "down")
+        return [(r, c, dirs[d], max_overlap) for r, c, d in best]
+
+    def _empty_positions(self, n: int) -> List[Tuple[int,int,int]]:
+        """Semua posisi (r, c, arah) yang n selnya masih kosong."""
+        w, h = self.w, self.h
+        gap = bytes(n)
+        found: List[Tuple[int,int,int]] = []
+        for r in range(h):
+            line = self.cells[r * w:(r + 1) * w]
+            pos = line.find(gap)
+            while pos != -1 and pos < w:
+                found.append((r, pos, 0))
+                pos = line.find(gap, pos + 1)
+        for c in range(w):
+            line = self.cells[c::w]
+            pos = line.find(gap)
+            while pos != -1 and pos < h:
+                found.append((pos, c, 1))
+                pos = line.find(gap, pos + 1)
+        return found
+
+    @timed("SmartCrossword.build")
     def build(self, wordlist: List[str]):
         if not wordlist:
             return
@@ -193,10 +307,265 @@ class SmartCrossword(Crossword):
                 if not placed:
                     print(f"Word '{word}' gagal ditempatkan.")
 
+# ===========================
+# BACKTRACKING GENERATOR
+# ===========================
+@dataclass(frozen=True, order=True)
+class LayoutScore:
+    """Kualitas layout; dibandingkan berurutan: kata terpasang, persilangan, kepadatan."""
+    placed: int
+    intersections: int
+    density: float
+
+
+class BacktrackingCrossword(Crossword):
+    """Generator backtracking dengan aturan adjacency dan anggaran waktu/node.
+
+    Setiap langkah memilih kata tersisa dengan kandidat posisi paling sedikit
+    (most-constrained-first). Forward checking membuang kata yang saat ini
+    belum punya posisi valid dari pilihan langkah berikutnya; cabang hanya
+    dipangkas jika semua kata tersisa yang muat di grid pun tidak cukup untuk
+    mengalahkan layout terbaik (kata tanpa persilangan sekarang bisa mendapatkannya
+    setelah kata lain dipasang). Bila anggaran habis, layout terbaik yang
+    ditemukan dipakai.
+    """
+
+    ACROSS, DOWN = 1, 2
+
+    def __init__(self, w=10, h=10, seed: Optional[int] = None,
+                 time_budget: float = 2.0, node_budget: int = 20000, max_candidates: int = 8):
+        super().__init__(w, h)
+        self.rng = random.Random(seed)
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.max_candidates = max_candidates
+        self.nodes = 0
+        self.unplaced: List[str] = []
+        self._dirs = bytearray(w * h)
+        self._new_cells: List[List[int]] = []
+        self._filled = 0
+        self._intersections = 0
+
+    def fits(self, word: str, r: int, c: int, d: str) -> int:
+        """Jumlah persilangan jika kata valid di posisi ini, -1 jika melanggar aturan."""
+        n = len(word)
+        dr, dc = (1, 0) if d == "down" else (0, 1)
+        if r < 0 or c < 0 or r + dr * (n - 1) >= self.h or c + dc * (n - 1) >= self.w:
+            return -1
+        grid = self.grid
+        # Sel tepat sebelum dan sesudah kata harus kosong
+        for rr, cc in ((r - dr, c - dc), (r + dr * n, c + dc * n)):
+            if 0 <= rr < self.h and 0 <= cc < self.w and grid[rr][cc] is not None:
+                return -1
+        bit = self.DOWN if d == "down" else self.ACROSS
+        overlap = 0
+        for i, ch in enumerate(word):
+            rr, cc = r + dr * i, c + dc * i
+            cur = grid[rr][cc]
+            if cur is None:
+                # Huruf baru tidak boleh bersentuhan dengan huruf di sisi kata
+                for pr, pc in ((rr - dc, cc - dr), (rr + dc, cc + dr)):
+                    if 0 <= pr < self.h and 0 <= pc < self.w and grid[pr][pc] is not None:
+                        return -1
+            elif cur != ch or self._dirs[rr * self.w + cc] & bit:
+                return -1
+            else:
+                overlap += 1
+        return overlap if overlap < n else -1
+
+    def candidates(self, word: str) -> List[Tuple[int,int,str,int]]:
+        """Posisi valid yang menyilang huruf terpasang, overlap terbesar dulu."""
+        n = len(word)
+        starts: Set[Tuple[int,int,str]] = set()
+        for i, ch in enumerate(word):
+            for idx in self.letter_cells.get(ch, ()):
+                r, c = divmod(idx, self.w)
+                starts.add((r, c - i, "across"))
+                starts.add((r - i, c, "down"))
+        found = []
+        for r, c, d in sorted(starts):
+            overlap = self.fits(word, r, c, d)
+            if overlap > 0:
+                found.append((r, c, d, overlap))
+        if n and not self.words:
+            found = [(self.h // 2, max(0, (self.w - n) // 2), "across", 0)] if n <= self.w else []
+        return found
+
+    def score(self) -> LayoutScore:
+        return LayoutScore(
+            placed=len(self.words),
+            intersections=self._intersections,
+            density=round(self._filled / (self.w * self.h), 4),
+        )
+
+    def build(self, wordlist: List[str]) -> LayoutScore:
+        words = [w.upper() for w in wordlist if w]
+        self.nodes = 0
+        self._deadline = time.perf_counter() + self.time_budget
+        self._best: Tuple[LayoutScore, List[Dict]] = (self.score(), list(self.words))
+        # Kata terpanjang dulu sebagai jangkar, sisanya dipilih dinamis
+        order = sorted(range(len(words)), key=lambda i: (-len(words[i]), i))
+        self._search(tuple(words[i] for i in order))
+
+        best_score, best_words = self._best
+        self._reset()
+        for itm in best_words:
+            self._push(itm["word"], itm["row"], itm["col"], itm["dir"])
+        self.unplaced = list(words)
+        for itm in best_words:
+            self.unplaced.remove(itm["word"])
+        return best_score
+
+    def fill_from_bank(self, bank, max_words: int, min_length: int = 3, max_length: Optional[int] = None,
+                       candidates_per_slot: int = 32) -> List[str]:
+        """Tambah kata dari bank kata yang cocok dengan huruf persilangan.
+
+        ``bank`` cukup punya ``query(pattern, limit, start)`` (lihat word_bank.WordBank).
+        Untuk setiap sel yang baru dipakai satu arah, slot tegak lurus yang
+        melewatinya diubah menjadi pola (huruf grid atau "?") lalu kandidat
+        dari bank diuji dengan aturan ``fits``. Mengembalikan kata yang ditambahkan.
+        """
+        max_length = min(max_length or max(self.w, self.h), max(self.w, self.h))
+        used = {itm["word"] for itm in self.words}
+        added: List[str] = []
+        # Grid kosong: jangkar kata terpanjang yang muat di baris tengah
+        n = min(self.w, max_length)
+        while not self.words and n >= min_length:
+            for word in bank.query("?" * n, candidates_per_slot, self.rng.getrandbits(32)):
+                if word not in used:
+                    self._push(word, self.h // 2, (self.w - n) // 2, "across")
+                    used.add(word)
+                    added.append(word)
+                    break
+            n -= 1
+        while len(self.words) < max_words:
+            cells = sorted(idx for idxs in self.letter_cells.values() for idx in idxs)
+            self.rng.shuffle(cells)
+            for idx in cells:
+                slot = self._bank_slot(bank, idx, used, min_length, max_length, candidates_per_slot)
+                if slot is not None:
+                    word, r, c, d = slot
+                    self._push(word, r, c, d)
+                    used.add(word)
+                    added.append(word)
+                    break
+            else:
+                break
+        return added
+
+    def _bank_slot(self, bank, idx: int, used: Set[str], min_length: int, max_length: int,
+                   limit: int) -> Optional[Tuple[str, int, int, str]]:
+        dirs = self._dirs[idx]
+        if dirs == self.ACROSS | self.DOWN:
+            return None
+        d = "down" if dirs & self.ACROSS else "across"
+        dr, dc = (1, 0) if d == "down" else (0, 1)
+        row, col = divmod(idx, self.w)
+        grid = self.grid
+        lengths = list(range(min_length, max_length + 1))
+        self.rng.shuffle(lengths)
+        for n in lengths:
+            offsets = list(range(n))
+            self.rng.shuffle(offsets)
+            for i in offsets:
+                r, c = row - dr * i, col - dc * i
+                end_r, end_c = r + dr * (n - 1), c + dc * (n - 1)
+                if r < 0 or c < 0 or end_r >= self.h or end_c >= self.w:
+                    continue
+                # Sel sebelum dan sesudah slot harus kosong; cek murah sebelum kueri bank
+                before, after = (r - dr, c - dc), (end_r + dr, end_c + dc)
+                if any(0 <= rr < self.h and 0 <= cc < self.w and grid[rr][cc] is not None
+                       for rr, cc in (before, after)):
+                    continue
+                pattern = "".join(grid[r + dr * k][c + dc * k] or "?" for k in range(n))
+                for word in bank.query(pattern, limit, self.rng.getrandbits(32)):
+                    if word not in used and self.fits(word, r, c, d) > 0:
+                        return word, r, c, d
+        return None
+
+    def _budget_left(self) -> bool:
+        return self.nodes < self.node_budget and time.perf_counter() < self._deadline
+
+    def _search(self, remaining: Tuple[str, ...]) -> None:
+        self.nodes += 1
+        current = self.score()
+        if current > self._best[0]:
+            self._best = (current, list(self.words))
+        if not remaining or not self._budget_left():
+            return
+
+        if not self._can_beat_best(remaining):
+            return
+        # Forward checking: hanya kata yang sekarang punya posisi valid yang dipilih
+        options = {w: self.candidates(w) for w in remaining}
+        feasible = [w for w in remaining if options[w]]
+        if not feasible:
+            return
+
+        word = min(feasible, key=lambda w: (len(options[w]), -len(w)))
+        rest = list(remaining)
+        rest.remove(word)
+        rest = tuple(rest)
+
+        cands = options[word]
+        self.rng.shuffle(cands)
+        cands.sort(key=lambda cand: -cand[3])
+        for r, c, d, _ in cands[:self.max_candidates]:
+            self._push(word, r, c, d)
+            self._search(rest)
+            self._pop()
+            if not self._budget_left():
+                return
+        # Cabang terakhir: lewati kata ini agar kata lain tetap bisa dicoba
+        self._search(rest)
+
+    def _can_beat_best(self, remaining: Tuple[str, ...]) -> bool:
+        """Batas atas yang aman: anggap setiap kata tersisa yang muat di grid masih bisa dipasang."""
+        longest = max(self.w, self.h)
+        possible = sum(1 for w in remaining if len(w) <= longest)
+        # Seri jumlah kata masih bisa menang lewat persilangan atau kepadatan
+        return len(self.words) + possible >= self._best[0].placed
+
+    def _push(self, word: str, r: int, c: int, d: str) -> None:
+        dr, dc = (1, 0) if d == "down" else (0, 1)
+        bit = self.DOWN if d == "down" else self.ACROSS
+        new_cells = []
+        for i in range(len(word)):
+            idx = (r + dr * i) * self.w + c + dc * i
+            if self.cells[idx]:
+                self._intersections += 1
+            else:
+                new_cells.append(idx)
+            self._dirs[idx] |= bit
+        self.place(word, r, c, d)
+        self._filled += len(new_cells)
+        self._new_cells.append(new_cells)
+
+    def _pop(self) -> None:
+        itm = self.words.pop()
+        new_cells = self._new_cells.pop()
+        word, r, c, d = itm["word"], itm["row"], itm["col"], itm["dir"]
+        dr, dc = (1, 0) if d == "down" else (0, 1)
+        bit = self.DOWN if d == "down" else self.ACROSS
+        for i in range(len(word)):
+            self._dirs[(r + dr * i) * self.w + c + dc * i] &= ~bit
+        self._intersections -= len(word) - len(new_cells)
+        self._filled -= len(new_cells)
+        for idx in new_cells:
+            rr, cc = divmod(idx, self.w)
+            self.letter_cells[self.grid[rr][cc]].discard(idx)
+            self.grid[rr][cc] = None
+            self.cells[idx] = 0
+
+    def _reset(self) -> None:
+        while self.words:
+            self._pop()
+
 # ===========================
 # MAIN BUILDER
 # ===========================
-def build_crossword(words_raw: List[str], w=10, h=10, max_words=10, csv_file: Optional[str]=None):
+def build_crossword(words_raw: List[str], w=10, h=10, max_words=10, csv_file: Optional[str]=None,
+                    clue_cache=None, word_bank=None):
     displays = [normalize_display_word(x) for x in words_raw if x and str(x).strip()]
     uniq = []
     seen = set()
@@ -206,12 +575,24 @@ def build_crossword(words_raw: List[str], w=10, h=10, max_words=10, csv_file: Op
             uniq.append(d)
             seen.add(u)
     selected = uniq[:max_words]
-
-    clues = generate_clues(selected)
     grid_words = [grid_word_from_display(d) for d in selected]
 
-    cw = SmartCrossword(w, h)
-    cw.build(grid_words)
+    if word_bank is not None:
+        # Kata pilihan dulu, lalu slot yang tersisa diisi kata bank yang cocok dengan persilangan
+        cw = BacktrackingCrossword(w, h)
+        cw.build(grid_words)
+        placed = {itm["word"] for itm in cw.words}
+        selected = [d for d, g in zip(selected, grid_words) if g in placed]
+        grid_words = [g for g in grid_words if g in placed]
+        for grid_word in cw.fill_from_bank(word_bank, max_words):
+            selected.append(word_bank.display(grid_word))
+            grid_words.append(grid_word)
+    else:
+        cw = SmartCrossword(w, h)
+        cw.build(grid_words)
+
+    # Dengan ClueCache hanya kata yang belum punya clue yang dikirim ke Gemini
+    clues = clue_cache.get_many(selected) if clue_cache is not None else generate_clues(selected)
 
     if csv_file:
         export_csv(csv_file, cw, clues)
@@ -228,8 +609,12 @@ if __name__ == "__main__":
         "Container", "Serverless", "Database", "Firewall", "Encryption", "LoadBalancer"
     ]
 
+    from clue_cache import ClueCache, JsonClueStore
+    from clue_pipeline import gemini_clue_provider
+
+    cache = ClueCache(JsonClueStore("clue_cache.json"), gemini_clue_provider())
     cw, clues, answers = build_crossword(
-        words, w=15, h=15, max_words=20, csv_file="crossword_words_15x15.csv"
+        words, w=15, h=15, max_words=20, csv_file="crossword_words_15x15.csv", clue_cache=cache
     )
 
     export_json("crossword_words_15x15.json", cw, clues)
@@ -240,4 +625,8 @@ if __name__ == "__main__":
     for k, v in clues.items():
         print(f"- {k}: {v}")
 
+    stats = cache.stats()
+    print(f"\nClue cache: hit rate {stats.hit_rate:.0%}, {stats.provider_calls} panggilan Gemini "
+          f"untuk {stats.provider_words} kata.")
+
     print("\nCSV dan JSON sudah dibuat.")
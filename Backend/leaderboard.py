@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+# Kunci urutan: (waktu selesai dalam ms, nomor urut selesai, session_id)
+_Key = Tuple[int, int, str]
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    rank: int
+    session_id: str
+    player_name: str
+    seconds: float
+
+
+class SortedKeyList:
+    """Array terurut yang dipecah menjadi blok-blok kecil.
+
+    Satu list Python biasa membuat ``insort`` menggeser seluruh isi array
+    (O(n) per sisip, terasa di jutaan entri). Di sini setiap blok berisi paling
+    banyak ``2 * load`` kunci: pencarian blok dan posisi memakai bisect, dan
+    jumlah kunci sebelum blok dihitung dengan Fenwick tree atas ukuran blok,
+    sehingga sisip dan ``index`` berjalan dalam O(log n) ditambah geseran
+    satu blok kecil.
+    """
+
+    def __init__(self, load: int = 512) -> None:
+        self._load = load
+        self._blocks: List[List[_Key]] = []
+        self._maxes: List[_Key] = []
+        self._tree: Optional[List[int]] = None
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key: _Key) -> int:
+        """Sisipkan ``key`` dan kembalikan posisinya sebelum sisip."""
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            self._tree = None
+            self._len = 1
+            return 0
+        block_index = bisect_left(self._maxes, key)
+        if block_index == len(self._blocks):
+            block_index -= 1
+        position = self.index(key)
+        block = self._blocks[block_index]
+        insort(block, key)
+        self._maxes[block_index] = block[-1]
+        self._len += 1
+        if len(block) > 2 * self._load:
+            self._blocks[block_index:block_index + 1] = [block[:self._load], block[self._load:]]
+            self._maxes[block_index:block_index + 1] = [block[self._load - 1], block[-1]]
+            self._tree = None
+        elif self._tree is not None:
+            self._tree_add(block_index, 1)
+        return position
+
+    def index(self, key: _Key) -> int:
+        """Jumlah kunci yang lebih kecil dari ``key``."""
+        block_index = bisect_left(self._maxes, key)
+        if block_index == len(self._blocks):
+            return self._len
+        return self._prefix(block_index) + bisect_left(self._blocks[block_index], key)
+
+    def head(self, count: int) -> List[_Key]:
+        result: List[_Key] = []
+        for block in self._blocks:
+            if len(result) >= count:
+                break
+            result.extend(block[:count - len(result)])
+        return result
+
+    def _prefix(self, block_index: int) -> int:
+        if self._tree is None:
+            self._build_tree()
+        total, i, tree = 0, block_index, self._tree
+        while i > 0:
+            total += tree[i - 1]
+            i &= i - 1
+        return total
+
+    def _tree_add(self, block_index: int, delta: int) -> None:
+        tree, i = self._tree, block_index + 1
+        while i <= len(tree):
+            tree[i - 1] += delta
+            i += i & -i
+
+    def _build_tree(self) -> None:
+        # Fenwick tree dibangun ulang O(jumlah blok) hanya setelah blok dipecah
+        tree = [len(block) for block in self._blocks]
+        for i in range(1, len(tree) + 1):
+            parent = i + (i & -i)
+            if parent <= len(tree):
+                tree[parent - 1] += tree[i - 1]
+        self._tree = tree
+
+
+class _PuzzleBoard:
+    __slots__ = ("keys", "players", "top_cache", "sequence")
+
+    def __init__(self) -> None:
+        self.keys = SortedKeyList()
+        # session_id -> (kunci, nama pemain)
+        self.players: Dict[str, Tuple[_Key, str]] = {}
+        self.top_cache: Dict[int, List[LeaderboardEntry]] = {}
+        self.sequence = 0
+
+
+class Leaderboard:
+    """Peringkat waktu selesai per puzzle; lebih cepat lebih baik, waktu sama berbagi peringkat."""
+
+    def __init__(self) -> None:
+        self._boards: Dict[str, _PuzzleBoard] = {}
+        self._lock = Lock()
+
+    def record(self, puzzle_id: str, session_id: str, player_name: str, seconds: float) -> LeaderboardEntry:
+        """Catat penyelesaian sesi; sesi yang sudah tercatat tidak berubah lagi."""
+        with self._lock:
+            board = self._boards.get(puzzle_id)
+            if board is None:
+                board = self._boards[puzzle_id] = _PuzzleBoard()
+            if session_id not in board.players:
+                key = (max(0, round(seconds * 1000)), board.sequence, session_id)
+                board.sequence += 1
+                board.players[session_id] = (key, player_name)
+                position = board.keys.add(key)
+                # Hanya cache top-K yang jangkauannya terkena sisipan yang dibuang
+                for k in [k for k in board.top_cache if k > position]:
+                    del board.top_cache[k]
+            return self._entry(board, session_id)
+
+    def rank(self, puzzle_id: str, session_id: str) -> Optional[LeaderboardEntry]:
+        with self._lock:
+            board = self._boards.get(puzzle_id)
+            if board is None or session_id not in board.players:
+                return None
+            return self._entry(board, session_id)
+
+    def top(self, puzzle_id: str, count: int) -> List[LeaderboardEntry]:
+        with self._lock:
+            board = self._boards.get(puzzle_id)
+            if board is None:
+                return []
+            cached = board.top_cache.get(count)
+            if cached is None:
+                cached = board.top_cache[count] = self._top(board, count)
+            return cached
+
+    def total(self, puzzle_id: str) -> int:
+        with self._lock:
+            board = self._boards.get(puzzle_id)
+            return len(board.keys) if board is not None else 0
+
+    @staticmethod
+    def _entry(board: _PuzzleBoard, session_id: str) -> LeaderboardEntry:
+        key, player_name = board.players[session_id]
+        return LeaderboardEntry(
+            # Peringkat kompetisi: jumlah waktu yang lebih cepat + 1
+            rank=board.keys.index((key[0],)) + 1,
+            session_id=session_id,
+            player_name=player_name,
+            seconds=key[0] / 1000,
+        )
+
+    @staticmethod
+    def _top(board: _PuzzleBoard, count: int) -> List[LeaderboardEntry]:
+        entries: List[LeaderboardEntry] = []
+        rank = 0
+        previous_ms = None
+        for position, (elapsed_ms, _, session_id) in enumerate(board.keys.head(count)):
+            if elapsed_ms != previous_ms:
+                rank, previous_ms = position + 1, elapsed_ms
+            entries.append(
+                LeaderboardEntry(
+                    rank=rank,
+                    session_id=session_id,
+                    player_name=board.players[session_id][1],
+                    seconds=elapsed_ms / 1000,
+                )
+            )
+        return entries
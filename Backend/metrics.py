@@ -0,0 +1,269 @@
+"""Metrik ringan dengan format teks Prometheus.
+
+Penulisan metrik tidak memakai lock: setiap thread punya sel angkanya sendiri
+(``threading.local``) dan hanya thread itu yang menulis ke sana. Lock hanya
+dipakai saat thread baru mendaftarkan selnya dan saat ``/metrics`` dibaca,
+ketika sel semua thread dijumlahkan.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _PerThreadCells:
+    """Deret angka per thread; ``totals`` menjumlahkan milik semua thread."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._all: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def cells(self) -> List[float]:
+        try:
+            return self._local.cells
+        except AttributeError:
+            cells = [0.0] * self._size
+            with self._lock:
+                self._all.append(cells)
+            self._local.cells = cells
+            return cells
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            rows = list(self._all)
+        return [sum(column) for column in zip(*rows)] if rows else [0.0] * self._size
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} membutuhkan label {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _label_text(self, values: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("_cells",)
+
+    def __init__(self) -> None:
+        self._cells = _PerThreadCells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._cells.cells()[0] += amount
+
+    def value(self) -> float:
+        return self._cells.totals()[0]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def samples(self) -> Iterator[str]:
+        for values, child in sorted(self._children.items()):
+            yield f"{self.name}{self._label_text(values)} {_number(child.value())}"
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_cells")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        # Satu sel per bucket, satu untuk +Inf, dan satu untuk jumlah nilai
+        self._cells = _PerThreadCells(len(bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        cells = self._cells.cells()
+        cells[bisect_left(self._bounds, value)] += 1
+        cells[-1] += value
+
+    def totals(self) -> List[float]:
+        return self._cells.totals()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def samples(self) -> Iterator[str]:
+        for values, child in sorted(self._children.items()):
+            totals = child.totals()
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), totals):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                labels = self._label_text(values, f'le="{le}"')
+                yield f"{self.name}_bucket{labels} {_number(cumulative)}"
+            yield f"{self.name}_sum{self._label_text(values)} {_number(totals[-1])}"
+            yield f"{self.name}_count{self._label_text(values)} {_number(cumulative)}"
+
+
+class Gauge(_Metric):
+    """Gauge yang nilainya diambil dari callback saat ``/metrics`` dibaca."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float]):
+        super().__init__(name, documentation)
+        self._callback = callback
+
+    def samples(self) -> Iterator[str]:
+        yield f"{self.name} {_number(self._callback())}"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metrik sudah terdaftar: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, callback: Callable[[], float]) -> Gauge:
+        return self.register(Gauge(name, documentation, callback))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+REGISTRY = Registry()
+
+FUNCTION_SECONDS = REGISTRY.histogram(
+    "crossword_function_duration_seconds",
+    "Durasi fungsi hot path dalam detik.",
+    ("function",),
+)
+HTTP_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Latensi request HTTP per route dalam detik.",
+    ("method", "route"),
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "Jumlah request HTTP per route dan status.",
+    ("method", "route", "status"),
+)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Dekorator: catat durasi setiap panggilan ke ``crossword_function_duration_seconds``."""
+    child = FUNCTION_SECONDS.labels(name)
+
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class MetricsMiddleware:
+    """Middleware ASGI: histogram latensi dan jumlah status per template route.
+
+    Label route memakai path template (``/sessions/{session_id}``) dari route
+    yang cocok, bukan path mentah, agar jumlah deret tetap kecil.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._children: Dict[Tuple[str, str], _HistogramChild] = {}
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = getattr(scope.get("route"), "path", "unmatched")
+            key = (scope["method"], route)
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = HTTP_SECONDS.labels(*key)
+            child.observe(elapsed)
+            HTTP_REQUESTS.labels(scope["method"], route, status).inc()
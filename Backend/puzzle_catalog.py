@@ -0,0 +1,202 @@
+"""Katalog puzzle biner: satu file berisi indeks offset dan record puzzle ringkas.
+
+Format (little-endian)::
+
+    header   : magic "XWCAT001" | u32 jumlah puzzle | u32 cadangan
+    indeks   : per puzzle -> 16 byte puzzle_id | u64 offset | u32 panjang
+    record   : u16 width | u16 height | u16 jumlah kata | grid (width*height byte ASCII)
+               lalu per kata -> u16 row | u16 col | u8 arah | u8 len answer | answer
+                                | u16 len clue | clue (UTF-8)
+
+File dibuka dengan mmap; record hanya di-decode saat puzzle pertama kali diminta.
+
+    python puzzle_catalog.py build katalog.xwc crossword_words_15x15.json lain.csv
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import mmap
+import struct
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from puzzle_service import Puzzle, WordPlacement, puzzle_from_export
+
+MAGIC = b"XWCAT001"
+_HEADER = struct.Struct("<8sII")
+_INDEX_ENTRY = struct.Struct("<16sQI")
+_RECORD_HEAD = struct.Struct("<HHH")
+_WORD_HEAD = struct.Struct("<HHBB")
+_CLUE_LEN = struct.Struct("<H")
+_DIRECTIONS = ("across", "down")
+
+
+def encode_puzzle(puzzle: Puzzle) -> bytes:
+    grid = "".join(row.ljust(puzzle.width, ".") for row in puzzle.grid)
+    parts = [_RECORD_HEAD.pack(puzzle.width, puzzle.height, len(puzzle.words)), grid.encode("ascii")]
+    for word in puzzle.words:
+        answer = word.answer.encode("ascii")
+        clue = word.clue.encode("utf8")
+        parts.append(_WORD_HEAD.pack(word.row, word.col, _DIRECTIONS.index(word.direction), len(answer)))
+        parts.append(answer)
+        parts.append(_CLUE_LEN.pack(len(clue)))
+        parts.append(clue)
+    return b"".join(parts)
+
+
+def decode_puzzle(buf, offset: int = 0) -> Puzzle:
+    width, height, count = _RECORD_HEAD.unpack_from(buf, offset)
+    pos = offset + _RECORD_HEAD.size
+    grid_bytes = bytes(buf[pos:pos + width * height]).decode("ascii")
+    pos += width * height
+    grid = [grid_bytes[r * width:(r + 1) * width] for r in range(height)]
+    words: List[WordPlacement] = []
+    for _ in range(count):
+        row, col, direction, answer_len = _WORD_HEAD.unpack_from(buf, pos)
+        pos += _WORD_HEAD.size
+        answer = bytes(buf[pos:pos + answer_len]).decode("ascii")
+        pos += answer_len
+        (clue_len,) = _CLUE_LEN.unpack_from(buf, pos)
+        pos += _CLUE_LEN.size
+        clue = bytes(buf[pos:pos + clue_len]).decode("utf8")
+        pos += clue_len
+        words.append(WordPlacement(answer=answer, row=row, col=col, direction=_DIRECTIONS[direction], clue=clue))
+    return Puzzle(width=width, height=height, grid=grid, words=words)
+
+
+def write_catalog(path: Path, puzzles: Iterable[Puzzle]) -> int:
+    """Tulis katalog dari puzzle apa pun (boleh generator); kembalikan jumlahnya."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    index: List[Tuple[bytes, int, int]] = []
+    # Record ditulis ke file sementara dulu karena ukuran indeks baru diketahui di akhir
+    records_path = path.with_name(path.name + ".records")
+    try:
+        with records_path.open("wb") as records:
+            offset = 0
+            for puzzle in puzzles:
+                record = encode_puzzle(puzzle)
+                index.append((bytes.fromhex(puzzle.puzzle_id), offset, len(record)))
+                records.write(record)
+                offset += len(record)
+
+        base = _HEADER.size + _INDEX_ENTRY.size * len(index)
+        with tmp_path.open("wb") as out:
+            out.write(_HEADER.pack(MAGIC, len(index), 0))
+            for puzzle_id, offset, length in index:
+                out.write(_INDEX_ENTRY.pack(puzzle_id, base + offset, length))
+            with records_path.open("rb") as records:
+                _copy(records, out)
+        tmp_path.replace(path)
+    finally:
+        records_path.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+    return len(index)
+
+
+def _copy(src: BinaryIO, dst: BinaryIO, chunk: int = 1 << 20) -> None:
+    while True:
+        data = src.read(chunk)
+        if not data:
+            return
+        dst.write(data)
+
+
+class PuzzleCatalog:
+    """Akses baca katalog lewat mmap dengan LRU puzzle yang sudah di-decode."""
+
+    def __init__(self, path: Path, cache_size: int = 256):
+        self._path = Path(path)
+        self._file = self._path.open("rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, _ = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Bukan file katalog puzzle: {self._path}")
+        self._count = count
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[int, Puzzle]" = OrderedDict()
+        self._ids: Optional[Dict[str, int]] = None
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Puzzle]:
+        for index in range(self._count):
+            yield self.get(index)
+
+    def __enter__(self) -> "PuzzleCatalog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get(self, index: int) -> Puzzle:
+        if not 0 <= index < self._count:
+            raise IndexError(f"Indeks puzzle di luar jangkauan: {index}")
+        with self._lock:
+            puzzle = self._cache.get(index)
+            if puzzle is not None:
+                self._cache.move_to_end(index)
+                return puzzle
+        _, offset, _ = _INDEX_ENTRY.unpack_from(self._mmap, _HEADER.size + index * _INDEX_ENTRY.size)
+        puzzle = decode_puzzle(self._mmap, offset)
+        with self._lock:
+            self._cache[index] = puzzle
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return puzzle
+
+    def find(self, puzzle_id: str) -> Optional[Puzzle]:
+        if self._ids is None:
+            # Peta id -> indeks dibangun sekali dari indeks saja, tanpa decode record
+            ids = {}
+            for index in range(self._count):
+                raw_id, _, _ = _INDEX_ENTRY.unpack_from(self._mmap, _HEADER.size + index * _INDEX_ENTRY.size)
+                ids[raw_id.hex()] = index
+            self._ids = ids
+        index = self._ids.get(puzzle_id)
+        return self.get(index) if index is not None else None
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+
+def puzzles_from_file(path: Path) -> Iterator[Puzzle]:
+    """Baca ekspor generator: JSON (export_json), JSONL (satu ekspor per baris) atau CSV."""
+    path = Path(path)
+    with path.open("r", encoding="utf8", newline="") as fh:
+        if path.suffix.lower() == ".csv":
+            rows = [
+                {"word": row["WORD"], "row": row["ROW"], "col": row["COL"], "dir": row["DIR"], "clue": row["CLUE"]}
+                for row in csv.DictReader(fh)
+            ]
+            yield puzzle_from_export({"words": rows})
+        elif path.suffix.lower() == ".jsonl":
+            for line in fh:
+                if line.strip():
+                    yield puzzle_from_export(json.loads(line))
+        else:
+            yield puzzle_from_export(json.load(fh))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Alat katalog puzzle biner")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Konversi ekspor JSON/JSONL/CSV menjadi katalog")
+    build.add_argument("output", type=Path)
+    build.add_argument("inputs", type=Path, nargs="+")
+    args = parser.parse_args()
+
+    count = write_catalog(args.output, (p for src in args.inputs for p in puzzles_from_file(src)))
+    print(f"{count} puzzle ditulis ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from threading import RLock
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from metrics import REGISTRY
+from puzzle_service import Puzzle, WordPlacement
+
+GENERATION_SECONDS = REGISTRY.histogram(
+    "crossword_pool_generation_seconds",
+    "Durasi generasi satu puzzle pool di process pool, dalam detik.",
+)
+
+
+@dataclass(frozen=True)
+class PuzzlePoolStats:
+    depth: int
+    in_flight: int
+    generated: int
+    failed: int
+    served: int
+    fallbacks: int
+    last_generation_ms: float
+    avg_generation_ms: float
+
+
+def generate_puzzle(
+    seed: int,
+    vocabulary: Sequence[Tuple[str, str]],
+    width: int,
+    height: int,
+    max_words: int,
+) -> Tuple[Puzzle, float]:
+    """Bangun satu puzzle dengan SmartCrossword; dijalankan di proses worker."""
+    # Import di sini agar proses web tidak memuat modul generator
+    from crossword_geminiai import SmartCrossword
+
+    started = time.perf_counter()
+    random.seed(seed)
+    chosen = list(vocabulary)
+    random.shuffle(chosen)
+    chosen = chosen[:max_words]
+    clues = dict(chosen)
+
+    cw = SmartCrossword(width, height)
+    cw.build([answer for answer, _ in chosen])
+    words = [
+        WordPlacement(
+            answer=itm["word"],
+            row=itm["row"],
+            col=itm["col"],
+            direction=itm["dir"],
+            clue=clues.get(itm["word"], ""),
+        )
+        for itm in cw.words
+    ]
+    grid = ["".join(ch if ch else "." for ch in row) for row in cw.grid]
+    puzzle = Puzzle(width=width, height=height, grid=grid, words=words)
+    return puzzle, time.perf_counter() - started
+
+
+class PuzzlePool:
+    """Antrian puzzle siap pakai yang diisi ulang di latar belakang.
+
+    Saat isi antrian turun sampai ``low_watermark``, pekerjaan generasi
+    dikirim ke executor (default ProcessPoolExecutor) sampai isi antrian
+    ditambah pekerjaan yang berjalan mencapai ``high_watermark``. ``take``
+    tidak pernah menunggu: jika antrian kosong, puzzle fallback dipakai.
+    """
+
+    def __init__(
+        self,
+        fallback: Puzzle,
+        vocabulary: Sequence[Tuple[str, str]],
+        high_watermark: int = 32,
+        low_watermark: int = 8,
+        width: int = 15,
+        height: int = 15,
+        max_words: int = 20,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        seed: Optional[int] = None,
+    ):
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("Harus berlaku 0 <= low_watermark < high_watermark")
+        self._fallback = fallback
+        self._vocabulary: List[Tuple[str, str]] = list(vocabulary)
+        self._high = high_watermark
+        self._low = low_watermark
+        self._size = (width, height, max_words)
+        self._workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._seeds = random.Random(seed)
+        self._ready: Deque[Puzzle] = deque()
+        # Reentrant: callback future yang sudah selesai dipanggil langsung saat submit
+        self._lock = RLock()
+        self._closed = False
+        self._in_flight = 0
+        self._generated = 0
+        self._failed = 0
+        self._served = 0
+        self._fallbacks = 0
+        self._last_ms = 0.0
+        self._total_ms = 0.0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            self._refill_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def take(self) -> Puzzle:
+        """Ambil puzzle berikutnya dalam O(1), atau fallback jika antrian kosong."""
+        try:
+            puzzle = self._ready.popleft()
+        except IndexError:
+            puzzle = None
+        with self._lock:
+            if puzzle is None:
+                self._fallbacks += 1
+                puzzle = self._fallback
+            else:
+                self._served += 1
+            # <=: dengan low_watermark 0 pool tetap diisi ulang begitu kosong
+            if len(self._ready) <= self._low:
+                self._refill_locked()
+        return puzzle
+
+    def _refill_locked(self) -> None:
+        if self._closed or self._executor is None:
+            return
+        width, height, max_words = self._size
+        needed = self._high - len(self._ready) - self._in_flight
+        for _ in range(max(0, needed)):
+            future = self._executor.submit(
+                generate_puzzle,
+                self._seeds.getrandbits(32),
+                self._vocabulary,
+                width,
+                height,
+                max_words,
+            )
+            self._in_flight += 1
+            future.add_done_callback(self._on_generated)
+
+    def _on_generated(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+                return
+            puzzle, seconds = future.result()
+            self._generated += 1
+            self._last_ms = seconds * 1000
+            GENERATION_SECONDS.labels().observe(seconds)
+            self._total_ms += self._last_ms
+            if not self._closed:
+                self._ready.append(puzzle)
+
+    def stats(self) -> PuzzlePoolStats:
+        with self._lock:
+            return PuzzlePoolStats(
+                depth=len(self._ready),
+                in_flight=self._in_flight,
+                generated=self._generated,
+                failed=self._failed,
+                served=self._served,
+                fallbacks=self._fallbacks,
+                last_generation_ms=round(self._last_ms, 3),
+                avg_generation_ms=round(self._total_ms / self._generated, 3) if self._generated else 0.0,
+            )
@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-from dataclasses import dataclass
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property
+from itertools import count
 from pathlib import Path
-from threading import RLock
-from typing import Dict, List
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 from uuid import uuid4
 
+from board import BoardState, Run, StaleBoardVersion
+from leaderboard import Leaderboard, LeaderboardEntry
+from metrics import timed
+from session_store import InMemorySessionStore, SessionStore, SessionStoreStats
+
+if TYPE_CHECKING:
+    from puzzle_catalog import PuzzleCatalog
+    from puzzle_pool import PuzzlePool
+
+T = TypeVar("T")
+
 
 @dataclass(frozen=True)
 class WordPlacement:
@@ -18,6 +36,25 @@ class WordPlacement:
     clue: str
 
 
+@dataclass(frozen=True)
+class AnswerIndex:
+    """Jawaban datar per sel dan peta sel <-> kata, dihitung sekali per puzzle."""
+
+    answers: str
+    # Papan yang terisi benar dalam format BoardState.cells (0 = sel hitam)
+    solution: bytes
+    cell_words: Tuple[Tuple[int, ...], ...]
+    word_cells: Tuple[Tuple[int, ...], ...]
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    correct: int
+    incorrect: List[Tuple[int, int]]
+    # indeks kata -> jumlah sel benar dalam kiriman ini
+    word_hits: Dict[int, int]
+
+
 @dataclass(frozen=True)
 class Puzzle:
     width: int
@@ -25,6 +62,70 @@ class Puzzle:
     grid: List[str]
     words: List[WordPlacement]
 
+    @cached_property
+    def puzzle_id(self) -> str:
+        """Hash isi puzzle; sama di setiap proses untuk data yang sama."""
+        canonical = json.dumps(
+            [self.width, self.height, self.grid, [asdict(w) for w in self.words]],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf8")).hexdigest()[:32]
+
+    @cached_property
+    def answer_index(self) -> AnswerIndex:
+        answers = "".join(row.ljust(self.width, ".") for row in self.grid)
+        cell_words: List[Tuple[int, ...]] = [()] * (self.width * self.height)
+        word_cells = []
+        for wi, word in enumerate(self.words):
+            step = self.width if word.direction == "down" else 1
+            start = word.row * self.width + word.col
+            cells = tuple(start + i * step for i in range(len(word.answer)))
+            for idx in cells:
+                cell_words[idx] += (wi,)
+            word_cells.append(cells)
+        solution = bytes(0 if ch == "." else ord(ch) for ch in answers.upper())
+        return AnswerIndex(
+            answers=answers,
+            solution=solution,
+            cell_words=tuple(cell_words),
+            word_cells=tuple(word_cells),
+        )
+
+    def check(
+        self,
+        cells: Iterable[Tuple[int, int, str]] = (),
+        words: Iterable[Tuple[int, str]] = (),
+    ) -> CheckResult:
+        """Cocokkan isian sel dan/atau kata utuh dengan jawaban, O(1) per sel."""
+        index = self.answer_index
+        width, height = self.width, self.height
+        entries: Dict[int, str] = {}
+        incorrect: List[Tuple[int, int]] = []
+        for r, c, letter in cells:
+            if 0 <= r < height and 0 <= c < width:
+                entries[r * width + c] = letter
+            else:
+                incorrect.append((r, c))
+        for wi, answer in words:
+            if not 0 <= wi < len(index.word_cells):
+                raise ValueError(f"Indeks kata tidak dikenal: {wi}")
+            entries.update(zip(index.word_cells[wi], answer))
+
+        answers, cell_words = index.answers, index.cell_words
+        hits = [0] * len(index.word_cells)
+        correct = 0
+        for idx, letter in entries.items():
+            expected = answers[idx]
+            if expected != "." and (letter == expected or letter.upper() == expected):
+                correct += 1
+                for wi in cell_words[idx]:
+                    hits[wi] += 1
+            else:
+                incorrect.append(divmod(idx, width))
+        word_hits = {wi: n for wi, n in enumerate(hits) if n}
+        return CheckResult(correct=correct, incorrect=incorrect, word_hits=word_hits)
+
 
 @dataclass(frozen=True)
 class GameSession:
@@ -32,36 +133,238 @@ class GameSession:
     player_name: str
     started_at: datetime
     puzzle: Puzzle
+    # Jawaban dikirim ke klien saat /start; sesi seperti ini tidak masuk leaderboard
+    answers_revealed: bool = True
+    # Isian papan pemain; satu-satunya bagian sesi yang berubah
+    board: Optional[BoardState] = field(default=None, compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class BoardDelta:
+    version: int
+    full: bool
+    runs: List[Run]
 
 
 class CrosswordService:
-    """Layanan pemuatan puzzle dan manajemen sesi sederhana."""
+    """Layanan pemuatan puzzle dan manajemen sesi sederhana.
 
-    def __init__(self, puzzle_path: Path):
-        self._lock = RLock()
-        self._sessions: Dict[str, GameSession] = {}
-        self._puzzle = self._load_puzzle(puzzle_path)
+    Puzzle statis dimuat oleh ``load()`` (dipanggil lifespan aplikasi) atau
+    saat pertama kali dibutuhkan. Method ``a*`` adalah versi async untuk
+    handler: dijalankan langsung jika session store tidak memblokir (in-memory)
+    dan dipindah ke thread jika memblokir (SQLite).
+    """
+
+    # Batas pasangan (klien, nama pemain) yang diingat untuk pemakaian ulang sesi
+    MAX_RECENT_STARTS = 10_000
+
+    def __init__(
+        self,
+        puzzle_path: Path,
+        store: Optional[SessionStore] = None,
+        catalog: Optional[PuzzleCatalog] = None,
+        start_reuse_seconds: float = 0.0,
+    ):
+        self._sessions: SessionStore = store if store is not None else InMemorySessionStore()
+        self._puzzle_path = puzzle_path
+        self._puzzle: Optional[Puzzle] = None
+        self._catalog = catalog
+        self._catalog_cursor = count()
+        self._pool: Optional[PuzzlePool] = None
+        self._registry_lock = Lock()
+        # Puzzle dari pool, hidup selama masih ada sesi yang memegangnya
+        self._puzzles: "weakref.WeakValueDictionary[str, Puzzle]" = weakref.WeakValueDictionary()
+        self.leaderboard = Leaderboard()
+        self._start_reuse_seconds = start_reuse_seconds
+        # (klien, nama pemain) -> (session_id, waktu monotonic saat dibuat)
+        self._recent_starts: "OrderedDict[Tuple[str, str, bool], Tuple[str, float]]" = OrderedDict()
 
     @property
     def puzzle(self) -> Puzzle:
+        if self._puzzle is None:
+            self.load()
         return self._puzzle
 
-    def start_session(self, player_name: str) -> GameSession:
-        with self._lock:
-            session_id = uuid4().hex
-            session = GameSession(
-                session_id=session_id,
-                player_name=player_name,
-                started_at=datetime.now(timezone.utc),
-                puzzle=self._puzzle,
-            )
-            self._sessions[session_id] = session
-            return session
+    def load(self) -> Puzzle:
+        """Muat puzzle statis dari file jika belum; aman dipanggil berulang kali."""
+        with self._registry_lock:
+            if self._puzzle is None:
+                self._puzzle = self._load_puzzle(self._puzzle_path)
+        return self._puzzle
+
+    @property
+    def pool(self) -> Optional[PuzzlePool]:
+        return self._pool
+
+    def set_pool(self, pool: Optional[PuzzlePool]) -> None:
+        """Pakai pool puzzle untuk sesi baru; None kembali ke puzzle statis."""
+        self._pool = pool
+
+    def find_puzzle(self, puzzle_id: str) -> Puzzle | None:
+        if puzzle_id == self.puzzle.puzzle_id:
+            return self._puzzle
+        with self._registry_lock:
+            puzzle = self._puzzles.get(puzzle_id)
+        if puzzle is None and self._catalog is not None:
+            puzzle = self._catalog.find(puzzle_id)
+        if puzzle is None:
+            # Puzzle dari pool worker lain (atau yang sesinya sudah lepas dari memori proses ini)
+            puzzle = self._sessions.get_puzzle(puzzle_id)
+            if puzzle is not None:
+                with self._registry_lock:
+                    puzzle = self._puzzles.setdefault(puzzle_id, puzzle)
+        return puzzle
+
+    def _next_puzzle(self) -> Puzzle:
+        if self._pool is not None:
+            return self._pool.take()
+        if self._catalog is not None and len(self._catalog):
+            # Bergiliran melewati katalog; hanya record yang dipakai yang di-decode
+            return self._catalog.get(next(self._catalog_cursor) % len(self._catalog))
+        return self.puzzle
 
+    @timed("start_session")
+    def start_session(
+        self, player_name: str, client_key: Optional[str] = None, include_answers: bool = True
+    ) -> GameSession:
+        """Buat sesi baru, atau kembalikan sesi yang belum selesai milik klien dan nama yang sama.
+
+        Pemakaian ulang hanya berlaku jika ``client_key`` diisi dan sesi itu
+        dibuat kurang dari ``start_reuse_seconds`` yang lalu dengan
+        ``include_answers`` yang sama. Hanya sesi tanpa jawaban yang bisa
+        masuk leaderboard.
+        """
+        reuse_key = (client_key, player_name, include_answers) if client_key is not None and self._start_reuse_seconds > 0 else None
+        if reuse_key is not None:
+            session = self._recent_session(reuse_key)
+            if session is not None:
+                return session
+        puzzle = self._next_puzzle()
+        if puzzle is not self._puzzle and self._pool is not None:
+            # Hanya proses ini yang punya puzzle hasil pool; simpan agar worker lain bisa memuatnya
+            self._sessions.put_puzzle(puzzle)
+            with self._registry_lock:
+                self._puzzles[puzzle.puzzle_id] = puzzle
+        session = GameSession(
+            session_id=uuid4().hex,
+            player_name=player_name,
+            started_at=datetime.now(timezone.utc),
+            puzzle=puzzle,
+            answers_revealed=include_answers,
+            board=BoardState(puzzle.width * puzzle.height),
+        )
+        self._sessions.put(session)
+        if reuse_key is not None:
+            with self._registry_lock:
+                self._recent_starts[reuse_key] = (session.session_id, time.monotonic())
+                self._recent_starts.move_to_end(reuse_key)
+                if len(self._recent_starts) > self.MAX_RECENT_STARTS:
+                    self._recent_starts.popitem(last=False)
+        return session
+
+    def _recent_session(self, reuse_key: Tuple[str, str, bool]) -> GameSession | None:
+        with self._registry_lock:
+            recent = self._recent_starts.get(reuse_key)
+        if recent is None or time.monotonic() - recent[1] > self._start_reuse_seconds:
+            return None
+        session = self._sessions.get(recent[0])
+        if session is None or self.leaderboard.rank(session.puzzle.puzzle_id, session.session_id) is not None:
+            return None
+        return session
+
+    @timed("get_session")
     def get_session(self, session_id: str) -> GameSession | None:
-        with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
+
+    def sweep_sessions(self) -> int:
+        """Buang sesi yang sudah kedaluwarsa di session store, kembalikan jumlahnya."""
+        return self._sessions.sweep()
+
+    def session_stats(self) -> SessionStoreStats:
+        return self._sessions.stats()
+
+    def patch_board(self, session: GameSession, base_version: Optional[int], runs: List[Run]) -> int:
+        """Terapkan patch sel dari ``base_version``; lempar StaleBoardVersion jika usang.
+
+        ``base_version=None`` menerapkan patch di atas versi terbaru (dipakai
+        room co-op, tempat server yang menentukan urutan).
+        """
+        self.validate_runs(session, runs)
+        board = self._sessions.load_board(session)
+        with board.lock:
+            if base_version is not None and base_version != board.version:
+                raise StaleBoardVersion(board.version)
+            previous = board.version
+            version = board.apply((start, chunk.upper()) for start, chunk in runs)
+            if not self._sessions.save_board(session, board, previous):
+                # Worker lain menulis lebih dulu; muat ulang saat akses berikutnya
+                board.version = -1
+                raise StaleBoardVersion(previous + 1)
+            solved = board.cells == session.puzzle.answer_index.solution
+        if solved:
+            self.complete_session(session)
+        return version
+
+    def complete_session(
+        self, session: GameSession, completed_at: Optional[datetime] = None
+    ) -> Optional[LeaderboardEntry]:
+        """Catat sesi yang sudah terpecahkan di leaderboard puzzle-nya (sekali per sesi).
+
+        Sesi yang menerima jawaban saat dimulai tidak dicatat; hasilnya ``None``.
+        """
+        if session.answers_revealed:
+            return None
+        completed_at = completed_at or datetime.now(timezone.utc)
+        seconds = (completed_at - session.started_at).total_seconds()
+        return self.leaderboard.record(session.puzzle.puzzle_id, session.session_id, session.player_name, seconds)
+
+    def validate_runs(self, session: GameSession, runs: List[Run]) -> None:
+        """Lempar ValueError jika run keluar papan, mengenai sel hitam, atau hurufnya tidak valid."""
+        letters = session.puzzle.answer_index.answers
+        for start, chunk in runs:
+            if start < 0 or start + len(chunk) > len(letters):
+                raise ValueError(f"Run di luar papan: {start}")
+            for offset, ch in enumerate(chunk):
+                if letters[start + offset] == ".":
+                    raise ValueError(f"Sel {start + offset} bukan bagian dari puzzle")
+                if ch != "." and not (ch.isascii() and ch.isprintable() and ch != " "):
+                    raise ValueError(f"Huruf tidak valid: {ch!r}")
+
+    def board_changes(self, session: GameSession, since: Optional[int]) -> BoardDelta:
+        board = self._sessions.load_board(session)
+        with board.lock:
+            runs = board.changes_since(since) if since is not None else None
+            if runs is None:
+                return BoardDelta(version=board.version, full=True, runs=board.snapshot())
+            return BoardDelta(version=board.version, full=False, runs=runs)
+
+    async def astart_session(
+        self, player_name: str, client_key: Optional[str] = None, include_answers: bool = True
+    ) -> GameSession:
+        return await self._offload(self.start_session, player_name, client_key, include_answers)
+
+    async def aget_session(self, session_id: str) -> GameSession | None:
+        return await self._offload(self.get_session, session_id)
 
+    async def afind_puzzle(self, puzzle_id: str) -> Puzzle | None:
+        return await self._offload(self.find_puzzle, puzzle_id)
+
+    async def apatch_board(self, session: GameSession, base_version: Optional[int], runs: List[Run]) -> int:
+        return await self._offload(self.patch_board, session, base_version, runs)
+
+    async def aboard_changes(self, session: GameSession, since: Optional[int]) -> BoardDelta:
+        return await self._offload(self.board_changes, session, since)
+
+    async def asweep_sessions(self) -> int:
+        return await self._offload(self.sweep_sessions)
+
+    async def _offload(self, fn: Callable[..., T], *args) -> T:
+        # Operasi in-memory hanya butuh mikrodetik: lompatan ke thread lebih mahal daripada kerjanya
+        if self._sessions.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    @timed("_load_puzzle")
     def _load_puzzle(self, puzzle_path: Path) -> Puzzle:
         if not puzzle_path.exists():
             raise FileNotFoundError(f"File puzzle tidak ditemukan: {puzzle_path}")
@@ -70,52 +373,63 @@ class CrosswordService:
         with puzzle_path.open("r", encoding="utf8") as fh:
             data = json.load(fh)
 
-        raw_words: List[Dict] = data.get("words", [])
-        clues: List[str] = data.get("clues", [])
-
-        # Tentukan ukuran grid berdasarkan kata-kata
-        width = max((int(info.get("col", 0)) + len(str(info.get("word", ""))) for info in raw_words), default=0)
-        height = max((int(info.get("row", 0)) + len(str(info.get("word", ""))) for info in raw_words), default=0)
-
-        # Buat grid kosong
-        grid: List[List[str]] = [["." for _ in range(width)] for _ in range(height)]
-        placements: List[WordPlacement] = []
-
-        # Tempatkan kata-kata di grid
-        for idx, info in enumerate(raw_words):
-            answer = str(info.get("word", "")).upper()
-            direction = str(info.get("dir", "across")).strip().lower() or "across"
-            row_val = int(info.get("row", 0))
-            col_val = int(info.get("col", 0))
-            inline_clue = str(info.get("clue", "")).strip()
-            fallback_clue = clues[idx] if idx < len(clues) else ""
-            clue_text = inline_clue or fallback_clue
-
-            # Tempatkan setiap huruf, pastikan tidak bentrok
-            for offset, char in enumerate(answer):
-                r = row_val + (offset if direction == "down" else 0)
-                c = col_val + (offset if direction == "across" else 0)
-                existing = grid[r][c]
-                if existing == ".":
-                    grid[r][c] = char
-                elif existing != char:
-                    raise ValueError(
-                        f"Conflict di ({r},{c}) untuk kata '{answer}':"
-                        f" grid='{existing}' vs kata='{char}'"
-                    )
-
-            # Simpan posisi kata
-            placements.append(
-                WordPlacement(
-                    answer=answer,
-                    row=row_val,
-                    col=col_val,
-                    direction=direction,
-                    clue=clue_text,
+        return puzzle_from_export(data)
+
+
+def puzzle_from_export(data: Dict) -> Puzzle:
+    """Bangun Puzzle dari data ekspor generator (format export_json)."""
+    raw_words: List[Dict] = data.get("words", [])
+    clues: List[str] = data.get("clues", [])
+    grid_data: List[str] = data.get("gridData", [])
+
+    # Tentukan ukuran grid dari gridData (jika ada) dan jangkauan setiap kata sesuai arahnya
+    width = max((len(row) for row in grid_data), default=0)
+    height = len(grid_data)
+    for info in raw_words:
+        length = len(str(info.get("word", "")))
+        down = str(info.get("dir", "across")).strip().lower() == "down"
+        width = max(width, int(info.get("col", 0)) + (1 if down else length))
+        height = max(height, int(info.get("row", 0)) + (length if down else 1))
+
+    # Buat grid kosong
+    grid: List[List[str]] = [["." for _ in range(width)] for _ in range(height)]
+    placements: List[WordPlacement] = []
+
+    # Tempatkan kata-kata di grid
+    for idx, info in enumerate(raw_words):
+        answer = str(info.get("word", "")).upper()
+        direction = str(info.get("dir", "across")).strip().lower() or "across"
+        row_val = int(info.get("row", 0))
+        col_val = int(info.get("col", 0))
+        inline_clue = str(info.get("clue", "")).strip()
+        fallback_clue = clues[idx] if idx < len(clues) else ""
+        clue_text = inline_clue or fallback_clue
+
+        # Tempatkan setiap huruf, pastikan tidak bentrok
+        for offset, char in enumerate(answer):
+            r = row_val + (offset if direction == "down" else 0)
+            c = col_val + (offset if direction == "across" else 0)
+            existing = grid[r][c]
+            if existing == ".":
+                grid[r][c] = char
+            elif existing != char:
+                raise ValueError(
+                    f"Conflict di ({r},{c}) untuk kata '{answer}':"
+                    f" grid='{existing}' vs kata='{char}'"
                 )
+
+        # Simpan posisi kata
+        placements.append(
+            WordPlacement(
+                answer=answer,
+                row=row_val,
+                col=col_val,
+                direction=direction,
+                clue=clue_text,
             )
+        )
 
-        # Ubah grid menjadi list of strings
-        grid_str = ["".join(row) for row in grid]
+    # Ubah grid menjadi list of strings
+    grid_str = ["".join(row) for row in grid]
 
-        return Puzzle(width=width, height=height, grid=grid_str, words=placements)
+    return Puzzle(width=width, height=height, grid=grid_str, words=placements)
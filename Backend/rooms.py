@@ -0,0 +1,310 @@
+"""Room co-op: beberapa koneksi WebSocket berbagi papan satu sesi.
+
+Protokol (pesan teks JSON)::
+
+    klien -> server : {"type": "patch", "runs": [[indeks, "HURUF"], ...]}
+    server -> klien : {"type": "snapshot" | "update", "version": N, "runs": [[indeks, "HURUF"], ...]}
+                      {"type": "error", "message": "..."}
+
+Patch dari semua anggota dikumpulkan selama satu ``tick`` lalu diterapkan
+sekaligus; hasilnya diserialisasi sekali dan string yang sama dimasukkan ke
+antrean setiap koneksi. Antrean per koneksi dibatasi: konsumen yang lambat
+kehilangan pesan yang menumpuk dan menerima snapshot penuh sebagai gantinya,
+sehingga room tidak pernah menunggu satu socket.
+
+Akses papan lewat API async CrosswordService, jadi store SQLite tidak
+menahan event loop. Patch yang gagal ditulis (papan usang karena worker lain
+atau error database) dikembalikan ke antrean tertunda dan dicoba lagi,
+paling banyak ``MAX_FLUSH_FAILURES`` tick berturut-turut. Jika sesinya sudah
+tidak ada di store, room ditutup: patch dibuang, anggota menerima error dan
+koneksinya ditutup.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from board import Run, StaleBoardVersion
+from puzzle_service import CrosswordService, GameSession
+from session_store import SessionGone
+
+# Penanda di antrean: kirim snapshot terbaru, bukan pesan yang sudah dibuang
+_RESYNC = object()
+# Penanda di antrean: sesi sudah berakhir, tutup koneksi
+_CLOSE = object()
+# Percobaan ulang langsung saat worker lain menulis papan lebih dulu
+STALE_RETRIES = 3
+# Tick berturut-turut yang boleh gagal sebelum patch tertunda dibuang
+MAX_FLUSH_FAILURES = 5
+SESSION_ENDED = "Sesi sudah berakhir"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RoomStats:
+    rooms: int
+    members: int
+    broadcasts: int
+    messages_dropped: int
+    resyncs: int
+
+
+def encode_message(kind: str, version: int, runs: List[Run]) -> str:
+    return json.dumps({"type": kind, "version": version, "runs": runs}, separators=(",", ":"))
+
+
+def error_message(message: str) -> str:
+    return json.dumps({"type": "error", "message": message}, separators=(",", ":"))
+
+
+def coalesce_runs(cells: Dict[int, str]) -> List[Run]:
+    """Gabungkan sel yang tertunda (indeks -> huruf) menjadi run bersebelahan."""
+    runs: List[Run] = []
+    start = prev = -2
+    letters: List[str] = []
+    for idx in sorted(cells):
+        if idx != prev + 1:
+            if letters:
+                runs.append((start, "".join(letters)))
+            start, letters = idx, []
+        letters.append(cells[idx])
+        prev = idx
+    if letters:
+        runs.append((start, "".join(letters)))
+    return runs
+
+
+class RoomMember:
+    """Satu koneksi dalam room dengan antrean keluar yang dibatasi."""
+
+    __slots__ = ("queue", "_counters")
+
+    def __init__(self, queue_size: int, counters: Dict[str, int]):
+        self.queue: "asyncio.Queue[object]" = asyncio.Queue(maxsize=queue_size)
+        self._counters = counters
+
+    def offer(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Konsumen lambat: buang antrean dan minta snapshot saat ia sempat
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self._counters["dropped"] += 1
+            self._counters["dropped"] += 1
+            self._counters["resyncs"] += 1
+            self.queue.put_nowait(_RESYNC)
+
+
+class Room:
+    """Papan bersama satu sesi; semua metode dipanggil dari event loop yang sama."""
+
+    def __init__(
+        self,
+        service: CrosswordService,
+        session: GameSession,
+        tick: float,
+        queue_size: int,
+        counters: Dict[str, int],
+        on_closed: Optional[Callable[[Room], None]] = None,
+    ):
+        self.session = session
+        self.members: Set[RoomMember] = set()
+        self._service = service
+        self._tick = tick
+        self._queue_size = queue_size
+        self._counters = counters
+        self._pending: Dict[int, str] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        # Versi terakhir yang disiarkan; anggota baru dengan snapshot lebih lama diminta resync
+        self._version = 0
+        self._failures = 0
+        self._on_closed = on_closed
+        self.closed = False
+
+    async def join(self) -> RoomMember:
+        member = RoomMember(self._queue_size, self._counters)
+        delta = await self._service.aboard_changes(self.session, None)
+        self.members.add(member)
+        member.offer(encode_message("snapshot", delta.version, delta.runs))
+        if self._version > delta.version:
+            # Ada flush selama snapshot dibaca; siarannya tidak sampai ke anggota ini
+            member.offer(_RESYNC)
+        return member
+
+    def leave(self, member: RoomMember) -> None:
+        self.members.discard(member)
+
+    async def snapshot_message(self) -> str:
+        delta = await self._service.aboard_changes(self.session, None)
+        return encode_message("snapshot", delta.version, delta.runs)
+
+    def submit(self, runs: List[Run]) -> None:
+        """Validasi lalu tunda patch sampai tick berikutnya; lempar ValueError jika tidak valid."""
+        if self.closed:
+            raise ValueError(SESSION_ENDED)
+        self._service.validate_runs(self.session, runs)
+        pending = self._pending
+        for start, letters in runs:
+            for offset, letter in enumerate(letters.upper()):
+                pending[start + offset] = letter
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None and not self.closed:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._tick)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception:
+            self._failures += 1
+            logger.exception("Gagal menyimpan patch room %s", self.session.session_id)
+            if self._failures < MAX_FLUSH_FAILURES:
+                # Patch sudah dikembalikan ke antrean tertunda oleh flush(); coba lagi di tick berikutnya
+                self._schedule_flush()
+                return
+            # Menyerah: buang patch dan samakan anggota dengan papan yang tersimpan
+            self._failures = 0
+            self._pending.clear()
+            self.broadcast(error_message("Perubahan papan gagal disimpan"))
+            for member in self.members:
+                member.offer(_RESYNC)
+        else:
+            self._failures = 0
+
+    async def flush(self) -> None:
+        """Terapkan patch tertunda di atas versi papan terbaru lalu siarkan hasilnya.
+
+        Jika penulisan gagal, patch dikembalikan ke antrean (tanpa menimpa
+        patch yang masuk sesudahnya) dan error dilempar ulang.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            runs = coalesce_runs(pending)
+            try:
+                for attempt in range(STALE_RETRIES):
+                    try:
+                        version = await self._service.apatch_board(self.session, None, runs)
+                        break
+                    except StaleBoardVersion:
+                        # Worker lain menulis lebih dulu; papan dimuat ulang dan patch diterapkan lagi
+                        if attempt == STALE_RETRIES - 1:
+                            raise
+                delta = await self._service.aboard_changes(self.session, version - 1)
+            except SessionGone:
+                # Percobaan ulang tidak akan pernah berhasil; patch tertunda ikut dibuang
+                self._expire()
+                return
+            except BaseException:
+                pending.update(self._pending)
+                self._pending = pending
+                raise
+            if delta.runs:
+                self._version = max(self._version, delta.version)
+                self.broadcast(encode_message("snapshot" if delta.full else "update", delta.version, delta.runs))
+
+    def _expire(self) -> None:
+        self.closed = True
+        self._pending.clear()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        for member in self.members:
+            # Antrean dikosongkan agar penanda tutup selalu muat
+            while not member.queue.empty():
+                member.queue.get_nowait()
+            member.queue.put_nowait(_CLOSE)
+        if self._on_closed is not None:
+            self._on_closed(self)
+
+    def broadcast(self, message: str) -> None:
+        self._counters["broadcasts"] += 1
+        for member in self.members:
+            member.offer(message)
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        try:
+            await self.flush()
+        except Exception:
+            # Room sudah dilepas dari hub; task latar tetap mencoba menyimpan sisa patch
+            logger.exception("Gagal menyimpan patch room %s", self.session.session_id)
+            self._schedule_flush()
+
+    async def pump(
+        self,
+        member: RoomMember,
+        send: Callable[[str], Awaitable[None]],
+        close: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """Kirim isi antrean anggota ke socket-nya sampai dibatalkan atau sesinya berakhir."""
+        while True:
+            message = await member.queue.get()
+            if message is _CLOSE:
+                await send(error_message(SESSION_ENDED))
+                if close is not None:
+                    await close()
+                return
+            if message is _RESYNC:
+                message = await self.snapshot_message()
+            await send(message)
+
+
+class RoomHub:
+    """Registry room per sesi; room dibuat saat anggota pertama masuk."""
+
+    def __init__(self, service: CrosswordService, tick: float = 0.05, queue_size: int = 64):
+        if tick < 0 or queue_size < 1:
+            raise ValueError("tick tidak boleh negatif dan queue_size minimal 1")
+        self._service = service
+        self._tick = tick
+        self._queue_size = queue_size
+        self._rooms: Dict[str, Room] = {}
+        self._counters = {"broadcasts": 0, "dropped": 0, "resyncs": 0}
+
+    async def join(self, session: GameSession) -> Tuple[Room, RoomMember]:
+        while True:
+            room = self._rooms.get(session.session_id)
+            if room is None:
+                room = Room(self._service, session, self._tick, self._queue_size, self._counters, self._discard)
+                self._rooms[session.session_id] = room
+            member = await room.join()
+            if self._rooms.get(session.session_id) is room:
+                return room, member
+            # Anggota terakhir keluar selama snapshot dibaca dan room ini sudah dilepas; masuk ke room yang berlaku
+            room.leave(member)
+
+    def _discard(self, room: Room) -> None:
+        if self._rooms.get(room.session.session_id) is room:
+            del self._rooms[room.session.session_id]
+
+    async def leave(self, room: Room, member: RoomMember) -> None:
+        room.leave(member)
+        if not room.members and self._rooms.get(room.session.session_id) is room:
+            # Dilepas dari registry dulu agar anggota baru membuat room baru selama flush terakhir
+            del self._rooms[room.session.session_id]
+            # Patch yang masih tertunda tetap diterapkan sebelum room dibuang
+            await room.close()
+
+    def stats(self) -> RoomStats:
+        # Dibaca dari thread /metrics sementara event loop menambah/menghapus room: iterasi salinan
+        rooms = list(self._rooms.values())
+        return RoomStats(
+            rooms=len(rooms),
+            members=sum(len(room.members) for room in rooms),
+            broadcasts=self._counters["broadcasts"],
+            messages_dropped=self._counters["dropped"],
+            resyncs=self._counters["resyncs"],
+        )
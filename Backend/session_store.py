@@ -0,0 +1,496 @@
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+from board import BoardState
+
+if TYPE_CHECKING:
+    from puzzle_service import GameSession, Puzzle
+
+
+class SessionGone(LookupError):
+    """Sesi sudah tidak ada di penyimpanan (kedaluwarsa lalu disapu, atau dihapus)."""
+
+
+@dataclass(frozen=True)
+class SessionStoreStats:
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class SessionStore(ABC):
+    """Antarmuka penyimpanan sesi yang dipakai CrosswordService."""
+
+    # True jika operasi melakukan I/O yang memblokir; handler async lalu memindahkannya ke thread
+    blocking = False
+
+    @abstractmethod
+    def put(self, session: GameSession) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[GameSession]:
+        ...
+
+    @abstractmethod
+    def stats(self) -> SessionStoreStats:
+        ...
+
+    def sweep(self) -> int:
+        """Buang sesi kedaluwarsa, kembalikan jumlahnya; default: tidak ada yang dibuang."""
+        return 0
+
+    def __len__(self) -> int:
+        return self.stats().size
+
+    def load_board(self, session: GameSession) -> BoardState:
+        """Papan terbaru untuk sesi; default: papan yang melekat pada objek sesi."""
+        return session.board
+
+    def save_board(self, session: GameSession, board: BoardState, previous_version: int) -> bool:
+        """Simpan papan setelah patch; False jika versi di penyimpanan sudah berubah.
+
+        Lempar SessionGone jika sesinya sudah tidak ada di penyimpanan.
+        """
+        return True
+
+    def put_puzzle(self, puzzle: Puzzle) -> None:
+        """Simpan puzzle yang hanya dikenal proses ini; default: sesi in-memory sudah memegangnya."""
+
+    def get_puzzle(self, puzzle_id: str) -> Optional[Puzzle]:
+        """Puzzle yang disimpan lewat put_puzzle (mungkin oleh worker lain); None jika tidak ada."""
+        return None
+
+
+class _Shard:
+    __slots__ = ("lock", "entries", "hits", "misses", "evictions", "expirations", "last_sweep")
+
+    def __init__(self, now: float):
+        self.lock = Lock()
+        # session_id -> (sesi, waktu akses terakhir); urutan = urutan LRU
+        self.entries: "OrderedDict[str, Tuple[GameSession, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.last_sweep = now
+
+
+class InMemorySessionStore(SessionStore):
+    """Penyimpanan sesi in-memory dengan shard ber-lock, TTL idle, dan batas LRU.
+
+    Setiap shard punya lock sendiri sehingga akses ke sesi berbeda jarang saling
+    menunggu. Sesi kedaluwarsa dibuang saat dibaca (lazy) dan lewat sapuan
+    berkala per shard yang dipicu oleh operasi tulis.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 3600.0,
+        shards: int = 16,
+        sweep_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries minimal 1")
+        if shards < 1:
+            raise ValueError("shards minimal 1")
+        shards = min(shards, max_entries)
+        self._ttl = ttl_seconds
+        self._sweep_interval = sweep_interval
+        self._clock = clock
+        # Batas dibagi rata ke setiap shard (dibulatkan ke atas)
+        self._shard_capacity = -(-max_entries // shards)
+        now = clock()
+        self._shards: List[_Shard] = [_Shard(now) for _ in range(shards)]
+
+    def _shard_for(self, session_id: str) -> _Shard:
+        return self._shards[hash(session_id) % len(self._shards)]
+
+    def put(self, session: GameSession) -> None:
+        shard = self._shard_for(session.session_id)
+        now = self._clock()
+        with shard.lock:
+            if now - shard.last_sweep >= self._sweep_interval:
+                self._sweep_shard(shard, now)
+            shard.entries[session.session_id] = (session, now)
+            shard.entries.move_to_end(session.session_id)
+            while len(shard.entries) > self._shard_capacity:
+                shard.entries.popitem(last=False)
+                shard.evictions += 1
+
+    def get(self, session_id: str) -> Optional[GameSession]:
+        shard = self._shard_for(session_id)
+        now = self._clock()
+        with shard.lock:
+            entry = shard.entries.get(session_id)
+            if entry is None:
+                shard.misses += 1
+                return None
+            session, last_access = entry
+            if now - last_access > self._ttl:
+                del shard.entries[session_id]
+                shard.expirations += 1
+                shard.misses += 1
+                return None
+            shard.entries[session_id] = (session, now)
+            shard.entries.move_to_end(session_id)
+            shard.hits += 1
+            return session
+
+    def sweep(self) -> int:
+        """Buang semua sesi kedaluwarsa di seluruh shard, kembalikan jumlahnya."""
+        removed = 0
+        now = self._clock()
+        for shard in self._shards:
+            with shard.lock:
+                removed += self._sweep_shard(shard, now)
+        return removed
+
+    def _sweep_shard(self, shard: _Shard, now: float) -> int:
+        shard.last_sweep = now
+        removed = 0
+        # Entri terurut dari akses paling lama, jadi cukup berhenti di entri segar pertama
+        while shard.entries:
+            session_id, (_, last_access) = next(iter(shard.entries.items()))
+            if now - last_access <= self._ttl:
+                break
+            del shard.entries[session_id]
+            removed += 1
+        shard.expirations += removed
+        return removed
+
+    def stats(self) -> SessionStoreStats:
+        size = hits = misses = evictions = expirations = 0
+        for shard in self._shards:
+            with shard.lock:
+                size += len(shard.entries)
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+                expirations += shard.expirations
+        return SessionStoreStats(
+            size=size,
+            hits=hits,
+            misses=misses,
+            evictions=evictions,
+            expirations=expirations,
+        )
+
+
+class SQLiteSessionStore(SessionStore):
+    """Penyimpanan sesi di SQLite (mode WAL) yang bisa dibagi antar worker uvicorn.
+
+    Baris sesi hanya menyimpan ``puzzle_id``; objek puzzle diambil lewat
+    ``puzzle_resolver`` milik proses masing-masing. Puzzle yang tidak bisa
+    dibangun ulang oleh worker lain (hasil pool) disimpan di tabel
+    ``puzzles`` dengan kunci hash isinya. Di depannya ada cache
+    read-through in-process karena data sesi tidak berubah setelah dibuat;
+    papan pemain (kolom ``board``) selalu dicocokkan ulang dengan database.
+    ``last_access`` ditulis ulang paling sering sekali per ``touch_interval``
+    per sesi, termasuk saat sesi dilayani dari cache, agar sesi yang aktif di
+    satu worker tidak disapu worker lain.
+    """
+
+    blocking = True
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS sessions ("
+        " session_id TEXT PRIMARY KEY,"
+        " player_name TEXT NOT NULL,"
+        " started_at TEXT NOT NULL,"
+        " puzzle_id TEXT NOT NULL,"
+        " last_access REAL NOT NULL,"
+        " board BLOB,"
+        " board_version INTEGER NOT NULL DEFAULT 0,"
+        " answers_revealed INTEGER NOT NULL DEFAULT 1"
+        ")",
+        "CREATE INDEX IF NOT EXISTS sessions_last_access ON sessions(last_access)",
+        "CREATE INDEX IF NOT EXISTS sessions_puzzle_id ON sessions(puzzle_id)",
+        "CREATE TABLE IF NOT EXISTS puzzles ("
+        " puzzle_id TEXT PRIMARY KEY,"
+        " data TEXT NOT NULL,"
+        " created REAL NOT NULL"
+        ")",
+    )
+    # Kolom yang ditambahkan setelah skema awal, untuk database lama
+    _MIGRATIONS = {
+        "board": "ALTER TABLE sessions ADD COLUMN board BLOB",
+        "board_version": "ALTER TABLE sessions ADD COLUMN board_version INTEGER NOT NULL DEFAULT 0",
+        # Sesi lama dianggap sudah menerima jawaban agar tidak masuk leaderboard
+        "answers_revealed": "ALTER TABLE sessions ADD COLUMN answers_revealed INTEGER NOT NULL DEFAULT 1",
+    }
+    # Pernyataan tetap; sqlite3 menyimpan hasil kompilasinya per koneksi
+    _INSERT = (
+        "INSERT OR REPLACE INTO sessions"
+        " (session_id, player_name, started_at, puzzle_id, last_access, board, board_version, answers_revealed)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    _SELECT = (
+        "SELECT player_name, started_at, puzzle_id, last_access, answers_revealed"
+        " FROM sessions WHERE session_id = ?"
+    )
+    _SELECT_BOARD = "SELECT board, board_version FROM sessions WHERE session_id = ?"
+    # Menulis papan juga berarti sesi dipakai: last_access ikut diperbarui
+    _SAVE_BOARD = (
+        "UPDATE sessions SET board = ?, board_version = ?, last_access = ?"
+        " WHERE session_id = ? AND board_version = ?"
+    )
+    _EXISTS = "SELECT 1 FROM sessions WHERE session_id = ?"
+    _TOUCH = "UPDATE sessions SET last_access = ? WHERE session_id = ?"
+    _DELETE = "DELETE FROM sessions WHERE session_id = ?"
+    _SWEEP = "DELETE FROM sessions WHERE last_access < ?"
+    _COUNT = "SELECT COUNT(*) FROM sessions"
+    _INSERT_PUZZLE = "INSERT OR IGNORE INTO puzzles (puzzle_id, data, created) VALUES (?, ?, ?)"
+    _SELECT_PUZZLE = "SELECT data FROM puzzles WHERE puzzle_id = ?"
+    # Puzzle lebih tua dari TTL tanpa sesi; yang baru dibuat mungkin sesinya belum ditulis
+    _SWEEP_PUZZLES = (
+        "DELETE FROM puzzles WHERE created < ?"
+        " AND NOT EXISTS (SELECT 1 FROM sessions WHERE sessions.puzzle_id = puzzles.puzzle_id)"
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        puzzle_resolver: Callable[[str], Optional[Puzzle]],
+        ttl_seconds: float = 3600.0,
+        pool_size: int = 4,
+        cache_size: int = 1024,
+        cache_ttl: float = 30.0,
+        touch_interval: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size minimal 1")
+        self._path = Path(path)
+        self._resolve = puzzle_resolver
+        self._ttl = ttl_seconds
+        self._touch_interval = touch_interval
+        self._clock = clock
+        self._cache = InMemorySessionStore(max_entries=cache_size, ttl_seconds=cache_ttl)
+        # session_id -> last_access terakhir yang diketahui ada di database; LRU sebesar cache
+        self._touched: "OrderedDict[str, float]" = OrderedDict()
+        self._touched_limit = cache_size
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._counter_lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+            for column, statement in self._MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path,
+            timeout=5.0,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=32,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def put(self, session: GameSession) -> None:
+        now = self._clock()
+        with self._connection() as conn:
+            conn.execute(
+                self._INSERT,
+                (
+                    session.session_id,
+                    session.player_name,
+                    session.started_at.isoformat(),
+                    session.puzzle.puzzle_id,
+                    now,
+                    bytes(session.board.cells) if session.board is not None else None,
+                    session.board.version if session.board is not None else 0,
+                    int(session.answers_revealed),
+                ),
+            )
+        self._cache.put(session)
+        self._remember_touch(session.session_id, now)
+
+    def load_board(self, session: GameSession) -> BoardState:
+        with self._connection() as conn:
+            row = conn.execute(self._SELECT_BOARD, (session.session_id,)).fetchone()
+        board = session.board
+        if row is None:
+            return board
+        cells, version = row
+        with board.lock:
+            # Worker lain sudah mengubah papan: ambil isinya, log delta lokal tidak berlaku lagi
+            if version != board.version:
+                board.replace(cells if cells is not None else bytes(len(board.cells)), version)
+        return board
+
+    def save_board(self, session: GameSession, board: BoardState, previous_version: int) -> bool:
+        now = self._clock()
+        with self._connection() as conn:
+            updated = conn.execute(
+                self._SAVE_BOARD,
+                (bytes(board.cells), board.version, now, session.session_id, previous_version),
+            ).rowcount
+            if updated != 1 and conn.execute(self._EXISTS, (session.session_id,)).fetchone() is None:
+                raise SessionGone(session.session_id)
+        if updated == 1:
+            self._remember_touch(session.session_id, now)
+        return updated == 1
+
+    def put_puzzle(self, puzzle: Puzzle) -> None:
+        data = json.dumps(
+            [puzzle.width, puzzle.height, puzzle.grid, [asdict(w) for w in puzzle.words]],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        with self._connection() as conn:
+            conn.execute(self._INSERT_PUZZLE, (puzzle.puzzle_id, data, self._clock()))
+
+    def get_puzzle(self, puzzle_id: str) -> Optional[Puzzle]:
+        with self._connection() as conn:
+            row = conn.execute(self._SELECT_PUZZLE, (puzzle_id,)).fetchone()
+        if row is None:
+            return None
+        return _make_puzzle(json.loads(row[0]))
+
+    def get(self, session_id: str) -> Optional[GameSession]:
+        now = self._clock()
+        cached = self._cache.get(session_id)
+        if cached is not None:
+            if self._touch_due(session_id, now):
+                with self._connection() as conn:
+                    conn.execute(self._TOUCH, (now, session_id))
+            self._count(hit=True)
+            return cached
+
+        with self._connection() as conn:
+            row = conn.execute(self._SELECT, (session_id,)).fetchone()
+            if row is None:
+                self._count(hit=False)
+                return None
+            player_name, started_at, puzzle_id, last_access, answers_revealed = row
+            if now - last_access > self._ttl:
+                conn.execute(self._DELETE, (session_id,))
+                self._count(hit=False, expired=True)
+                return None
+            # Tulis ulang last_access secukupnya agar baca tidak selalu jadi tulis
+            self._remember_touch(session_id, last_access)
+            if self._touch_due(session_id, now):
+                conn.execute(self._TOUCH, (now, session_id))
+
+        puzzle = self._resolve(puzzle_id)
+        if puzzle is None:
+            self._count(hit=False)
+            return None
+        session = _make_session(
+            session_id, player_name, datetime.fromisoformat(started_at), puzzle, bool(answers_revealed)
+        )
+        self._cache.put(session)
+        self._count(hit=True)
+        return session
+
+    def sweep(self) -> int:
+        """Hapus sesi yang sudah idle melebihi TTL (dan puzzle yatimnya), kembalikan jumlah sesinya."""
+        cutoff = self._clock() - self._ttl
+        with self._connection() as conn:
+            removed = conn.execute(self._SWEEP, (cutoff,)).rowcount
+            conn.execute(self._SWEEP_PUZZLES, (cutoff,))
+        with self._counter_lock:
+            self._expirations += removed
+        return removed
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _remember_touch(self, session_id: str, last_access: float) -> None:
+        with self._counter_lock:
+            self._touched[session_id] = last_access
+            self._touched.move_to_end(session_id)
+            if len(self._touched) > self._touched_limit:
+                self._touched.popitem(last=False)
+
+    def _touch_due(self, session_id: str, now: float) -> bool:
+        """True (dan catat ``now``) jika last_access sesi perlu ditulis ulang sekarang."""
+        with self._counter_lock:
+            last = self._touched.get(session_id)
+            if last is not None and now - last < self._touch_interval:
+                return False
+        self._remember_touch(session_id, now)
+        return True
+
+    def _count(self, hit: bool, expired: bool = False) -> None:
+        with self._counter_lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+            if expired:
+                self._expirations += 1
+
+    def stats(self) -> SessionStoreStats:
+        with self._connection() as conn:
+            (size,) = conn.execute(self._COUNT).fetchone()
+        with self._counter_lock:
+            return SessionStoreStats(
+                size=size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=0,
+                expirations=self._expirations,
+            )
+
+
+def _make_puzzle(data: list) -> Puzzle:
+    from puzzle_service import Puzzle, WordPlacement
+
+    width, height, grid, words = data
+    return Puzzle(width=width, height=height, grid=grid, words=[WordPlacement(**w) for w in words])
+
+
+def _make_session(
+    session_id: str, player_name: str, started_at: datetime, puzzle: Puzzle, answers_revealed: bool = True
+) -> GameSession:
+    from puzzle_service import GameSession
+
+    return GameSession(
+        session_id=session_id,
+        player_name=player_name,
+        started_at=started_at,
+        puzzle=puzzle,
+        answers_revealed=answers_revealed,
+        # Versi -1 memaksa load_board membaca isi papan dari database
+        board=BoardState(puzzle.width * puzzle.height, version=-1),
+    )
@@ -0,0 +1,4 @@
+import os
+
+# Semua tes memanggil /start dari satu klien TestClient; batas per klien diuji terpisah
+os.environ.setdefault("START_CLIENT_BURST", "1000")
@@ -0,0 +1,100 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from admission import AdmissionController, AdmissionRejected
+from app import app
+
+client = TestClient(app)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_client_bucket_refills_and_reports_wait():
+    clock = FakeClock()
+    controller = AdmissionController(client_rate=2, client_burst=3, global_rate=0, max_in_flight=0, clock=clock)
+    for _ in range(3):
+        controller.acquire("a")
+        controller.release()
+    with pytest.raises(AdmissionRejected) as exc:
+        controller.acquire("a")
+    assert exc.value.reason == "client"
+    assert exc.value.retry_after == pytest.approx(0.5)
+    assert exc.value.retry_after_header == "1"
+
+    controller.acquire("b")  # klien lain punya bucket sendiri
+    controller.release()
+    clock.now += 0.5
+    controller.acquire("a")
+    controller.release()
+    assert controller.stats().rejected == {"in_flight": 0, "client": 1, "global": 0}
+
+
+def test_global_rejection_refunds_client_token():
+    clock = FakeClock()
+    controller = AdmissionController(client_rate=1, client_burst=2, global_rate=1, global_burst=1,
+                                     max_in_flight=0, clock=clock)
+    controller.acquire("a")
+    controller.release()
+    with pytest.raises(AdmissionRejected) as exc:
+        controller.acquire("b")
+    assert exc.value.reason == "global"
+    clock.now += 1
+    controller.acquire("a")
+    controller.release()
+    clock.now += 1
+    # Token "b" yang ditolak global tadi dikembalikan, jadi burst-nya masih penuh
+    controller.acquire("b")
+    controller.release()
+    clock.now += 1
+    controller.acquire("b")
+
+
+def test_in_flight_cap_and_bounded_client_map():
+    controller = AdmissionController(client_rate=1, global_rate=0, max_in_flight=2, max_clients=3)
+    controller.acquire("a")
+    controller.acquire("b")
+    with pytest.raises(AdmissionRejected) as exc:
+        controller.acquire("c")
+    assert exc.value.reason == "in_flight"
+    controller.release()
+    for key in "cdef":
+        controller.acquire(key)
+        controller.release()
+    assert controller.stats().clients == 3
+    assert controller.stats().in_flight == 1
+
+
+def test_start_returns_429_with_retry_after(monkeypatch):
+    controller = AdmissionController(client_rate=0.5, client_burst=1, global_rate=0)
+    monkeypatch.setattr(app_module, "admission", controller)
+    assert client.post("/start", json={"player_name": "Kilat"}).status_code == 200
+    response = client.post("/start", json={"player_name": "Kilat 2"})
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "2"
+    assert response.json() == {"detail": "Terlalu banyak permintaan, coba lagi nanti"}
+    assert client.get("/puzzle").status_code == 200  # route lain tidak dibatasi
+    assert controller.stats().in_flight == 0
+    assert 'crossword_admission_rejected_total{reason="client"}' in client.get("/metrics").text
+
+
+def test_start_reuses_unfinished_session_for_same_player():
+    body = {"player_name": "Ulang", "include_answers": False}
+    first = client.post("/start", json=body).json()
+    again = client.post("/start", json={**body, "embed_puzzle": False}).json()
+    assert again["session_id"] == first["session_id"]
+    assert client.post("/start", json={**body, "player_name": "Ulang Lain"}).json()["session_id"] != first["session_id"]
+    # Sesi tanpa jawaban tidak dipakai ulang untuk permintaan yang meminta jawaban
+    assert client.post("/start", json={"player_name": "Ulang"}).json()["session_id"] != first["session_id"]
+
+    puzzle = client.get(f"/puzzles/{first['puzzle_id']}").json()
+    words = [{"index": i, "answer": w["answer"]} for i, w in enumerate(puzzle["words"])]
+    assert client.post(f"/sessions/{first['session_id']}/check", json={"words": words}).json()["solved"]
+    # Sesi yang sudah selesai tidak dipakai ulang
+    assert client.post("/start", json=body).json()["session_id"] != first["session_id"]
@@ -38,3 +38,118 @@ def test_get_session_reuses_existing_session():
     data = response.json()
     assert data["session_id"] == session_id
     assert data["player_name"] == "Budi"
+
+
+def test_puzzle_served_with_etag_and_not_modified():
+    response = client.get("/puzzle")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    cached = client.get("/puzzle", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    stale = client.get("/puzzle", headers={"If-None-Match": '"lama"'})
+    assert stale.status_code == 200
+
+
+def test_session_response_embeds_cached_puzzle():
+    puzzle = client.get("/puzzle").json()
+    data = client.post("/start", json={"player_name": "Citra"}).json()
+    assert data["puzzle"] == puzzle
+
+
+def test_puzzle_can_hide_answers():
+    data = client.get("/puzzle", params={"include_answers": "false"}).json()
+    assert all("answer" not in word for word in data["words"])
+    assert all(word["length"] > 0 for word in data["words"])
+    assert not any(ch.isalpha() for row in data["grid"] for ch in row)
+
+    session = client.post("/start", json={"player_name": "Fajar", "include_answers": False}).json()
+    assert "answer" not in session["puzzle"]["words"][0]
+
+
+def test_check_reports_word_completion():
+    puzzle = client.get("/puzzle").json()
+    session_id = client.post("/start", json={"player_name": "Gita"}).json()["session_id"]
+    first = puzzle["words"][0]
+
+    cells = [
+        {"row": first["row"] + (i if first["direction"] == "down" else 0),
+         "col": first["col"] + (i if first["direction"] == "across" else 0),
+         "letter": ch.lower()}
+        for i, ch in enumerate(first["answer"])
+    ]
+    cells[-1]["letter"] = "#"
+    response = client.post(f"/sessions/{session_id}/check", json={"cells": cells})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["correct_cells"] == len(cells) - 1
+    assert len(data["incorrect_cells"]) == 1
+    assert data["words"][0] == {
+        "index": 0, "correct": len(cells) - 1, "length": len(cells), "complete": False,
+    }
+    assert data["solved"] is False
+
+    words = [{"index": i, "answer": w["answer"]} for i, w in enumerate(puzzle["words"])]
+    solved = client.post(f"/sessions/{session_id}/check", json={"words": words}).json()
+    assert solved["solved"] is True
+    assert solved["incorrect_cells"] == []
+    assert all(w["complete"] for w in solved["words"])
+
+
+def test_check_unknown_session_or_word():
+    assert client.post("/sessions/tidak-ada/check", json={}).status_code == 404
+    session_id = client.post("/start", json={"player_name": "Hana"}).json()["session_id"]
+    response = client.post(f"/sessions/{session_id}/check", json={"words": [{"index": 999, "answer": "X"}]})
+    assert response.status_code == 400
+
+
+def test_reference_only_session_and_immutable_puzzle_resource():
+    data = client.post("/start", json={"player_name": "Gita", "embed_puzzle": False}).json()
+    assert "puzzle" not in data
+    puzzle_id = data["puzzle_id"]
+
+    again = client.get(f"/sessions/{data['session_id']}", params={"embed_puzzle": "false"}).json()
+    assert again == data
+
+    response = client.get(f"/puzzles/{puzzle_id}")
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    assert response.json() == client.get("/puzzle").json()
+
+    cached = client.get(f"/puzzles/{puzzle_id}", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+    assert "immutable" in cached.headers["cache-control"]
+    assert client.get("/puzzles/tidak-ada").status_code == 404
+
+
+def test_compact_puzzle_matches_full_schema():
+    full = client.get("/puzzle").json()
+    compact = client.get("/puzzle", params={"format": "compact"}).json()
+    width = compact["width"]
+    assert [compact["grid"][r * width:(r + 1) * width] for r in range(compact["height"])] == full["grid"]
+    for i, word in enumerate(full["words"]):
+        assert (compact["rows"][i], compact["cols"][i], compact["lengths"][i]) == (word["row"], word["col"], word["length"])
+        assert compact["directions"][i] == ("D" if word["direction"] == "down" else "A")
+        assert (compact["answers"][i], compact["clues"][i]) == (word["answer"], word["clue"])
+
+    hidden = client.get("/puzzle", params={"format": "compact", "include_answers": "false"}).json()
+    assert "answers" not in hidden and not any(ch.isalpha() for ch in hidden["grid"])
+
+
+def test_puzzle_compression_negotiation():
+    plain = client.get("/puzzle", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+    gzipped = client.get("/puzzle", headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+    assert gzipped.headers["etag"] != plain.headers["etag"]
+    assert gzipped.json() == plain.json()
+    assert int(gzipped.headers["content-length"]) < len(plain.content)
+
+    refused = client.get("/puzzle", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
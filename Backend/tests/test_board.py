@@ -0,0 +1,63 @@
+from fastapi.testclient import TestClient
+
+from app import app
+from board import BoardState, encode_runs
+
+client = TestClient(app)
+
+
+def start_session(player_name):
+    # Nama berbeda per tes: /start dengan nama yang sama memakai ulang sesi yang belum selesai
+    data = client.post("/start", json={"player_name": player_name}).json()
+    return data["session_id"], data["puzzle"]
+
+
+def first_across_start(puzzle):
+    word = next(w for w in puzzle["words"] if w["direction"] == "across")
+    return word["row"] * puzzle["width"] + word["col"]
+
+
+def test_encode_runs_groups_adjacent_cells():
+    cells = bytearray(b"AB\0D")
+    assert encode_runs(cells, [0, 1, 2, 3]) == [(0, "AB.D")]
+    assert encode_runs(cells, [0, 3]) == [(0, "A"), (3, "D")]
+
+
+def test_changes_since_falls_back_when_log_is_short():
+    board = BoardState(4)
+    for i in range(BoardState.MAX_LOG + 2):
+        board.apply([(i % 4, "ABC"[i % 3])])
+    last = BoardState.MAX_LOG + 1
+    assert board.changes_since(board.version - 1) == [(last % 4, "ABC"[last % 3])]
+    assert board.changes_since(0) is None
+
+
+def test_patch_and_fetch_deltas():
+    session_id, puzzle = start_session("Indra")
+    start = first_across_start(puzzle)
+
+    response = client.patch(f"/sessions/{session_id}/board", json={"base_version": 0, "runs": [[start, "ab"]]})
+    assert response.status_code == 200
+    assert response.json() == {"version": 1}
+
+    board = client.get(f"/sessions/{session_id}/board").json()
+    assert board == {"version": 1, "full": True, "runs": [[start, "AB"]]}
+
+    client.patch(f"/sessions/{session_id}/board", json={"base_version": 1, "runs": [[start, "."]]})
+    delta = client.get(f"/sessions/{session_id}/board", params={"since": 1}).json()
+    assert delta == {"version": 2, "full": False, "runs": [[start, "."]]}
+    assert client.get(f"/sessions/{session_id}/board", params={"since": 2}).json()["runs"] == []
+
+
+def test_stale_version_and_invalid_cells_are_rejected():
+    session_id, puzzle = start_session("Joko")
+    start = first_across_start(puzzle)
+    client.patch(f"/sessions/{session_id}/board", json={"base_version": 0, "runs": [[start, "A"]]})
+
+    stale = client.patch(f"/sessions/{session_id}/board", json={"base_version": 0, "runs": [[start, "B"]]})
+    assert stale.status_code == 409
+    assert stale.json()["detail"]["version"] == 1
+
+    blocked = puzzle["grid"][0].index(".")
+    invalid = client.patch(f"/sessions/{session_id}/board", json={"base_version": 1, "runs": [[blocked, "A"]]})
+    assert invalid.status_code == 400
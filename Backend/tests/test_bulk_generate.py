@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from bulk_generate import find_conflicts, generate, load_vocabulary, puzzle_seed
+from puzzle_catalog import PuzzleCatalog, puzzles_from_file, write_catalog
+from puzzle_pool import generate_puzzle
+from puzzle_service import Puzzle, WordPlacement
+
+VOCABULARY = [
+    ("DOCKER", "Platform kontainer"),
+    ("CLOUD", "Komputasi via internet"),
+    ("TOKEN", "Unit autentikasi"),
+    ("CACHE", "Memori sementara"),
+    ("KUBERNETES", "Orkestrasi kontainer"),
+    ("SQL", "Bahasa kueri"),
+    ("DATABASE", "Kumpulan data terstruktur"),
+    ("FIREWALL", "Penyaring lalu lintas jaringan"),
+]
+
+
+def run(path, count, workers=2, **kwargs):
+    return generate(path, count, VOCABULARY, seed=7, width=12, height=12, max_words=6,
+                    workers=workers, chunk_size=3, **kwargs)
+
+
+def test_output_is_identical_for_any_worker_count(tmp_path):
+    run(tmp_path / "satu.jsonl", 10, workers=1)
+    run(tmp_path / "dua.jsonl", 10, workers=2)
+    assert (tmp_path / "satu.jsonl").read_bytes() == (tmp_path / "dua.jsonl").read_bytes()
+
+
+def test_records_are_compact_and_match_generator(tmp_path):
+    path = tmp_path / "puzzles.jsonl"
+    stats = run(path, 6)
+    lines = path.read_text(encoding="utf8").splitlines()
+    assert len(lines) == stats.written
+    assert stats.written + stats.duplicates + stats.rejected == 6
+    first = json.loads(lines[0])
+    assert ", " not in lines[0] and "\n" not in lines[0]
+    expected, _ = generate_puzzle(puzzle_seed(7, first["index"]), VOCABULARY, 12, 12, 6)
+    assert next(puzzles_from_file(path)).puzzle_id == first["id"] == expected.puzzle_id
+
+
+def test_resume_truncates_partial_line_and_continues(tmp_path):
+    full = tmp_path / "penuh.jsonl"
+    run(full, 12)
+    partial = tmp_path / "sebagian.jsonl"
+    run(partial, 5)
+    with partial.open("a", encoding="utf8") as fh:
+        fh.write('{"index":5,"seed":')
+
+    stats = run(partial, 12)
+    assert stats.resumed_from > 0
+    assert partial.read_bytes() == full.read_bytes()
+
+
+def test_resume_rejects_different_seed(tmp_path):
+    path = tmp_path / "puzzles.jsonl"
+    run(path, 3)
+    with pytest.raises(ValueError):
+        generate(path, 6, VOCABULARY, seed=8, width=12, height=12, max_words=6, workers=1)
+
+
+def test_find_conflicts_detects_mismatched_grid():
+    word = WordPlacement(answer="SQL", row=0, col=0, direction="across", clue="Bahasa kueri")
+    assert find_conflicts(Puzzle(width=3, height=1, grid=["SQL"], words=[word])) == []
+    problems = find_conflicts(Puzzle(width=4, height=1, grid=["SQXA"], words=[word]))
+    assert any("conflict di (0,2)" in p for p in problems)
+    assert any("tidak milik kata" in p for p in problems)
+    outside = WordPlacement(answer="SQL", row=0, col=2, direction="across", clue="x")
+    assert find_conflicts(Puzzle(width=3, height=1, grid=["..S"], words=[outside]))
+
+
+def test_vocabulary_from_clue_map_and_catalog_roundtrip(tmp_path):
+    clues = tmp_path / "clues.json"
+    clues.write_text(json.dumps(dict(VOCABULARY)), encoding="utf8")
+    assert sorted(load_vocabulary([clues])) == sorted(VOCABULARY)
+
+    path = tmp_path / "puzzles.jsonl"
+    stats = run(path, 4)
+    assert write_catalog(tmp_path / "rilis.xwc", puzzles_from_file(path)) == stats.written
+    with PuzzleCatalog(tmp_path / "rilis.xwc") as catalog:
+        assert [p.puzzle_id for p in catalog] == [json.loads(l)["id"] for l in path.read_text().splitlines()]
@@ -0,0 +1,61 @@
+import json
+
+from clue_cache import ClueCache, JsonClueStore
+
+
+class StubProvider:
+    def __init__(self, clues=None, fail=False):
+        self.clues = clues or {}
+        self.fail = fail
+        self.calls = []
+
+    def fetch(self, words):
+        self.calls.append(list(words))
+        if self.fail:
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+        return {w.upper(): self.clues[w.upper()] for w in words if w.upper() in self.clues}
+
+
+def test_only_missing_words_are_batched_to_provider(tmp_path):
+    path = tmp_path / "clues.json"
+    path.write_text(json.dumps({"API": "Antarmuka pemrograman aplikasi"}), encoding="utf8")
+    provider = StubProvider({"CLOUD": "Komputasi lewat internet", "CI/CD": "Integrasi dan rilis otomatis"})
+    cache = ClueCache(JsonClueStore(path), provider)
+
+    clues = cache.get_many(["Cloud", "API", "CI/CD"])
+    assert list(clues) == ["CLOUD", "API", "CI_CD"]  # urutan input, bukan hit dulu
+    assert clues == {
+        "API": "Antarmuka pemrograman aplikasi",
+        "CLOUD": "Komputasi lewat internet",
+        "CI_CD": "Integrasi dan rilis otomatis",
+    }
+    assert provider.calls == [["Cloud", "CI/CD"]]
+
+    assert list(cache.get_many(["cloud", "API"])) == ["CLOUD", "API"]
+    assert len(provider.calls) == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.disk_hits, stats.misses) == (2, 1, 2)
+    assert stats.provider_calls == 1 and stats.provider_words == 2
+
+
+def test_store_is_persisted_and_reloaded(tmp_path):
+    path = tmp_path / "clues.json"
+    ClueCache(JsonClueStore(path), StubProvider({"GIT": "Kontrol versi terdistribusi"})).get_many(["Git"])
+
+    provider = StubProvider()
+    clues = ClueCache(JsonClueStore(path), provider).get_many(["Git"])
+    assert clues == {"GIT": "Kontrol versi terdistribusi"}
+    assert provider.calls == []
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_pending_placeholders_are_never_cached(tmp_path):
+    path = tmp_path / "clues.json"
+    failing = StubProvider(fail=True)
+    cache = ClueCache(JsonClueStore(path), failing)
+
+    assert cache.get_many(["Docker"]) == {"DOCKER": "Clue pending: Docker"}
+    assert cache.get_many(["Docker"]) == {"DOCKER": "Clue pending: Docker"}
+    assert len(failing.calls) == 2
+    assert cache.stats().provider_errors == 2
+    assert not path.exists()
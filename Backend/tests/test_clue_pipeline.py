@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from clue_pipeline import CluePipeline, PipelineClueProvider, TokenBucket
+
+
+class FakeProvider:
+    """Provider lokal dengan latensi dan kegagalan yang bisa diatur."""
+
+    def __init__(self, latency=0.0, fail_first=0, drop=()):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.drop = set(drop)
+        self.calls = []
+
+    async def fetch(self, words):
+        self.calls.append(list(words))
+        call_number = len(self.calls)
+        await asyncio.sleep(self.latency)
+        if call_number <= self.fail_first:
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+        result = {}
+        for w in words:
+            if w in self.drop:
+                self.drop.discard(w)
+                continue
+            result[w.upper()] = f"Definisi {w}"
+        return result
+
+
+async def no_sleep(_):
+    return None
+
+
+def test_chunks_retry_independently_and_merge():
+    words = [f"kata{i}" for i in range(25)]
+    provider = FakeProvider(fail_first=2, drop={"kata3"})
+    pipeline = CluePipeline(provider, chunk_size=10, rate_per_second=1000, sleep=no_sleep, seed=1)
+    partials = []
+
+    clues = asyncio.run(pipeline.run(words, on_partial=partials.append))
+
+    assert clues == {f"KATA{i}": f"Definisi kata{i}" for i in range(25)}
+    stats = pipeline.last_stats
+    assert stats.chunks == 3
+    assert stats.retries == 3  # dua chunk gagal 429, satu chunk mengulang kata yang hilang
+    assert stats.pending_words == 0
+    assert sum(len(p) for p in partials) == 25
+
+
+def test_exhausted_retries_leave_only_that_chunk_pending():
+    provider = FakeProvider(fail_first=100)
+    pipeline = CluePipeline(provider, chunk_size=2, max_retries=1, rate_per_second=1000, sleep=no_sleep)
+
+    clues = asyncio.run(pipeline.run(["API", "Git"]))
+
+    assert clues == {"API": "Clue pending: API", "GIT": "Clue pending: Git"}
+    assert pipeline.last_stats.failed_chunks == 1
+    assert len(provider.calls) == 2
+
+
+def test_chunks_run_concurrently():
+    provider = FakeProvider(latency=0.05)
+    pipeline = CluePipeline(provider, chunk_size=5, concurrency=8, rate_per_second=1000)
+
+    clues = PipelineClueProvider(pipeline).fetch([f"w{i}" for i in range(40)])
+
+    assert len(clues) == 40
+    assert pipeline.last_stats.elapsed_ms < 8 * 50
+
+
+def test_token_bucket_limits_rate():
+    async def take(n):
+        bucket = TokenBucket(rate=50, capacity=1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(n):
+            await bucket.acquire()
+        return loop.time() - started
+
+    assert asyncio.run(take(6)) >= 0.09
+
+
+def test_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_pipeline_provider_works_inside_running_loop():
+    async def scenario():
+        provider = PipelineClueProvider(CluePipeline(FakeProvider(), rate_per_second=1000))
+        return provider.fetch(["Git"]), await provider.afetch(["SQL"])
+
+    assert asyncio.run(scenario()) == ({"GIT": "Definisi Git"}, {"SQL": "Definisi SQL"})
+
+
+def test_generate_clues_retries_through_pipeline(monkeypatch):
+    import clue_pipeline
+    import crossword_geminiai
+
+    provider = FakeProvider(fail_first=1)
+    monkeypatch.setattr(crossword_geminiai, "_client", object())
+    monkeypatch.setattr(clue_pipeline, "AsyncGeminiClueProvider", lambda: provider)
+
+    # Satu 429 hanya mengulang potongannya, bukan membuat semua clue "Clue pending"
+    clues = crossword_geminiai.generate_clues(["API", "CI/CD"])
+    assert clues == {"API": "Definisi API", "CI_CD": "Definisi CI/CD"}
+    assert len(provider.calls) == 2
@@ -0,0 +1,136 @@
+import json
+import random
+
+import pytest
+
+import crossword_geminiai
+from crossword_geminiai import BacktrackingCrossword, SmartCrossword
+
+WORDS = [
+    "API", "CLOUD", "DOCKER", "KUBERNETES", "TOKEN", "DEVOPS", "CACHE", "SQL",
+    "FRONTEND", "BACKEND", "GIT", "CI_CD", "MICROSERVICE", "VIRTUALIZATION",
+    "CONTAINER", "SERVERLESS", "DATABASE", "FIREWALL", "ENCRYPTION", "LOADBALANCER",
+]
+
+
+class ScanCrossword(SmartCrossword):
+    """Pencarian penuh versi lama, dipakai sebagai pembanding."""
+
+    def find_best_positions(self, word):
+        best_positions = []
+        max_overlap = 0
+        word = word.upper()
+        for r in range(self.h):
+            for c in range(self.w):
+                for d in ["across", "down"]:
+                    if not self.can_place(word, r, c, d):
+                        continue
+                    overlap = sum(
+                        1 for i, ch in enumerate(word)
+                        if (self.grid[r+i][c] if d == "down" else self.grid[r][c+i]) == ch
+                    )
+                    if overlap >= max_overlap:
+                        if overlap > max_overlap:
+                            best_positions.clear()
+                            max_overlap = overlap
+                        best_positions.append((r, c, d, overlap))
+        return best_positions
+
+
+def build_layout(cls, size, seed):
+    random.seed(seed)
+    cw = cls(size, size)
+    cw.build(WORDS)
+    return cw.words, cw.grid
+
+
+@pytest.mark.parametrize("size", [15, 21])
+@pytest.mark.parametrize("seed", range(5))
+def test_indexed_search_matches_full_scan(size, seed):
+    assert build_layout(SmartCrossword, size, seed) == build_layout(ScanCrossword, size, seed)
+
+
+def test_letter_index_tracks_placed_cells():
+    cw = SmartCrossword(5, 5)
+    cw.place("CAT", 0, 0, "across")
+    cw.place("AXE", 0, 1, "down")
+
+    assert cw.letter_cells["A"] == {1}
+    assert cw.letter_cells["X"] == {6}
+    assert cw.cells[6] != 0 and cw.cells[7] == 0
+    assert cw.find_best_positions("TEN") == [
+        (0, 2, "across", 1), (0, 2, "down", 1), (2, 0, "across", 1),
+    ]
+
+
+def grid_runs(grid):
+    """Semua deretan huruf sepanjang >= 2 secara mendatar dan menurun."""
+    lines = ["".join(ch or "." for ch in row) for row in grid]
+    lines += ["".join(col) for col in zip(*lines)]
+    return sorted(run for line in lines for run in line.split(".") if len(run) > 1)
+
+
+def test_backtracking_layout_obeys_adjacency_rules():
+    cw = BacktrackingCrossword(15, 15, seed=3, time_budget=60, node_budget=300)
+    score = cw.build(WORDS)
+
+    assert score.placed == len(cw.words) > 10
+    assert sorted(itm["word"] for itm in cw.words) == grid_runs(cw.grid)
+    assert sorted(cw.unplaced + [itm["word"] for itm in cw.words]) == sorted(WORDS)
+    assert score.intersections >= score.placed - 1
+
+
+def test_backtracking_is_deterministic_under_node_budget():
+    layouts = []
+    for _ in range(2):
+        cw = BacktrackingCrossword(13, 13, seed=11, time_budget=60, node_budget=200)
+        cw.build(WORDS)
+        layouts.append(cw.words)
+    assert layouts[0] == layouts[1]
+
+
+class ExhaustiveCrossword(BacktrackingCrossword):
+    """Backtracking tanpa pemangkasan batas atas, dipakai sebagai pembanding."""
+
+    def _can_beat_best(self, remaining):
+        return True
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_backtracking_prune_never_loses_placed_words(seed):
+    # Kata acak dengan sedikit huruf bersama: kata baru bisa bersilang setelah kata lain dipasang
+    rng = random.Random(seed)
+    words = list(dict.fromkeys(
+        "".join(rng.choice("ABCDEFGHIKLMNOPRSTU") for _ in range(rng.randint(3, 8)))
+        for _ in range(7)
+    ))
+    results = []
+    for cls in (BacktrackingCrossword, ExhaustiveCrossword):
+        cw = cls(9, 9, seed=seed, time_budget=60, node_budget=10**7, max_candidates=100)
+        results.append(cw.build(words).placed)
+    assert results[0] == results[1]
+
+
+def test_gemini_client_requires_key_only_when_used(monkeypatch):
+    import dotenv
+
+    monkeypatch.setattr(crossword_geminiai, "_client", None)
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *args, **kwargs: False)
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        crossword_geminiai.get_client()
+
+
+def test_export_json_pairs_clues_with_words_by_position(tmp_path):
+    from puzzle_service import puzzle_from_export
+
+    cw = SmartCrossword(12, 12)
+    cw.build(["CLOUD", "DOCKER", "CI_CD"])
+    # Urutan dict sengaja berbeda dari cw.words; kunci boleh kata tampilan
+    clues = {"CI/CD": "Rilis otomatis", "DOCKER": "Platform kontainer", "CLOUD": "Komputasi via internet"}
+    path = tmp_path / "puzzle.json"
+    crossword_geminiai.export_json(str(path), cw, clues)
+
+    expected = {"CLOUD": "Komputasi via internet", "DOCKER": "Platform kontainer", "CI_CD": "Rilis otomatis"}
+    puzzle = puzzle_from_export(json.loads(path.read_text(encoding="utf8")))
+    assert {w.answer: w.clue for w in puzzle.words} == {w["word"]: expected[w["word"]] for w in cw.words}
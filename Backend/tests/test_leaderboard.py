@@ -0,0 +1,97 @@
+import random
+from bisect import bisect_left
+
+from fastapi.testclient import TestClient
+
+from app import app
+from leaderboard import Leaderboard, SortedKeyList
+
+client = TestClient(app)
+
+
+def test_sorted_key_list_matches_sorted_reference():
+    keys = SortedKeyList(load=4)
+    reference = []
+    rng = random.Random(3)
+    for seq in range(500):
+        key = (rng.randrange(50), seq, f"s{seq}")
+        assert keys.add(key) == bisect_left(reference, key)
+        reference.insert(bisect_left(reference, key), key)
+    for probe in range(52):
+        assert keys.index((probe,)) == bisect_left(reference, (probe,))
+    assert keys.head(7) == reference[:7]
+    assert len(keys) == 500
+
+
+def test_ties_share_rank_and_top_cache_follows_inserts():
+    board = Leaderboard()
+    board.record("p", "a", "Ana", 30.0)
+    board.record("p", "b", "Budi", 10.0)
+    board.record("p", "c", "Citra", 30.0)
+    top = board.top("p", 3)
+    assert [(e.player_name, e.rank) for e in top] == [("Budi", 1), ("Ana", 2), ("Citra", 2)]
+    assert board.top("p", 3) is top
+
+    # Sisipan di luar jangkauan top-1 tidak membuang cache top-1
+    top1 = board.top("p", 1)
+    board.record("p", "d", "Dewi", 20.0)
+    assert board.top("p", 1) is top1
+    assert [e.player_name for e in board.top("p", 3)] == ["Budi", "Dewi", "Ana"]
+    assert board.rank("p", "c").rank == 3
+
+    # Sesi yang sudah tercatat tidak berubah peringkatnya
+    assert board.record("p", "b", "Budi", 99.0).seconds == 10.0
+    assert board.total("p") == 4
+
+
+def start_ranked(player_name):
+    """Mulai sesi tanpa jawaban (bisa masuk leaderboard), kembalikan id sesi dan puzzle lengkapnya."""
+    data = client.post("/start", json={"player_name": player_name, "include_answers": False}).json()
+    assert "answer" not in data["puzzle"]["words"][0]
+    return data["session_id"], client.get(f"/puzzles/{data['puzzle_id']}").json()
+
+
+def solve(session_id, puzzle):
+    words = [{"index": i, "answer": w["answer"]} for i, w in enumerate(puzzle["words"])]
+    return client.post(f"/sessions/{session_id}/check", json={"words": words}).json()
+
+
+def test_solving_records_rank():
+    session_id, puzzle = start_ranked("Juara")
+    assert client.get(f"/leaderboard/rank/{session_id}").status_code == 404
+
+    assert solve(session_id, puzzle)["solved"] is True
+    rank = client.get(f"/leaderboard/rank/{session_id}").json()
+    assert rank["rank"] >= 1 and rank["total"] >= 1
+
+    board = client.get("/leaderboard", params={"limit": 100}).json()
+    assert board["puzzle_id"] == rank["puzzle_id"]
+    assert any(e["player_name"] == "Juara" for e in board["entries"])
+    assert "session_id" not in board["entries"][0]
+
+
+def test_filling_board_completes_session():
+    session_id, puzzle = start_ranked("Pengetik")
+    runs = []
+    for word in puzzle["words"]:
+        step = puzzle["width"] if word["direction"] == "down" else 1
+        start = word["row"] * puzzle["width"] + word["col"]
+        runs.extend([start + i * step, ch] for i, ch in enumerate(word["answer"]))
+    response = client.patch(f"/sessions/{session_id}/board", json={"base_version": 0, "runs": runs})
+    assert response.status_code == 200
+    assert client.get(f"/leaderboard/rank/{session_id}").status_code == 200
+
+
+def test_session_given_answers_is_not_ranked():
+    data = client.post("/start", json={"player_name": "Pengintip"}).json()
+    session_id = data["session_id"]
+    assert solve(session_id, data["puzzle"])["solved"] is True
+    assert client.get(f"/leaderboard/rank/{session_id}").status_code == 404
+    board = client.get("/leaderboard", params={"limit": 100}).json()
+    assert all(e["player_name"] != "Pengintip" for e in board["entries"])
+
+
+def test_ranked_session_never_returns_answers():
+    session_id, _ = start_ranked("Rahasia")
+    data = client.get(f"/sessions/{session_id}", params={"include_answers": True}).json()
+    assert "answer" not in data["puzzle"]["words"][0]
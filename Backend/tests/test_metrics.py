@@ -0,0 +1,48 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+from app import app
+from metrics import Registry
+
+client = TestClient(app)
+
+
+def test_histogram_sums_buckets_from_all_threads():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latensi.", ("route",), buckets=(0.1, 1.0))
+    child = histogram.labels("/x")
+
+    def observe():
+        for value in (0.05, 0.5, 5.0):
+            child.observe(value)
+
+    threads = [threading.Thread(target=observe) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = registry.render()
+    assert '# TYPE latency_seconds histogram' in text
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 4' in text
+    assert 'latency_seconds_bucket{route="/x",le="1"} 8' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 12' in text
+    assert 'latency_seconds_count{route="/x"} 12' in text
+    assert 'latency_seconds_sum{route="/x"} 22.2' in text
+
+
+def test_metrics_endpoint_reports_routes_and_gauges():
+    session_id = client.post("/start", json={"player_name": "Metrik"}).json()["session_id"]
+    client.get(f"/sessions/{session_id}")
+    client.get("/sessions/tidak-ada")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert 'http_requests_total{method="GET",route="/sessions/{session_id}",status="404"}' in text
+    assert 'http_request_duration_seconds_count{method="POST",route="/start"}' in text
+    assert 'crossword_function_duration_seconds_count{function="start_session"}' in text
+    assert "crossword_sessions " in text
+    assert session_id not in text
@@ -0,0 +1,64 @@
+import pytest
+
+from app import PUZZLE_FILE
+from puzzle_catalog import PuzzleCatalog, decode_puzzle, encode_puzzle, puzzles_from_file, write_catalog
+from puzzle_service import CrosswordService, Puzzle, WordPlacement
+
+BASE_DIR = PUZZLE_FILE.parent
+
+SMALL = Puzzle(
+    width=3,
+    height=3,
+    grid=["CAT", ".X.", ".E."],
+    words=[
+        WordPlacement(answer="CAT", row=0, col=0, direction="across", clue="Hewan peliharaan"),
+        WordPlacement(answer="AXE", row=0, col=1, direction="down", clue="Kapak — alat potong"),
+    ],
+)
+
+
+def test_record_roundtrip():
+    assert decode_puzzle(encode_puzzle(SMALL)) == SMALL
+
+
+def test_converts_json_and_csv_exports(tmp_path):
+    path = tmp_path / "katalog.xwc"
+    sources = [BASE_DIR / "crossword_words_15x15.json", BASE_DIR / "crossword_words_15x15.csv"]
+    expected = [p for src in sources for p in puzzles_from_file(src)]
+
+    assert write_catalog(path, iter(expected)) == 2
+    with PuzzleCatalog(path) as catalog:
+        assert len(catalog) == 2
+        assert list(catalog) == expected
+        assert catalog.find(expected[1].puzzle_id) == expected[1]
+        assert catalog.find("0" * 32) is None
+        with pytest.raises(IndexError):
+            catalog.get(2)
+
+
+def test_decoded_puzzles_are_cached_lazily(tmp_path):
+    path = tmp_path / "katalog.xwc"
+    write_catalog(path, [SMALL] * 3)
+    with PuzzleCatalog(path, cache_size=2) as catalog:
+        first = catalog.get(0)
+        assert catalog.get(0) is first
+        catalog.get(1)
+        catalog.get(2)
+        assert catalog.get(0) is not first
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "bukan.xwc"
+    path.write_bytes(b"\0" * 32)
+    with pytest.raises(ValueError):
+        PuzzleCatalog(path)
+
+
+def test_service_rotates_through_catalog(tmp_path):
+    path = tmp_path / "katalog.xwc"
+    write_catalog(path, puzzles_from_file(BASE_DIR / "crossword_words_15x15.csv"))
+    with PuzzleCatalog(path) as catalog:
+        service = CrosswordService(PUZZLE_FILE, catalog=catalog)
+        session = service.start_session("Eka")
+        assert session.puzzle == catalog.get(0)
+        assert service.find_puzzle(session.puzzle.puzzle_id) == session.puzzle
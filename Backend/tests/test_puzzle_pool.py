@@ -0,0 +1,133 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from puzzle_pool import PuzzlePool, generate_puzzle
+from puzzle_service import Puzzle
+
+VOCABULARY = [
+    ("DOCKER", "Platform kontainer"),
+    ("CLOUD", "Komputasi via internet"),
+    ("TOKEN", "Unit autentikasi"),
+    ("CACHE", "Memori sementara"),
+    ("KUBERNETES", "Orkestrasi kontainer"),
+    ("SQL", "Bahasa kueri"),
+]
+FALLBACK = Puzzle(width=1, height=1, grid=["A"], words=[])
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timeout menunggu pool"
+        time.sleep(0.01)
+
+
+def test_generate_puzzle_is_deterministic_per_seed():
+    first, _ = generate_puzzle(42, VOCABULARY, 12, 12, 5)
+    second, _ = generate_puzzle(42, VOCABULARY, 12, 12, 5)
+    assert first == second
+    assert len(first.words) == 5
+    assert all(w.clue for w in first.words)
+
+
+def test_take_falls_back_without_blocking_when_empty():
+    pool = PuzzlePool(FALLBACK, VOCABULARY, high_watermark=4, low_watermark=1)
+    assert pool.take() is FALLBACK
+    assert pool.stats().fallbacks == 1
+
+
+def test_pool_refills_between_watermarks():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pool = PuzzlePool(
+            FALLBACK, VOCABULARY, high_watermark=4, low_watermark=2,
+            width=12, height=12, max_words=5, executor=executor, seed=1,
+        )
+        pool.start()
+        wait_for(lambda: pool.stats().depth == 4)
+
+        taken = [pool.take() for _ in range(3)]
+        assert all(p is not FALLBACK for p in taken)
+        assert len({p.puzzle_id for p in taken}) == 3
+        wait_for(lambda: pool.stats().depth == 4)
+
+        stats = pool.stats()
+        assert stats.served == 3
+        assert stats.generated == 7
+        assert stats.avg_generation_ms > 0
+        pool.close()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_small_pool_keeps_refilling(size):
+    from metrics import REGISTRY
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Sama seperti lifespan app: low_watermark = size // 4 = 0
+        pool = PuzzlePool(
+            FALLBACK, VOCABULARY, high_watermark=size, low_watermark=size // 4,
+            width=12, height=12, max_words=5, executor=executor, seed=2,
+        )
+        pool.start()
+        for _ in range(size * 3):
+            wait_for(lambda: pool.stats().depth >= 1)
+            assert pool.take() is not FALLBACK
+        assert pool.stats().fallbacks == 0
+        pool.close()
+    assert "crossword_pool_generation_seconds_count" in REGISTRY.render()
+
+
+def test_rejects_inverted_watermarks():
+    with pytest.raises(ValueError):
+        PuzzlePool(FALLBACK, VOCABULARY, high_watermark=2, low_watermark=2)
+
+
+def test_service_hands_out_pool_puzzles_and_resolves_them():
+    from app import PUZZLE_FILE
+    from puzzle_service import CrosswordService
+
+    service = CrosswordService(PUZZLE_FILE)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pool = PuzzlePool(
+            service.puzzle, VOCABULARY, high_watermark=2, low_watermark=0,
+            width=12, height=12, max_words=5, executor=executor,
+        )
+        pool.start()
+        wait_for(lambda: pool.stats().depth == 2)
+        service.set_pool(pool)
+
+        session = service.start_session("Dewi")
+        assert session.puzzle is not service.puzzle
+        assert service.find_puzzle(session.puzzle.puzzle_id) is session.puzzle
+        pool.close()
+
+
+class FixedPool:
+    def __init__(self, puzzle):
+        self.puzzle = puzzle
+
+    def take(self):
+        return self.puzzle
+
+
+def test_pool_puzzles_resolve_on_other_workers(tmp_path):
+    from app import PUZZLE_FILE
+    from puzzle_service import CrosswordService
+    from session_store import SQLiteSessionStore
+
+    def worker():
+        service = CrosswordService(PUZZLE_FILE, store=SQLiteSessionStore(
+            tmp_path / "sessions.db", puzzle_resolver=lambda pid: service.find_puzzle(pid)
+        ))
+        return service
+
+    generated, _ = generate_puzzle(7, VOCABULARY, 12, 12, 5)
+    owner, other = worker(), worker()
+    owner.set_pool(FixedPool(generated))
+    session = owner.start_session("Lintas")
+
+    loaded = other.get_session(session.session_id)
+    assert loaded is not None and loaded.puzzle == generated
+    assert loaded.puzzle.puzzle_id == generated.puzzle_id
+    assert other.find_puzzle(generated.puzzle_id) is loaded.puzzle
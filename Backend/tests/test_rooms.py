@@ -0,0 +1,244 @@
+import asyncio
+import json
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from app import PUZZLE_FILE, app
+from board import StaleBoardVersion
+from puzzle_service import CrosswordService
+from rooms import MAX_FLUSH_FAILURES, RoomHub, coalesce_runs
+from session_store import SQLiteSessionStore
+
+
+def first_across_start(puzzle):
+    word = next(w for w in puzzle.words if w.direction == "across")
+    return word.row * puzzle.width + word.col, word.answer
+
+
+def test_coalesce_runs_merges_adjacent_cells():
+    assert coalesce_runs({4: "B", 3: "A", 9: "."}) == [(3, "AB"), (9, ".")]
+    assert coalesce_runs({}) == []
+
+
+def test_room_coalesces_patches_into_one_broadcast():
+    async def scenario():
+        service = CrosswordService(PUZZLE_FILE)
+        session = service.start_session("Co-op")
+        start, answer = first_across_start(session.puzzle)
+        hub = RoomHub(service, tick=0.01)
+        room, alice = await hub.join(session)
+        _, bob = await hub.join(session)
+        for member in (alice, bob):
+            assert json.loads(member.queue.get_nowait())["type"] == "snapshot"
+
+        room.submit([(start, answer[0].lower())])
+        room.submit([(start + 1, answer[1])])
+        await asyncio.sleep(0.05)
+
+        message = alice.queue.get_nowait()
+        assert message is bob.queue.get_nowait()
+        assert json.loads(message) == {"type": "update", "version": 1, "runs": [[start, answer[:2]]]}
+        assert hub.stats().broadcasts == 1
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_gets_snapshot_instead_of_backlog():
+    async def scenario():
+        service = CrosswordService(PUZZLE_FILE)
+        session = service.start_session("Lambat")
+        start, answer = first_across_start(session.puzzle)
+        hub = RoomHub(service, tick=0, queue_size=2)
+        room, member = await hub.join(session)
+        for letter in answer[:3]:
+            room.submit([(start, letter)])
+            await room.flush()
+
+        sent = []
+        pump = asyncio.ensure_future(room.pump(member, lambda m: asyncio.sleep(0, sent.append(m))))
+        await asyncio.sleep(0.01)
+        pump.cancel()
+
+        # Antrean penuh pada patch kedua: backlog diganti snapshot, patch ketiga menyusul
+        assert [json.loads(m)["type"] for m in sent] == ["snapshot", "update"]
+        assert json.loads(sent[0])["runs"] == [[start, answer[2]]]
+        stats = hub.stats()
+        assert stats.resyncs == 1 and stats.messages_dropped == 3
+
+    asyncio.run(scenario())
+
+
+class FlakyService(CrosswordService):
+    """Gagal menulis papan sekali dengan error yang ditentukan."""
+
+    def __init__(self, error):
+        super().__init__(PUZZLE_FILE)
+        self.error = error
+
+    def patch_board(self, session, base_version, runs):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        return super().patch_board(session, base_version, runs)
+
+
+def test_room_reapplies_patch_on_stale_board():
+    async def scenario():
+        service = FlakyService(StaleBoardVersion(1))
+        session = service.start_session("Usang")
+        start, answer = first_across_start(session.puzzle)
+        hub = RoomHub(service, tick=0)
+        room, member = await hub.join(session)
+        member.queue.get_nowait()
+
+        room.submit([(start, answer[0])])
+        await room.flush()
+        assert json.loads(member.queue.get_nowait())["runs"] == [[start, answer[0]]]
+
+    asyncio.run(scenario())
+
+
+def test_room_keeps_pending_patch_after_store_error():
+    async def scenario():
+        service = FlakyService(sqlite3.OperationalError("database is locked"))
+        session = service.start_session("Terkunci")
+        start, answer = first_across_start(session.puzzle)
+        hub = RoomHub(service, tick=0.01)
+        room, member = await hub.join(session)
+        member.queue.get_nowait()
+
+        room.submit([(start, answer[0])])
+        await asyncio.sleep(0.005)
+        room.submit([(start + 1, answer[1])])
+        await asyncio.sleep(0.05)
+
+        # Tick pertama gagal; patch dikembalikan dan disimpan di tick berikutnya bersama patch baru
+        assert service.board_changes(session, None).runs == [(start, answer[:2])]
+        assert json.loads(member.queue.get_nowait())["runs"] == [[start, answer[:2]]]
+
+    asyncio.run(scenario())
+
+
+class FailingService(CrosswordService):
+    def __init__(self):
+        super().__init__(PUZZLE_FILE)
+        self.attempts = 0
+
+    def patch_board(self, session, base_version, runs):
+        self.attempts += 1
+        raise sqlite3.OperationalError("database is locked")
+
+
+def test_room_gives_up_after_repeated_store_errors():
+    async def scenario():
+        service = FailingService()
+        session = service.start_session("Macet")
+        start, answer = first_across_start(session.puzzle)
+        hub = RoomHub(service, tick=0.001)
+        room, member = await hub.join(session)
+        member.queue.get_nowait()
+
+        room.submit([(start, answer[0])])
+        await asyncio.sleep(0.1)
+        assert service.attempts == MAX_FLUSH_FAILURES
+        assert room._flush_task is None and not room._pending
+        assert json.loads(member.queue.get_nowait())["type"] == "error"
+
+    asyncio.run(scenario())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_room_patches_keep_session_alive_and_close_room_when_swept(tmp_path):
+    async def scenario():
+        clock = FakeClock()
+        store = SQLiteSessionStore(
+            tmp_path / "sessions.db", puzzle_resolver=lambda pid: service.find_puzzle(pid), ttl_seconds=10, clock=clock
+        )
+        service = CrosswordService(PUZZLE_FILE, store=store)
+        session = service.start_session("Sapu")
+        start, answer = first_across_start(session.puzzle)
+        hub = RoomHub(service, tick=0)
+        room, member = await hub.join(session)
+        member.queue.get_nowait()
+
+        clock.now = 8
+        room.submit([(start, answer[0])])
+        await room.flush()
+        member.queue.get_nowait()
+        clock.now = 15
+        assert store.sweep() == 0  # patch room memperbarui last_access
+
+        clock.now = 30
+        assert store.sweep() == 1
+        room.submit([(start + 1, answer[1])])
+        await room.flush()
+        sent, closed = [], []
+
+        async def close():
+            closed.append(True)
+
+        await room.pump(member, lambda m: asyncio.sleep(0, sent.append(m)), close)
+        assert [json.loads(m)["type"] for m in sent] == ["error"] and closed
+        assert room.closed and not room._pending and room._flush_task is None
+        assert hub.stats().rooms == 0
+        await hub.leave(room, member)
+        store.close()
+
+    asyncio.run(scenario())
+
+
+class SlowSnapshotService(CrosswordService):
+    async def aboard_changes(self, session, since):
+        await asyncio.sleep(0.01)
+        return self.board_changes(session, since)
+
+
+def test_join_racing_last_leave_ends_in_live_room():
+    async def scenario():
+        service = SlowSnapshotService(PUZZLE_FILE)
+        session = service.start_session("Balapan")
+        hub = RoomHub(service, tick=0)
+        first_room, alice = await hub.join(session)
+        joining = asyncio.ensure_future(hub.join(session))
+        await asyncio.sleep(0)
+        await hub.leave(first_room, alice)  # room dilepas saat bob masih membaca snapshot
+
+        room, bob = await joining
+        assert room is not first_room and bob in room.members
+        carol_room, _ = await hub.join(session)
+        assert carol_room is room
+        assert hub.stats().rooms == 1 and hub.stats().members == 2
+
+    asyncio.run(scenario())
+
+
+def test_websocket_room_broadcasts_to_all_members():
+    with TestClient(app) as client:
+        data = client.post("/start", json={"player_name": "Tim"}).json()
+        session_id, puzzle = data["session_id"], data["puzzle"]
+        word = next(w for w in puzzle["words"] if w["direction"] == "across")
+        start = word["row"] * puzzle["width"] + word["col"]
+
+        with client.websocket_connect(f"/ws/sessions/{session_id}") as first, \
+                client.websocket_connect(f"/ws/sessions/{session_id}") as second:
+            assert first.receive_json()["type"] == "snapshot"
+            assert second.receive_json()["type"] == "snapshot"
+
+            first.send_text(json.dumps({"type": "patch", "runs": [[start, "ab"]]}))
+            expected = {"type": "update", "version": 1, "runs": [[start, "AB"]]}
+            assert first.receive_json() == expected
+            assert second.receive_json() == expected
+
+            second.send_text(json.dumps({"type": "patch", "runs": [[-1, "A"]]}))
+            assert second.receive_json()["type"] == "error"
+
+        board = client.get(f"/sessions/{session_id}/board").json()
+        assert board["runs"] == [[start, "AB"]]
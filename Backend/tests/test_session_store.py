@@ -0,0 +1,199 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from board import BoardState
+from puzzle_service import CrosswordService, GameSession, Puzzle
+from session_store import InMemorySessionStore, SQLiteSessionStore
+
+PUZZLE = Puzzle(width=1, height=1, grid=["A"], words=[])
+PUZZLE_FILE = Path(__file__).resolve().parents[1] / "crossword_words_15x15.json"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_session(session_id: str) -> GameSession:
+    return GameSession(
+        session_id=session_id,
+        player_name="Tester",
+        started_at=datetime.now(timezone.utc),
+        puzzle=PUZZLE,
+    )
+
+
+def test_get_counts_hits_and_misses():
+    store = InMemorySessionStore(max_entries=10, shards=2)
+    store.put(make_session("a"))
+
+    assert store.get("a").session_id == "a"
+    assert store.get("b") is None
+
+    stats = store.stats()
+    assert (stats.size, stats.hits, stats.misses) == (1, 1, 1)
+
+
+def test_lru_eviction_keeps_recently_used():
+    store = InMemorySessionStore(max_entries=2, shards=1)
+    store.put(make_session("a"))
+    store.put(make_session("b"))
+    store.get("a")
+    store.put(make_session("c"))
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert store.stats().evictions == 1
+
+
+def test_idle_ttl_expires_lazily_and_by_sweep():
+    clock = FakeClock()
+    store = InMemorySessionStore(ttl_seconds=10, shards=1, sweep_interval=5, clock=clock)
+    store.put(make_session("a"))
+    store.put(make_session("b"))
+
+    clock.now = 8
+    assert store.get("a") is not None  # akses memperpanjang TTL idle
+
+    clock.now = 15
+    assert store.get("b") is None
+    assert store.get("a") is not None
+
+    clock.now = 30
+    store.put(make_session("c"))  # memicu sapuan berkala
+    stats = store.stats()
+    assert stats.size == 1
+    assert stats.expirations == 2
+
+
+def test_rejects_invalid_capacity():
+    with pytest.raises(ValueError):
+        InMemorySessionStore(max_entries=0)
+
+
+def test_sqlite_store_shares_sessions_between_instances(tmp_path):
+    puzzles = {PUZZLE.puzzle_id: PUZZLE}
+    db = tmp_path / "sessions.db"
+    writer = SQLiteSessionStore(db, puzzle_resolver=puzzles.get, pool_size=1)
+    reader = SQLiteSessionStore(db, puzzle_resolver=puzzles.get, pool_size=1)
+    session = make_session("a")
+    writer.put(session)
+
+    loaded = reader.get("a")
+    assert loaded == session
+    assert loaded.puzzle is PUZZLE
+    assert reader.get("b") is None
+    assert reader.stats().size == 1
+
+    # Sesi tanpa jawaban tetap bisa masuk leaderboard setelah dimuat worker lain
+    writer.put(replace(make_session("c"), answers_revealed=False))
+    assert reader.get("c").answers_revealed is False
+
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_store_expires_idle_sessions(tmp_path):
+    clock = FakeClock()
+    puzzles = {PUZZLE.puzzle_id: PUZZLE}
+    db = tmp_path / "sessions.db"
+    writer = SQLiteSessionStore(db, puzzle_resolver=puzzles.get, ttl_seconds=10, clock=clock)
+    reader = SQLiteSessionStore(db, puzzle_resolver=puzzles.get, ttl_seconds=10, clock=clock)
+    writer.put(make_session("a"))
+    writer.put(make_session("b"))
+
+    clock.now = 20
+    assert reader.get("a") is None
+    assert writer.sweep() == 1
+    assert writer.stats().size == 0
+
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_store_shares_board_updates(tmp_path):
+    puzzles = {PUZZLE.puzzle_id: PUZZLE}
+    db = tmp_path / "sessions.db"
+    writer = SQLiteSessionStore(db, puzzle_resolver=puzzles.get)
+    reader = SQLiteSessionStore(db, puzzle_resolver=puzzles.get)
+    session = GameSession(
+        session_id="a",
+        player_name="Tester",
+        started_at=datetime.now(timezone.utc),
+        puzzle=PUZZLE,
+        board=BoardState(1),
+    )
+    writer.put(session)
+    remote = reader.get("a")
+    assert reader.load_board(remote).version == 0
+
+    board = writer.load_board(session)
+    board.apply([(0, "A")])
+    assert writer.save_board(session, board, previous_version=0)
+    assert not writer.save_board(session, board, previous_version=0)
+
+    synced = reader.load_board(remote)
+    assert (synced.version, bytes(synced.cells)) == (1, b"A")
+
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_cache_hits_keep_session_alive(tmp_path):
+    clock = FakeClock()
+    puzzles = {PUZZLE.puzzle_id: PUZZLE}
+    db = tmp_path / "sessions.db"
+    writer = SQLiteSessionStore(db, puzzle_resolver=puzzles.get, ttl_seconds=10, touch_interval=2, clock=clock)
+    reader = SQLiteSessionStore(db, puzzle_resolver=puzzles.get, ttl_seconds=10, touch_interval=2, clock=clock)
+    writer.put(make_session("a"))
+    assert reader.get("a") is not None
+
+    # Dilayani dari cache reader, tetapi last_access di database tetap diperbarui
+    for now in (1, 5, 9, 13):
+        clock.now = now
+        assert reader.get("a") is not None
+    clock.now = 20
+    assert writer.sweep() == 0
+    assert writer.get("a") is not None
+
+    writer.close()
+    reader.close()
+
+
+def test_service_loads_puzzle_on_first_use(tmp_path):
+    service = CrosswordService(tmp_path / "tidak-ada.json")  # belum membaca file
+    with pytest.raises(FileNotFoundError):
+        service.load()
+
+    service = CrosswordService(PUZZLE_FILE)
+    assert service.load() is service.puzzle is service.load()
+
+
+def test_async_api_offloads_blocking_store(tmp_path):
+    assert not InMemorySessionStore.blocking
+    store = SQLiteSessionStore(tmp_path / "sessions.db", puzzle_resolver=lambda pid: service.find_puzzle(pid))
+    assert store.blocking
+    service = CrosswordService(PUZZLE_FILE, store=store)
+
+    async def scenario():
+        session = await service.astart_session("Asinkron")
+        loaded = await service.aget_session(session.session_id)
+        version = await service.apatch_board(loaded, 0, [(0, "A")])
+        delta = await service.aboard_changes(loaded, 0)
+        assert await service.afind_puzzle(session.puzzle.puzzle_id) is service.puzzle
+        assert await service.afind_puzzle("tidak-ada") is None
+        return session, loaded, version, delta
+
+    session, loaded, version, delta = asyncio.run(scenario())
+    assert loaded.session_id == session.session_id
+    assert version == 1
+    assert delta.version == 1 and not delta.full
+    store.close()
@@ -0,0 +1,53 @@
+import random
+import re
+
+from crossword_geminiai import BacktrackingCrossword
+from word_bank import WordBank
+
+WORDS = ["Cache", "Cloud", "Docker", "Token", "CI/CD", "Git", "API", "Code", "Cookie", "Kernel", "Linux", "Node"]
+
+
+def test_query_matches_regex_scan():
+    bank = WordBank()
+    assert bank.ingest(WORDS + ["cache", "  Docker  ", "x"]) == len(WORDS)
+    assert "CI_CD" in bank and bank.display("CI_CD") == "CI/CD"
+
+    for pattern in ("C?C?E", "C????", "?O??", "????", "??", "Z????"):
+        regex = re.compile(pattern.replace("?", "."))
+        expected = sorted(w for w in (bank.query("?" * len(pattern))) if regex.fullmatch(w))
+        assert sorted(bank.query(pattern)) == expected
+        assert bank.count(pattern) == len(expected)
+    assert bank.query("C?C?E") == ["CACHE"]
+    assert len(bank.query("?????", limit=2, start=3)) == 2
+
+
+def test_ingest_file_and_reload(tmp_path):
+    source = tmp_path / "istilah.csv"
+    source.write_text("word,clue\nServerless,x\nFirewall,y\nLoad Balancer,z\n", encoding="utf8")
+    bank = WordBank()
+    assert bank.ingest_file(source) == 3
+
+    path = tmp_path / "bank.xwb"
+    bank.save(path)
+    loaded = WordBank.load(path)
+    assert len(loaded) == 3
+    assert loaded.display("LOAD_BALANCER") == "Load Balancer"
+    assert loaded.query("F???W???") == ["FIREWALL"]
+    loaded.add("Frontend")
+    assert loaded.query("F???????", limit=5) == ["FIREWALL", "FRONTEND"]
+
+
+def test_fill_from_bank_places_words_on_crossings():
+    rng = random.Random(5)
+    letters = "ABCDEKLMNORST"
+    bank = WordBank()
+    bank.ingest("".join(rng.choice(letters) for _ in range(rng.randint(3, 8))) for _ in range(3000))
+
+    cw = BacktrackingCrossword(11, 11, seed=1)
+    cw.build(["DOCKER"])
+    added = cw.fill_from_bank(bank, max_words=8)
+    assert len(cw.words) == 8 and len(added) == 7
+    assert all(word in bank for word in added)
+    for itm in cw.words:
+        dr, dc = (1, 0) if itm["dir"] == "down" else (0, 1)
+        assert all(cw.grid[itm["row"] + dr * i][itm["col"] + dc * i] == ch for i, ch in enumerate(itm["word"]))
@@ -0,0 +1,257 @@
+"""Bank kata dengan indeks pola untuk generator berskala kosakata besar.
+
+Kata dikelompokkan per panjang. Setiap kelompok menyimpan bitset (int Python)
+per pasangan (posisi, huruf); pola seperti ``C?C?E`` dijawab dengan
+meng-AND bitset posisi yang diketahui, tanpa memindai seluruh kosakata.
+
+Format file (little-endian)::
+
+    header   : magic "XWBANK01" | u32 jumlah kelompok
+    kelompok : u16 panjang | u32 jumlah kata
+               | u32 len + kata grid dipisah "\\n" | u32 len + kata tampilan dipisah "\\n"
+               | u32 jumlah bitset, lalu per bitset -> u16 posisi | u8 huruf | u32 len | byte bitset
+
+    python word_bank.py build bank.xwb kata.txt istilah.csv
+    python word_bank.py query bank.xwb "C?C?E"
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from crossword_geminiai import grid_word_from_display, normalize_display_word
+
+MAGIC = b"XWBANK01"
+# Karakter wildcard pada pola; tidak pernah muncul di kata grid
+WILDCARDS = frozenset("?.")
+_HEADER = struct.Struct("<8sI")
+_BUCKET_HEAD = struct.Struct("<HI")
+_BLOB_LEN = struct.Struct("<I")
+_BITS_HEAD = struct.Struct("<HBI")
+# Judul kolom CSV yang dilewati saat ingest
+_CSV_HEADERS = frozenset({"word", "kata", "answer", "istilah"})
+
+
+class _Bucket:
+    """Semua kata dengan panjang yang sama; bitset dibangun ulang saat dibutuhkan."""
+
+    __slots__ = ("words", "displays", "bits", "all_bits")
+
+    def __init__(self) -> None:
+        self.words: List[str] = []
+        self.displays: List[str] = []
+        self.bits: Optional[Dict[Tuple[int, str], int]] = None
+        self.all_bits = 0
+
+    def index(self) -> Dict[Tuple[int, str], int]:
+        if self.bits is None:
+            # Bitmap per kunci diisi sebagai bytearray lalu diubah ke int sekali;
+            # OR langsung ke int besar per kata akan menyalin int itu setiap kali
+            size = (len(self.words) + 7) // 8
+            maps: Dict[Tuple[int, str], bytearray] = {}
+            for i, word in enumerate(self.words):
+                byte, mask = i >> 3, 1 << (i & 7)
+                for pos, ch in enumerate(word):
+                    bitmap = maps.get((pos, ch))
+                    if bitmap is None:
+                        bitmap = maps[(pos, ch)] = bytearray(size)
+                    bitmap[byte] |= mask
+            self.bits = {key: int.from_bytes(bitmap, "little") for key, bitmap in maps.items()}
+            self.all_bits = (1 << len(self.words)) - 1
+        return self.bits
+
+
+class WordBank:
+    """Kosakata ternormalisasi dengan kueri pola per panjang kata."""
+
+    def __init__(self, min_length: int = 2, max_length: int = 64):
+        self.min_length = min_length
+        self.max_length = max_length
+        self._buckets: Dict[int, _Bucket] = {}
+        # kata grid -> (panjang, indeks di kelompok)
+        self._ids: Dict[str, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, grid_word: str) -> bool:
+        return grid_word in self._ids
+
+    def lengths(self) -> List[int]:
+        return sorted(self._buckets)
+
+    def add(self, raw: str) -> bool:
+        """Normalisasi lalu tambahkan satu entri; False jika kosong, duplikat, atau di luar batas panjang."""
+        display = normalize_display_word(raw)
+        word = grid_word_from_display(display)
+        if not self.min_length <= len(word) <= self.max_length or word in self._ids:
+            return False
+        bucket = self._buckets.get(len(word))
+        if bucket is None:
+            bucket = self._buckets[len(word)] = _Bucket()
+        self._ids[word] = (len(word), len(bucket.words))
+        bucket.words.append(word)
+        bucket.displays.append(display)
+        bucket.bits = None
+        return True
+
+    def ingest(self, entries: Iterable[str]) -> int:
+        return sum(1 for entry in entries if self.add(entry))
+
+    def ingest_file(self, path: Path, column: int = 0) -> int:
+        """Baca file baris-per-baris (TXT) atau CSV (kolom ``column``) tanpa memuat semuanya."""
+        return self.ingest(_stream_entries(Path(path), column))
+
+    def display(self, grid_word: str) -> str:
+        length, index = self._ids[grid_word]
+        return self._buckets[length].displays[index]
+
+    def bits(self, pattern: str) -> int:
+        """Bitset kata (indeks lokal kelompok panjang pola) yang cocok dengan pola."""
+        bucket = self._buckets.get(len(pattern))
+        if bucket is None:
+            return 0
+        index = bucket.index()
+        result = bucket.all_bits
+        for pos, ch in enumerate(pattern.upper()):
+            if ch in WILDCARDS:
+                continue
+            result &= index.get((pos, ch), 0)
+            if not result:
+                break
+        return result
+
+    def count(self, pattern: str) -> int:
+        return self.bits(pattern).bit_count()
+
+    def query(self, pattern: str, limit: Optional[int] = None, start: int = 0) -> List[str]:
+        """Kata grid yang cocok dengan pola (``?`` atau ``.`` = huruf apa saja).
+
+        ``start`` memutar titik awal pencarian (modulo jumlah kata) agar
+        pemanggil bisa mengambil sampel acak tanpa mengurutkan semua hasil.
+        """
+        return list(self._iter_matches(pattern, limit, start))
+
+    def _iter_matches(self, pattern: str, limit: Optional[int], start: int) -> Iterator[str]:
+        bits = self.bits(pattern)
+        if not bits or limit == 0:
+            return
+        words = self._buckets[len(pattern)].words
+        start %= len(words)
+        found = 0
+        # Bagian mulai dari ``start`` dulu, lalu sisanya dari awal. Bit dibaca
+        # lewat string biner sekali jalan; mengupas bit terendah dari int besar
+        # menyalin seluruh int untuk setiap hasil.
+        for part, offset in ((bits >> start, start), (bits & ((1 << start) - 1), 0)):
+            if not part:
+                continue
+            digits = format(part, "b")[::-1]
+            pos = digits.find("1")
+            while pos != -1:
+                yield words[offset + pos]
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+                pos = digits.find("1", pos + 1)
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as out:
+            out.write(_HEADER.pack(MAGIC, len(self._buckets)))
+            for length in sorted(self._buckets):
+                bucket = self._buckets[length]
+                index = bucket.index()
+                out.write(_BUCKET_HEAD.pack(length, len(bucket.words)))
+                for blob in ("\n".join(bucket.words).encode("utf8"), "\n".join(bucket.displays).encode("utf8")):
+                    out.write(_BLOB_LEN.pack(len(blob)))
+                    out.write(blob)
+                out.write(_BLOB_LEN.pack(len(index)))
+                size = (len(bucket.words) + 7) // 8
+                for (pos, ch), bits in index.items():
+                    out.write(_BITS_HEAD.pack(pos, ord(ch), size))
+                    out.write(bits.to_bytes(size, "little"))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "WordBank":
+        """Muat bank beserta bitset-nya; tidak ada normalisasi atau indeks ulang."""
+        data = Path(path).read_bytes()
+        magic, bucket_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Bukan file bank kata: {path}")
+        bank = cls()
+        pos = _HEADER.size
+        for _ in range(bucket_count):
+            length, count = _BUCKET_HEAD.unpack_from(data, pos)
+            pos += _BUCKET_HEAD.size
+            blobs = []
+            for _ in range(2):
+                (size,) = _BLOB_LEN.unpack_from(data, pos)
+                pos += _BLOB_LEN.size
+                blobs.append(data[pos:pos + size].decode("utf8").split("\n") if count else [])
+                pos += size
+            (key_count,) = _BLOB_LEN.unpack_from(data, pos)
+            pos += _BLOB_LEN.size
+            bits = {}
+            for _ in range(key_count):
+                letter_pos, letter, size = _BITS_HEAD.unpack_from(data, pos)
+                pos += _BITS_HEAD.size
+                bits[(letter_pos, chr(letter))] = int.from_bytes(data[pos:pos + size], "little")
+                pos += size
+            bucket = _Bucket()
+            bucket.words, bucket.displays = blobs
+            bucket.bits = bits
+            bucket.all_bits = (1 << count) - 1
+            bank._buckets[length] = bucket
+            for i, word in enumerate(bucket.words):
+                bank._ids[word] = (length, i)
+        return bank
+
+
+def _stream_entries(path: Path, column: int) -> Iterator[str]:
+    with path.open("r", encoding="utf8", newline="") as fh:
+        if path.suffix.lower() == ".csv":
+            for line_no, row in enumerate(csv.reader(fh)):
+                if len(row) <= column:
+                    continue
+                if line_no == 0 and row[column].strip().lower() in _CSV_HEADERS:
+                    continue
+                yield row[column]
+        else:
+            for line in fh:
+                yield line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Alat bank kata berindeks pola")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Ingest file TXT/CSV menjadi bank kata")
+    build.add_argument("output", type=Path)
+    build.add_argument("inputs", type=Path, nargs="+")
+    build.add_argument("--column", type=int, default=0, help="kolom kata pada CSV")
+    query = sub.add_parser("query", help="Cari kata yang cocok dengan pola, mis. C?C?E")
+    query.add_argument("bank", type=Path)
+    query.add_argument("pattern")
+    query.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        bank = WordBank()
+        for source in args.inputs:
+            added = bank.ingest_file(source, args.column)
+            print(f"{source}: {added} kata baru")
+        bank.save(args.output)
+        print(f"{len(bank)} kata ditulis ke {args.output}")
+    else:
+        bank = WordBank.load(args.bank)
+        print(f"{bank.count(args.pattern)} kata cocok dengan {args.pattern}")
+        for word in bank.query(args.pattern, args.limit):
+            print(f"  {word} ({bank.display(word)})")
+
+
+if __name__ == "__main__":
+    main()